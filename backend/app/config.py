@@ -1,5 +1,6 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Literal, Mapping, Optional
 
 
 class Settings(BaseSettings):
@@ -31,6 +32,14 @@ class Settings(BaseSettings):
     # Notified for one-month / six-month follow-up pings
     FOLLOWUP_NOTIFICATION_EMAIL: str = "hi@indivisiblepaloaltoplus.org"
 
+    # Audit trail: "all" records every event; "writes_only" skips the
+    # high-volume read events (PII detail views and searches)
+    AUDIT_LEVEL: Literal["all", "writes_only"] = "all"
+
+    # Relationship lazy loads (one query per object, i.e. N+1 on lists):
+    # "raise" makes them errors, "log" lets them run with a warning
+    LAZY_LOADS: Literal["raise", "log"] = "log"
+
     # Vault file path
     VAULT_FILE: str = "/app/data/.vault"
 
@@ -39,10 +48,17 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings instance; .env is parsed once, on first call.
+    Usable as a FastAPI dependency."""
+    return Settings()
+
+
+settings = get_settings()
 
 
-def load_secrets_from_vault(secrets: dict):
+def load_secrets_from_vault(secrets: Mapping[str, str]):
     """Populate settings with secrets decrypted from the vault."""
     for key, value in secrets.items():
         if hasattr(settings, key) and value is not None:
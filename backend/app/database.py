@@ -1,29 +1,91 @@
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import declarative_base, sessionmaker
+import logging
+
+from sqlalchemy import Select, create_engine, event
+from sqlalchemy.orm import Session, declarative_base, raiseload, sessionmaker
 from app.config import settings
 
-# Create SQLite engine with WAL mode for better concurrency
+logger = logging.getLogger(__name__)
+
+# Create SQLite engine with WAL mode for better concurrency.
+# The pool holds up to POOL_SIZE + MAX_OVERFLOW connections, and the app
+# sizes the sync-handler threadpool to match (see main.lifespan), so a
+# handler thread never queues on a connection checkout under bursts.
+POOL_SIZE = 20
+MAX_OVERFLOW = 40
+
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_recycle=3600,
+    pool_pre_ping=True,
 )
 
 
-# Enable WAL mode for SQLite
+# Per-connection SQLite tuning, sent in one round trip:
+# - WAL journal; synchronous=NORMAL is durable-on-checkpoint and safe with WAL
+# - 64 MiB page cache, 256 MiB mmap, in-memory temp tables
+# - wait up to 5s on a locked database instead of failing immediately
+# foreign_keys is deliberately left off: existing rows may reference
+# deleted users, and enforcing it would turn those deletes into errors.
+SQLITE_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+PRAGMA mmap_size=268435456;
+PRAGMA busy_timeout=5000;
+"""
+
+
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
     cursor = dbapi_conn.cursor()
-    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.executescript(SQLITE_PRAGMAS)
     cursor.close()
 
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects stay loaded after commit: write endpoints return the instance they
+# just changed without a refresh SELECT. Sessions are per-request, so there
+# is no long-lived identity map to go stale.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
 
+# Guard against N+1 lazy loads. With LAZY_LOADS="raise" every ORM SELECT
+# defaults to raiseload("*"), so touching an unloaded relationship is an
+# error; endpoints that need one load it eagerly (selectinload overrides
+# the wildcard). With "log" (the default, for production) the lazy load
+# runs and is logged. No model declares a relationship yet.
+@event.listens_for(Session, "do_orm_execute")
+def guard_lazy_loads(orm_execute_state):
+    if not orm_execute_state.is_select:
+        return
+    if orm_execute_state.lazy_loaded_from is not None:
+        logger.warning(
+            "Lazy load on %s: load it eagerly to avoid a query per row",
+            orm_execute_state.lazy_loaded_from.class_.__name__,
+        )
+    elif (
+        settings.LAZY_LOADS == "raise"
+        # lambda statements are left alone: appending to them would
+        # change their cache key tracking
+        and isinstance(orm_execute_state.statement, Select)
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+
 def get_db():
-    """Dependency for getting database session."""
+    """Dependency for getting database session.
+
+    A plain per-request Session (not scoped_session): FastAPI may run the
+    setup and teardown of a sync dependency on different threadpool
+    threads, so thread-local scoping would close the wrong session.
+    close() returns the connection to the pool deterministically."""
     db = SessionLocal()
     try:
         yield db
@@ -1,25 +1,44 @@
+import hashlib
+import time
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import exists, select
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.models.member import Member
 from app.services.auth import verify_token
+from app.services.ttl_cache import TTLCache
 
 security = HTTPBearer()
 
-# Roles that have admin-level access (can see all members, access admin dashboard)
-ADMIN_ROLES = {UserRole.SUPER_ADMIN, UserRole.GROUP_ADMIN}
+# Verified-token cache: maps a digest of the bearer token to the user id
+# it authenticates, so repeat requests skip JWT signature verification.
+# The user row is still loaded on every request, so deactivation and
+# role changes take effect immediately. Raw tokens are never stored.
+TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache = TTLCache(maxsize=10_000, ttl_seconds=TOKEN_CACHE_TTL_SECONDS)
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Dependency to get the current authenticated user from JWT token."""
-    token = credentials.credentials
-    payload = verify_token(token)
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()[:16]
+
 
+def invalidate_token(token: str) -> None:
+    """Forget a cached token verification (e.g. on logout)."""
+    _token_cache.pop(_token_key(token))
+
+
+def _authenticate_token(token: str) -> int:
+    """Return the user id a token authenticates, verifying the JWT only
+    on a cache miss. Raises 401 for invalid tokens."""
+    key = _token_key(token)
+    user_id = _token_cache.get(key)
+    if user_id is not None:
+        return user_id
+
+    payload = verify_token(token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -36,7 +55,29 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    # Never serve a token from cache past its own expiry
+    exp = payload.get("exp")
+    ttl = exp - time.time() if isinstance(exp, (int, float)) else TOKEN_CACHE_TTL_SECONDS
+    _token_cache.set(key, user_id, ttl_seconds=ttl)
+    return user_id
+
+
+# Roles that have admin-level access (can see all members, access admin dashboard)
+ADMIN_ROLES = frozenset({UserRole.SUPER_ADMIN, UserRole.GROUP_ADMIN})
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """Dependency to get the current authenticated user from JWT token.
+
+    Deliberately sync: it runs a blocking query on the sync session, so
+    FastAPI must run it in the threadpool like the route handlers rather
+    than on the event loop."""
+    user_id = _authenticate_token(credentials.credentials)
+
+    user = db.get(User, user_id)
     if user is None or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -59,7 +100,9 @@ async def require_admin(current_user: User = Depends(get_current_user)) -> User:
 
 async def require_super_admin(current_user: User = Depends(get_current_user)) -> User:
     """Dependency to require SUPER_ADMIN role specifically."""
-    if current_user.role != UserRole.SUPER_ADMIN:
+    # Roles load from the Enum column as UserRole members (singletons), so
+    # identity checks avoid str-enum equality on every request.
+    if current_user.role is not UserRole.SUPER_ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Super admin access required"
@@ -76,7 +119,26 @@ def check_member_access(member: Member, user: User) -> bool:
     if user.role in ADMIN_ROLES:
         return True
 
-    if user.role == UserRole.VETTER:
+    if user.role is UserRole.VETTER:
         return member.assigned_vetter_id == user.id
 
     return False
+
+
+def get_accessible_member(db: Session, member_id: int, user: User, denied_detail: str) -> Member:
+    """
+    Load a member the user may view/edit, or raise 404/403.
+    Vetter isolation is part of the WHERE clause, so another vetter's
+    member is never loaded; only on a miss does an id-only EXISTS query
+    decide between "not found" and "forbidden".
+    """
+    stmt = select(Member).where(Member.id == member_id)
+    if user.role not in ADMIN_ROLES:
+        stmt = stmt.where(Member.assigned_vetter_id == user.id)
+    member = db.execute(stmt).scalar_one_or_none()
+    if member is not None:
+        return member
+
+    if db.scalar(select(exists().where(Member.id == member_id))):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=denied_detail)
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
@@ -1,141 +1,193 @@
 import asyncio
 import logging
+import threading
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 
 from app.config import settings
-from app.database import engine, Base, SessionLocal
-from app.utils.db_init import create_first_admin
+from app.database import MAX_OVERFLOW, POOL_SIZE, engine, Base, SessionLocal
+from app.models.audit_log import AUDIT_CASCADE_TRIGGER
+from app.utils.db_init import backfill_search_text, backfill_search_tokens, create_first_admin
 from app.services.encryption import encryption_service
 from app.routers import auth, public, users, members, tags
 from app.routers import unlock as unlock_router
 from app.vault import vault_manager
 
 
+# Vault mode is active when a .vault file exists and SECRET_KEY was not
+# already provided via environment / .env. Neither changes while the
+# process runs (unlocking fills SECRET_KEY in, but the app stays in vault
+# mode), so evaluate once instead of stat-ing the vault file per request.
+_VAULT_MODE = vault_manager.vault_exists() and not settings.SECRET_KEY
+
+
 def vault_mode_enabled() -> bool:
-    """Vault mode is active when a .vault file exists and SECRET_KEY
-    was not already provided via environment / .env."""
-    return vault_manager.vault_exists() and not settings.SECRET_KEY
+    """Whether the app started in vault mode (see _VAULT_MODE)."""
+    return _VAULT_MODE
+
+
+def app_locked() -> bool:
+    """True while vault mode is active and the vault is still locked."""
+    return _VAULT_MODE and not vault_manager.is_unlocked
+
+
+# Set once initialize_app() has completed, at startup (direct mode) or
+# after vault unlock. Backs /api/health/ready.
+app_ready = threading.Event()
+# Serializes initialize_app() so racing unlocks initialize only once
+_init_lock = threading.Lock()
+
+# Background task running initialize_app() at startup in direct mode, so
+# the server starts accepting connections before migrations finish.
+_startup_task = None
+# Set if that background initialization raised; the app stays unready
+# and /api/health reports the failure so the container is marked unhealthy
+_startup_failed = False
+
+
+def app_starting() -> bool:
+    """True while a deferred startup initialization is still pending."""
+    return _startup_task is not None and not _startup_failed and not app_ready.is_set()
+
 
+def app_failed() -> bool:
+    """True if the deferred startup initialization raised."""
+    return _startup_failed
 
-def run_migrations(db_engine):
+
+def run_migrations(conn):
     """Add new columns to existing tables if they don't exist.
-    SQLAlchemy's create_all only creates new tables, not new columns."""
+    SQLAlchemy's create_all only creates new tables, not new columns.
+    Runs on the caller's connection, inside its transaction, so all
+    steps commit together."""
     from sqlalchemy import inspect, text
-    inspector = inspect(db_engine)
+    inspector = inspect(conn)
 
     if "members" in inspector.get_table_names():
         existing_cols = {col["name"] for col in inspector.get_columns("members")}
 
-        with db_engine.connect() as conn:
-            if "processing_completed" not in existing_cols:
-                conn.execute(text(
-                    "ALTER TABLE members ADD COLUMN processing_completed BOOLEAN NOT NULL DEFAULT 0"
-                ))
-                conn.commit()
-                print("Migration: added 'processing_completed' column to members table")
-
-            if "tags" not in existing_cols:
-                conn.execute(text(
-                    "ALTER TABLE members ADD COLUMN tags TEXT"
-                ))
-                conn.commit()
-                print("Migration: added 'tags' column to members table")
-
-            # --- Status enum cleanup migration ---
-            # Step 1: Add archived column if not exists
-            if "archived" not in existing_cols:
-                conn.execute(text(
-                    "ALTER TABLE members ADD COLUMN archived BOOLEAN NOT NULL DEFAULT 0"
-                ))
-                conn.commit()
-                print("Migration: added 'archived' column to members table")
-
-            # Step 2: Set archived=True for members with status=ARCHIVED
-            result = conn.execute(text(
-                "UPDATE members SET archived = 1 WHERE status = 'ARCHIVED' AND archived = 0"
+        if "processing_completed" not in existing_cols:
+            conn.execute(text(
+                "ALTER TABLE members ADD COLUMN processing_completed BOOLEAN NOT NULL DEFAULT 0"
             ))
-            conn.commit()
-            if result.rowcount > 0:
-                print(f"Migration: marked {result.rowcount} ARCHIVED members as archived=True")
+            print("Migration: added 'processing_completed' column to members table")
 
-            # Step 3: Update status ARCHIVED → IN_SIGNAL (formerly PROCESSED)
-            result = conn.execute(text(
-                "UPDATE members SET status = 'IN_SIGNAL' WHERE status = 'ARCHIVED'"
+        if "tags" not in existing_cols:
+            conn.execute(text(
+                "ALTER TABLE members ADD COLUMN tags TEXT"
             ))
-            conn.commit()
-            if result.rowcount > 0:
-                print(f"Migration: changed {result.rowcount} ARCHIVED → IN_SIGNAL")
-
-            # Step 4: Update status to IN_SIGNAL for processing_completed=True members
-            if "processing_completed" in existing_cols:
-                result = conn.execute(text(
-                    "UPDATE members SET status = 'IN_SIGNAL' WHERE processing_completed = 1 AND status NOT IN ('IN_SIGNAL', 'PROCESSED')"
-                ))
-                conn.commit()
-                if result.rowcount > 0:
-                    print(f"Migration: changed {result.rowcount} processing_completed → IN_SIGNAL")
-
-            # --- Status rename migration (June 2026) ---
-            # PROCESSED renamed to IN_SIGNAL; UNSURE removed (folded into NEEDS_FOLLOW_UP)
+            print("Migration: added 'tags' column to members table")
+
+        # --- Status enum cleanup migration ---
+        # Step 1: Add archived column if not exists
+        if "archived" not in existing_cols:
+            conn.execute(text(
+                "ALTER TABLE members ADD COLUMN archived BOOLEAN NOT NULL DEFAULT 0"
+            ))
+            print("Migration: added 'archived' column to members table")
+
+        # Step 2: Set archived=True for members with status=ARCHIVED
+        result = conn.execute(text(
+            "UPDATE members SET archived = 1 WHERE status = 'ARCHIVED' AND archived = 0"
+        ))
+        if result.rowcount > 0:
+            print(f"Migration: marked {result.rowcount} ARCHIVED members as archived=True")
+
+        # Step 3: Update status ARCHIVED → IN_SIGNAL (formerly PROCESSED)
+        result = conn.execute(text(
+            "UPDATE members SET status = 'IN_SIGNAL' WHERE status = 'ARCHIVED'"
+        ))
+        if result.rowcount > 0:
+            print(f"Migration: changed {result.rowcount} ARCHIVED → IN_SIGNAL")
+
+        # Step 4: Update status to IN_SIGNAL for processing_completed=True members
+        if "processing_completed" in existing_cols:
             result = conn.execute(text(
-                "UPDATE members SET status = 'IN_SIGNAL' WHERE status = 'PROCESSED'"
+                "UPDATE members SET status = 'IN_SIGNAL' WHERE processing_completed = 1 AND status NOT IN ('IN_SIGNAL', 'PROCESSED')"
             ))
-            conn.commit()
             if result.rowcount > 0:
-                print(f"Migration: changed {result.rowcount} PROCESSED → IN_SIGNAL")
+                print(f"Migration: changed {result.rowcount} processing_completed → IN_SIGNAL")
+
+        # --- Status rename migration (June 2026) ---
+        # PROCESSED renamed to IN_SIGNAL; UNSURE removed (folded into NEEDS_FOLLOW_UP)
+        result = conn.execute(text(
+            "UPDATE members SET status = 'IN_SIGNAL' WHERE status = 'PROCESSED'"
+        ))
+        if result.rowcount > 0:
+            print(f"Migration: changed {result.rowcount} PROCESSED → IN_SIGNAL")
+
+        result = conn.execute(text(
+            "UPDATE members SET status = 'NEEDS_FOLLOW_UP' WHERE status = 'UNSURE'"
+        ))
+        if result.rowcount > 0:
+            print(f"Migration: changed {result.rowcount} UNSURE → NEEDS_FOLLOW_UP")
+
+        # --- Follow-up scheduling columns ---
+        if "vetted_at" not in existing_cols:
+            conn.execute(text("ALTER TABLE members ADD COLUMN vetted_at DATETIME"))
+            print("Migration: added 'vetted_at' column to members table")
+            # Backfill: existing VETTED members anchor their one-month
+            # timer to their last update (best available estimate)
+            conn.execute(text(
+                "UPDATE members SET vetted_at = updated_at WHERE status = 'VETTED' AND vetted_at IS NULL"
+            ))
+
+        if "resting_since" not in existing_cols:
+            conn.execute(text("ALTER TABLE members ADD COLUMN resting_since DATETIME"))
+            print("Migration: added 'resting_since' column to members table")
+            # Backfill: existing IN_SIGNAL members anchor their six-month
+            # timer to their last update
+            conn.execute(text(
+                "UPDATE members SET resting_since = updated_at WHERE status = 'IN_SIGNAL' AND resting_since IS NULL"
+            ))
 
+        if "one_month_followup_sent" not in existing_cols:
+            conn.execute(text(
+                "ALTER TABLE members ADD COLUMN one_month_followup_sent BOOLEAN NOT NULL DEFAULT 0"
+            ))
+            print("Migration: added 'one_month_followup_sent' column to members table")
+            # Don't retroactively ping the historical backlog: members
+            # vetted more than 30 days before this migration are exempted
+            # from the one-month follow-up. New vettings get the full flow.
             result = conn.execute(text(
-                "UPDATE members SET status = 'NEEDS_FOLLOW_UP' WHERE status = 'UNSURE'"
+                "UPDATE members SET one_month_followup_sent = 1 "
+                "WHERE status = 'VETTED' AND updated_at <= datetime('now', '-30 days')"
             ))
-            conn.commit()
             if result.rowcount > 0:
-                print(f"Migration: changed {result.rowcount} UNSURE → NEEDS_FOLLOW_UP")
-
-            # --- Follow-up scheduling columns ---
-            if "vetted_at" not in existing_cols:
-                conn.execute(text("ALTER TABLE members ADD COLUMN vetted_at DATETIME"))
-                conn.commit()
-                print("Migration: added 'vetted_at' column to members table")
-                # Backfill: existing VETTED members anchor their one-month
-                # timer to their last update (best available estimate)
-                conn.execute(text(
-                    "UPDATE members SET vetted_at = updated_at WHERE status = 'VETTED' AND vetted_at IS NULL"
-                ))
-                conn.commit()
-
-            if "resting_since" not in existing_cols:
-                conn.execute(text("ALTER TABLE members ADD COLUMN resting_since DATETIME"))
-                conn.commit()
-                print("Migration: added 'resting_since' column to members table")
-                # Backfill: existing IN_SIGNAL members anchor their six-month
-                # timer to their last update
-                conn.execute(text(
-                    "UPDATE members SET resting_since = updated_at WHERE status = 'IN_SIGNAL' AND resting_since IS NULL"
-                ))
-                conn.commit()
-
-            if "one_month_followup_sent" not in existing_cols:
-                conn.execute(text(
-                    "ALTER TABLE members ADD COLUMN one_month_followup_sent BOOLEAN NOT NULL DEFAULT 0"
-                ))
-                conn.commit()
-                print("Migration: added 'one_month_followup_sent' column to members table")
-                # Don't retroactively ping the historical backlog: members
-                # vetted more than 30 days before this migration are exempted
-                # from the one-month follow-up. New vettings get the full flow.
-                result = conn.execute(text(
-                    "UPDATE members SET one_month_followup_sent = 1 "
-                    "WHERE status = 'VETTED' AND updated_at <= datetime('now', '-30 days')"
-                ))
-                conn.commit()
-                if result.rowcount > 0:
-                    print(f"Migration: exempted {result.rowcount} previously-vetted members from one-month follow-up")
+                print(f"Migration: exempted {result.rowcount} previously-vetted members from one-month follow-up")
+
+        # --- Encrypted consolidated search text (backfilled at startup) ---
+        if "search_text" not in existing_cols:
+            conn.execute(text("ALTER TABLE members ADD COLUMN search_text TEXT"))
+            print("Migration: added 'search_text' column to members table")
+
+        # --- Composite indexes (create_all only indexes new tables) ---
+        for index_name, columns in (
+            ("ix_member_vetter_status_created", "assigned_vetter_id, status, created_at"),
+            ("ix_member_status_created", "status, created_at"),
+            ("ix_member_status_updated", "status, updated_at"),
+            ("ix_member_created", "created_at"),
+        ):
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {index_name} ON members ({columns})"
+            ))
+        # Superseded by ix_member_vetter_status_created (same leading columns)
+        conn.execute(text("DROP INDEX IF EXISTS ix_member_vetter_status"))
+
+    # --- Case-insensitive username lookups (login, duplicate check) ---
+    if "users" in inspector.get_table_names():
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_users_username_lower ON users (lower(username))"
+        ))
+
+    # --- Audit history follows its member on delete (create_all only adds
+    # the trigger alongside a newly created audit_logs table) ---
+    if {"members", "audit_logs"} <= set(inspector.get_table_names()):
+        conn.execute(text(AUDIT_CASCADE_TRIGGER))
 
 
 def validate_secrets():
@@ -155,16 +207,33 @@ def validate_secrets():
 
 def initialize_app():
     """Create tables, seed first admin, and initialize encryption.
-    Called at startup (direct mode) or after vault unlock."""
-    validate_secrets()
-    encryption_service.initialize(settings.ENCRYPTION_KEY)
-    Base.metadata.create_all(bind=engine)
-    run_migrations(engine)
-    db = SessionLocal()
+    Called at startup (direct mode) or after vault unlock. Runs once:
+    later or concurrent calls return after the first completes."""
+    with _init_lock:
+        if app_ready.is_set():
+            return
+        validate_secrets()
+        encryption_service.initialize(settings.ENCRYPTION_KEY)
+        with engine.begin() as conn:
+            Base.metadata.create_all(bind=conn)
+            run_migrations(conn)
+        with SessionLocal() as db:
+            create_first_admin(db)
+            backfill_search_text(db)
+            backfill_search_tokens(db)
+        app_ready.set()
+
+
+async def deferred_initialize():
+    """Run initialize_app() off the event loop. Failures are logged and
+    recorded: the app stays unready and /api/health returns 503 "failed",
+    so the healthcheck marks the container unhealthy."""
+    global _startup_failed
     try:
-        create_first_admin(db)
-    finally:
-        db.close()
+        await asyncio.to_thread(initialize_app)
+    except Exception:
+        _startup_failed = True
+        logging.getLogger(__name__).exception("Startup initialization failed")
 
 
 FOLLOWUP_CHECK_INTERVAL_SECONDS = 3600  # hourly
@@ -172,45 +241,77 @@ FOLLOWUP_CHECK_INTERVAL_SECONDS = 3600  # hourly
 
 async def followup_scheduler():
     """Periodically run follow-up checks (one-month and six-month pings).
-    Skips runs while the vault is locked (PII cannot be decrypted)."""
+    Skips runs until the app is initialized, i.e. while startup is still
+    running or the vault is locked (PII cannot be decrypted)."""
     from app.services.followups import run_followup_checks
     logger = logging.getLogger(__name__)
     while True:
         try:
-            if not (vault_mode_enabled() and not vault_manager.is_unlocked):
+            if app_ready.is_set():
                 await asyncio.to_thread(run_followup_checks)
         except Exception:
             logger.exception("Follow-up check failed")
         await asyncio.sleep(FOLLOWUP_CHECK_INTERVAL_SECONDS)
 
 
+# Threads available to sync route handlers and dependencies (anyio's
+# default is 40). Matches the connection pool's capacity: more threads
+# would only wait on pool checkout, fewer would leave bursts of admin
+# traffic queued behind slow handlers (bcrypt, exports) with idle
+# connections to spare.
+THREADPOOL_SIZE = POOL_SIZE + MAX_OVERFLOW
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
+    global _startup_task
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
     if not vault_mode_enabled():
-        # Direct mode: secrets already in env, start normally
-        initialize_app()
+        # Direct mode: secrets already in env. Missing secrets still abort
+        # startup immediately; the slower table/migration/seed work runs in
+        # the background while requests get 503 until it completes.
+        validate_secrets()
+        _startup_task = asyncio.create_task(deferred_initialize())
     scheduler_task = asyncio.create_task(followup_scheduler())
     yield
     # Shutdown: cleanup
     scheduler_task.cancel()
+    if _startup_task is not None:
+        _startup_task.cancel()
 
 
-class LockMiddleware(BaseHTTPMiddleware):
-    """When vault mode is active and the vault is still locked,
-    block all routes except /api/unlock and /api/health."""
+class LockMiddleware:
+    """When vault mode is active and the vault is still locked, or startup
+    initialization is still running or has failed, block all routes except /api/unlock
+    and the health checks.
 
-    async def dispatch(self, request: Request, call_next):
-        if not vault_mode_enabled() or vault_manager.is_unlocked:
-            return await call_next(request)
+    Plain ASGI rather than BaseHTTPMiddleware, so the unlocked fast path
+    is a single function call with no per-request task group or streams."""
 
-        if request.url.path in ("/api/unlock", "/api/health"):
-            return await call_next(request)
+    ALLOWED_PATHS = ("/api/unlock", "/api/health", "/api/health/live", "/api/health/ready")
 
-        return JSONResponse(
-            {"detail": "Application is locked. Visit /unlock to enter the master password."},
-            status_code=503,
-        )
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        if app_locked():
+            detail = "Application is locked. Visit /unlock to enter the master password."
+        elif app_starting():
+            detail = "Application is starting. Try again shortly."
+        elif app_failed():
+            detail = "Application failed to start. Check the server logs."
+        else:
+            return await self.app(scope, receive, send)
+
+        if scope["path"] in self.ALLOWED_PATHS:
+            return await self.app(scope, receive, send)
+
+        response = JSONResponse({"detail": detail}, status_code=503)
+        await response(scope, receive, send)
 
 
 app = FastAPI(
@@ -224,10 +325,14 @@ app = FastAPI(
 app.add_middleware(LockMiddleware)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[settings.FRONTEND_URL, "http://localhost:5173"],
+    # dict.fromkeys dedupes (FRONTEND_URL is often the dev origin) in order
+    allow_origins=list(dict.fromkeys([settings.FRONTEND_URL, "http://localhost:5173"])),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists (the frontend only sends these) let preflights use the
+    # precomputed allow headers instead of echoing the request's back
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
@@ -239,12 +344,45 @@ app.include_router(members.router, prefix="/api")
 app.include_router(tags.router, prefix="/api")
 
 
-@app.get("/api/health")
-def health_check():
-    """Health check endpoint for Docker healthcheck."""
-    if vault_mode_enabled() and not vault_manager.is_unlocked:
-        return {"status": "locked"}
-    return {"status": "healthy"}
+# Health responses are pre-serialized: /api/health is polled constantly by
+# Docker and orchestrator probes, so it is served as a plain Starlette
+# route that skips FastAPI's validation and JSON encoding. The probes are
+# async: they only read flags, so they need no threadpool hop.
+_HEALTH_LOCKED = b'{"status":"locked"}'
+_HEALTH_STARTING = b'{"status":"starting"}'
+_HEALTH_HEALTHY = b'{"status":"healthy"}'
+_HEALTH_FAILED = b'{"status":"failed"}'
+
+
+async def health_check(request):
+    """Health check endpoint for Docker healthcheck. 503 if startup
+    initialization failed."""
+    if app_failed():
+        return Response(_HEALTH_FAILED, status_code=503, media_type="application/json")
+    if app_locked():
+        body = _HEALTH_LOCKED
+    elif app_starting():
+        body = _HEALTH_STARTING
+    else:
+        body = _HEALTH_HEALTHY
+    return Response(body, media_type="application/json")
+
+
+app.add_route("/api/health", health_check, methods=["GET"], include_in_schema=False)
+
+
+@app.get("/api/health/live")
+async def liveness_check():
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "alive"}
+
+
+@app.get("/api/health/ready")
+async def readiness_check():
+    """Readiness probe: 503 until initialization has completed."""
+    if not app_ready.is_set():
+        return JSONResponse({"status": "not ready"}, status_code=503)
+    return {"status": "ready"}
 
 
 @app.get("/")
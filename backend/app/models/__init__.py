@@ -1,5 +1,6 @@
 from app.models.user import User, UserRole
 from app.models.member import Member, MemberStatus
 from app.models.audit_log import AuditLog
+from app.models.search_token import MemberSearchToken
 
-__all__ = ["User", "UserRole", "Member", "MemberStatus", "AuditLog"]
+__all__ = ["User", "UserRole", "Member", "MemberStatus", "AuditLog", "MemberSearchToken"]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, DDL, Integer, String, DateTime, ForeignKey, Text, event
 from datetime import datetime
 from app.database import Base
 
@@ -8,7 +8,21 @@ class AuditLog(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)  # Nullable for system actions (e.g. stale reclamation)
-    member_id = Column(Integer, ForeignKey("members.id"), nullable=True, index=True)  # Nullable for actions not related to specific members
+    member_id = Column(Integer, ForeignKey("members.id", ondelete="CASCADE"), nullable=True, index=True)  # Nullable for actions not related to specific members
     action = Column(String, nullable=False)
     details = Column(Text, nullable=True)
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+# SQLite only honours ON DELETE CASCADE with PRAGMA foreign_keys on, which
+# this app leaves off (see database.py), so the cascade is carried out by a
+# trigger: deleting a member is a single statement from the application.
+AUDIT_CASCADE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS trg_members_delete_audit_logs
+AFTER DELETE ON members
+BEGIN
+    DELETE FROM audit_logs WHERE member_id = OLD.id;
+END
+"""
+
+event.listen(AuditLog.__table__, "after_create", DDL(AUDIT_CASCADE_TRIGGER))
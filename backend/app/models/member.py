@@ -1,11 +1,15 @@
 import enum
 import json
-from sqlalchemy import Column, Integer, String, Boolean, Enum, DateTime, ForeignKey, Text
+import logging
+from sqlalchemy import Column, Integer, String, Boolean, Enum, DateTime, ForeignKey, Text, Index, delete, event, insert, inspect
 from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime
 from app.database import Base
 from app.services.encryption import encryption_service
-from app.services.blind_index import generate_blind_index
+from app.services.blind_index import generate_blind_index, generate_search_tokens
+from app.models.search_token import MemberSearchToken
+
+logger = logging.getLogger(__name__)
 
 
 class MemberStatus(str, enum.Enum):
@@ -20,8 +24,72 @@ class MemberStatus(str, enum.Enum):
     DECLINED_SIGNAL = "DECLINED_SIGNAL"
 
 
+# Decrypted PII is memoized per instance as {field: (ciphertext, plaintext)}
+# so serializing a member decrypts each column at most once. Entries are
+# only trusted while the stored ciphertext is unchanged, which covers
+# refresh/expire and direct writes to the underlying column.
+def _decrypted(member, field: str, ciphertext) -> str:
+    cache = member.__dict__.setdefault("_pii_plaintext", {})
+    entry = cache.get(field)
+    if entry is not None and entry[0] == ciphertext:
+        return entry[1]
+    plaintext = encryption_service.decrypt(ciphertext)
+    cache[field] = (ciphertext, plaintext)
+    return plaintext
+
+
+def _encrypted(member, field: str, plaintext) -> str:
+    ciphertext = encryption_service.encrypt(plaintext)
+    cache = member.__dict__.setdefault("_pii_plaintext", {})
+    cache[field] = (ciphertext, plaintext if ciphertext else "")
+    return ciphertext
+
+
+# Fields folded into Member.search_text, along with custom field values
+SEARCH_FIELDS = ("first_name", "last_name", "city", "zip_code", "street_address")
+
+
+# Encrypted string columns, by attribute name (custom_fields is JSON and
+# handled separately).
+PII_FIELDS = (
+    "first_name", "last_name", "city", "zip_code",
+    "street_address", "phone_number", "email",
+)
+
+
+def decrypt_members(members, fields=PII_FIELDS + ("custom_fields",)) -> None:
+    """Decrypt the given fields of every member in one decrypt_many batch
+    and prime each member's plaintext cache, for callers about to read
+    them all (contact lists, exports, list responses). Fields already
+    cached are skipped."""
+    pending = []
+    for member in members:
+        cache = member.__dict__.setdefault("_pii_plaintext", {})
+        for field in fields:
+            ciphertext = getattr(member, "_" + field)
+            entry = cache.get(field)
+            if ciphertext and (entry is None or entry[0] != ciphertext):
+                pending.append((cache, field, ciphertext))
+    if not pending:
+        return
+    plaintexts = encryption_service.decrypt_many(c for _, _, c in pending)
+    for (cache, field, ciphertext), plaintext in zip(pending, plaintexts):
+        cache[field] = (ciphertext, plaintext)
+
+
 class Member(Base):
     __tablename__ = "members"
+    __table_args__ = (
+        # Vetter queue/listing filters, and status listings ordered by age.
+        # SQLite appends the rowid to every index, so these also serve the
+        # (created_at, id) keyset order, scanned backwards for newest first.
+        Index("ix_member_vetter_status_created", "assigned_vetter_id", "status", "created_at"),
+        Index("ix_member_status_created", "status", "created_at"),
+        # Unfiltered (admin) listing ordered by age
+        Index("ix_member_created", "created_at"),
+        # Stale-assignment reclaim: status = ASSIGNED AND updated_at < ?
+        Index("ix_member_status_updated", "status", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -37,6 +105,11 @@ class Member(Base):
     # Encrypted JSON column for all custom fields
     _custom_fields = Column("custom_fields", Text, nullable=True)
 
+    # Encrypted, lowercased copy of everything search matches against
+    # (SEARCH_FIELDS plus custom field values), kept in sync on write so a
+    # search decrypts one column per member instead of six
+    _search_text = Column("search_text", Text, nullable=True)
+
     # Blind index for email (for duplicate checking)
     email_blind_index = Column(String, index=True, nullable=False)
 
@@ -64,69 +137,83 @@ class Member(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    def decrypt_fields(self, fields=PII_FIELDS + ("custom_fields",)):
+        """Decrypt the given fields in one batch and prime the plaintext
+        cache, for callers about to read most of them (detail views).
+        Fields already cached are skipped."""
+        decrypt_members((self,), fields)
+
+    @property
+    def search_text(self) -> str:
+        """Lowercased searchable text; built on the fly for rows whose
+        search_text column has not been populated yet."""
+        if self._search_text:
+            return _decrypted(self, "search_text", self._search_text)
+        return build_search_text(self)
+
     # Hybrid properties for transparent encryption/decryption
     @hybrid_property
     def first_name(self):
-        return encryption_service.decrypt(self._first_name)
+        return _decrypted(self, "first_name", self._first_name)
 
     @first_name.setter
     def first_name(self, value):
-        self._first_name = encryption_service.encrypt(value)
+        self._first_name = _encrypted(self, "first_name", value)
 
     @hybrid_property
     def last_name(self):
-        return encryption_service.decrypt(self._last_name)
+        return _decrypted(self, "last_name", self._last_name)
 
     @last_name.setter
     def last_name(self, value):
-        self._last_name = encryption_service.encrypt(value)
+        self._last_name = _encrypted(self, "last_name", value)
 
     @hybrid_property
     def city(self):
-        return encryption_service.decrypt(self._city)
+        return _decrypted(self, "city", self._city)
 
     @city.setter
     def city(self, value):
-        self._city = encryption_service.encrypt(value)
+        self._city = _encrypted(self, "city", value)
 
     @hybrid_property
     def zip_code(self):
-        return encryption_service.decrypt(self._zip_code)
+        return _decrypted(self, "zip_code", self._zip_code)
 
     @zip_code.setter
     def zip_code(self, value):
-        self._zip_code = encryption_service.encrypt(value)
+        self._zip_code = _encrypted(self, "zip_code", value)
 
     @hybrid_property
     def street_address(self):
-        return encryption_service.decrypt(self._street_address)
+        return _decrypted(self, "street_address", self._street_address)
 
     @street_address.setter
     def street_address(self, value):
-        self._street_address = encryption_service.encrypt(value)
+        self._street_address = _encrypted(self, "street_address", value)
 
     @hybrid_property
     def phone_number(self):
-        return encryption_service.decrypt(self._phone_number)
+        return _decrypted(self, "phone_number", self._phone_number)
 
     @phone_number.setter
     def phone_number(self, value):
-        self._phone_number = encryption_service.encrypt(value)
+        self._phone_number = _encrypted(self, "phone_number", value)
 
     @hybrid_property
     def email(self):
-        return encryption_service.decrypt(self._email)
+        return _decrypted(self, "email", self._email)
 
     @email.setter
     def email(self, value):
-        self._email = encryption_service.encrypt(value)
+        self._email = _encrypted(self, "email", value)
         self.email_blind_index = generate_blind_index(value)
 
     @hybrid_property
     def custom_fields(self):
         """Decrypt and parse custom fields JSON."""
         if self._custom_fields:
-            decrypted = encryption_service.decrypt(self._custom_fields)
+            decrypted = _decrypted(self, "custom_fields", self._custom_fields)
             return json.loads(decrypted) if decrypted else {}
         return {}
 
@@ -135,7 +222,7 @@ class Member(Base):
         """Encrypt custom fields as JSON."""
         if value:
             json_str = json.dumps(value)
-            self._custom_fields = encryption_service.encrypt(json_str)
+            self._custom_fields = _encrypted(self, "custom_fields", json_str)
         else:
             self._custom_fields = None
 
@@ -153,3 +240,78 @@ class Member(Base):
             self._tags = json.dumps(value)
         else:
             self._tags = None
+
+
+def join_search_text(values: dict, custom_fields: dict) -> str:
+    """Lowercased search text from plaintext SEARCH_FIELDS values and
+    custom fields, one line per field/value."""
+    parts = [values[field] for field in SEARCH_FIELDS]
+    parts.extend(str(value) for value in custom_fields.values() if value)
+    return "\n".join(parts).lower()
+
+
+def build_search_text(member: Member) -> str:
+    """Lowercased search text for a member (see join_search_text).
+    Source fields not already in the plaintext cache are decrypted as one
+    batch."""
+    member.decrypt_fields(SEARCH_FIELDS + ("custom_fields",))
+    values = {field: getattr(member, field) for field in SEARCH_FIELDS}
+    return join_search_text(values, member.custom_fields)
+
+
+_SEARCH_SOURCE_ATTRS = tuple("_" + field for field in SEARCH_FIELDS) + ("_custom_fields",)
+
+
+def _refresh_search_text(member: Member) -> None:
+    try:
+        member._search_text = _encrypted(member, "search_text", build_search_text(member))
+    except Exception:
+        # Leave it unset; search falls back to the per-field path, which
+        # skips rows that cannot be decrypted
+        logger.exception("Could not build search text for member %s", member.id)
+        member._search_text = None
+
+
+@event.listens_for(Member, "before_insert")
+def _search_text_before_insert(mapper, connection, target):
+    _refresh_search_text(target)
+
+
+@event.listens_for(Member, "before_update")
+def _search_text_before_update(mapper, connection, target):
+    attrs = inspect(target).attrs
+    if any(attrs[name].history.has_changes() for name in _SEARCH_SOURCE_ATTRS):
+        _refresh_search_text(target)
+
+
+def _write_search_tokens(connection, member: Member, replace: bool) -> None:
+    if replace:
+        connection.execute(delete(MemberSearchToken).where(MemberSearchToken.member_id == member.id))
+    if not member._search_text:
+        return  # not indexed; search scans this row instead
+    try:
+        tokens = generate_search_tokens(member.search_text)
+    except Exception:
+        logger.exception("Could not build search tokens for member %s", member.id)
+        return
+    if tokens:
+        connection.execute(
+            insert(MemberSearchToken),
+            [{"token": token, "member_id": member.id} for token in tokens],
+        )
+
+
+@event.listens_for(Member, "after_insert")
+def _search_tokens_after_insert(mapper, connection, target):
+    _write_search_tokens(connection, target, replace=False)
+
+
+@event.listens_for(Member, "after_update")
+def _search_tokens_after_update(mapper, connection, target):
+    if inspect(target).attrs._search_text.history.has_changes():
+        _write_search_tokens(connection, target, replace=True)
+
+
+@event.listens_for(Member, "after_delete")
+def _search_tokens_after_delete(mapper, connection, target):
+    connection.execute(delete(MemberSearchToken).where(MemberSearchToken.member_id == target.id))
@@ -0,0 +1,15 @@
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer
+from app.database import Base
+
+
+class MemberSearchToken(Base):
+    """Blind-index search tokens for a member's search text (see
+    generate_search_tokens). Maintained by Member flush events."""
+    __tablename__ = "member_search_tokens"
+    __table_args__ = (
+        Index("ix_member_search_tokens_member", "member_id"),
+    )
+
+    # Token first: lookups are by token, and the primary key index serves them
+    token = Column(BigInteger, primary_key=True, autoincrement=False)
+    member_id = Column(Integer, ForeignKey("members.id"), primary_key=True)
@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import Column, Integer, String, Enum, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Enum, DateTime, Boolean, Index, func
 from datetime import datetime
 from app.database import Base
 
@@ -21,3 +21,8 @@ class User(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+# Usernames are matched case-insensitively (login, duplicate check); the
+# unique index on the raw column can't serve lower(username) = ?
+USERNAME_LOWER_INDEX = Index("ix_users_username_lower", func.lower(User.username))
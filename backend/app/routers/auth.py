@@ -1,16 +1,21 @@
+import hashlib
 import logging
+import threading
+import time
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, insert, select, update
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime, timedelta
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.models.member import Member, MemberStatus
+from app.models.audit_log import AuditLog
 from app.schemas.auth import LoginRequest, TokenResponse
 from app.services.auth import verify_password, create_access_token
 from app.services.audit import audit_service
 from app.services.rate_limit import login_limiter
+from app.services.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -19,51 +24,109 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 # Stale assignment threshold (7 days)
 STALE_ASSIGNMENT_DAYS = 7
 
-
-def reclaim_stale_assignments(db: Session) -> int:
+# Opportunistic reclaim during auto-assignment runs at most this often.
+# Assignments only go stale after days, so a minute's delay is harmless and
+# saves a scan on every vetter login. Process-local, like login_limiter.
+RECLAIM_INTERVAL_SECONDS = 60
+_reclaim_lock = threading.Lock()
+_last_reclaim_at = None
+
+
+def _reclaim_due() -> bool:
+    """True (and start a new interval) if the last opportunistic reclaim
+    was more than RECLAIM_INTERVAL_SECONDS ago."""
+    global _last_reclaim_at
+    now = time.monotonic()
+    with _reclaim_lock:
+        if _last_reclaim_at is not None and now - _last_reclaim_at < RECLAIM_INTERVAL_SECONDS:
+            return False
+        _last_reclaim_at = now
+        return True
+
+
+def reset_reclaim_throttle() -> None:
+    """Let the next auto-assignment reclaim immediately (used by tests)."""
+    global _last_reclaim_at
+    with _reclaim_lock:
+        _last_reclaim_at = None
+
+
+# Case-insensitive username lookup, built once so login reuses the same
+# statement (and its compiled-cache entry) instead of rebuilding a Query.
+_USER_BY_USERNAME = select(User).where(func.lower(User.username) == bindparam("username"))
+
+# Recently verified logins, so repeat logins with the same credentials
+# skip bcrypt for a short window. Keyed by a digest of the stored hash and
+# the submitted password: a password change alters the stored hash and so
+# invalidates the entry. Only successes are cached.
+LOGIN_CACHE_TTL_SECONDS = 30
+_login_cache = TTLCache(maxsize=1024, ttl_seconds=LOGIN_CACHE_TTL_SECONDS)
+
+
+def _check_password(password: str, hashed_password: str) -> bool:
+    """verify_password, memoizing successful checks for a short TTL."""
+    key = hashlib.sha256(f"{hashed_password}\0{password}".encode()).digest()
+    if _login_cache.get(key):
+        return True
+    if not verify_password(password, hashed_password):
+        return False
+    _login_cache.set(key, True)
+    return True
+
+
+def reclaim_stale_assignments(db: Session, now: Optional[datetime] = None) -> int:
     """
     Find members that have been assigned for more than STALE_ASSIGNMENT_DAYS
-    and reset them to PENDING status so they can be picked up by other vetters.
-    Returns the number of members reclaimed.
+    (as of `now`, default the current time) and reset them to PENDING status
+    so they can be picked up by other vetters. Returns the number of members
+    reclaimed. The caller commits.
     """
-    stale_threshold = datetime.utcnow() - timedelta(days=STALE_ASSIGNMENT_DAYS)
-
-    # Find members assigned but not completed within the threshold
-    stale_members = db.query(Member).filter(
-        Member.status == MemberStatus.ASSIGNED,
-        Member.updated_at < stale_threshold
-    ).all()
-
-    reclaimed_count = 0
-    for member in stale_members:
-        old_vetter_id = member.assigned_vetter_id
-        member.status = MemberStatus.PENDING
-        member.assigned_vetter_id = None
-
-        # Log the reclamation
-        audit_service.log_action(
-            db=db,
-            user_id=None,  # System action
-            member_id=member.id,
-            action="ASSIGNMENT_RECLAIMED",
-            details=f"Assignment reclaimed from vetter {old_vetter_id} after {STALE_ASSIGNMENT_DAYS} days of inactivity"
-        )
-        reclaimed_count += 1
-
-    if reclaimed_count > 0:
-        db.commit()
-
-    return reclaimed_count
+    now = now or datetime.utcnow()
+    stale_threshold = now - timedelta(days=STALE_ASSIGNMENT_DAYS)
+    is_stale = (Member.status == MemberStatus.ASSIGNED) & (Member.updated_at < stale_threshold)
+
+    # Read ids and previous vetters by column (no ORM hydration), then
+    # reset them all with one UPDATE and one multi-row audit INSERT. The
+    # UPDATE re-checks staleness, so a member reassigned in between is
+    # left alone; only the rows it returns are audited and counted.
+    stale = db.execute(select(Member.id, Member.assigned_vetter_id).where(is_stale)).all()
+    if not stale:
+        return 0
+
+    stale_ids = [member_id for member_id, _ in stale]
+    reclaimed_ids = set(db.scalars(
+        update(Member)
+        .where(Member.id.in_(stale_ids), is_stale)
+        .values(status=MemberStatus.PENDING, assigned_vetter_id=None)
+        .returning(Member.id)
+    ))
+    stale = [(member_id, old_vetter_id) for member_id, old_vetter_id in stale if member_id in reclaimed_ids]
+    if not stale:
+        return 0
+
+    db.execute(insert(AuditLog), [
+        {
+            "user_id": None,  # System action
+            "member_id": member_id,
+            "action": "ASSIGNMENT_RECLAIMED",
+            "details": f"Assignment reclaimed from vetter {old_vetter_id} after {STALE_ASSIGNMENT_DAYS} days of inactivity",
+            "timestamp": now,
+        }
+        for member_id, old_vetter_id in stale
+    ])
+
+    return len(stale)
 
 
 def auto_assign_next_member(db: Session, vetter_id: int) -> Optional[Member]:
     """
     Auto-assign the next pending member to a vetter.
-    First reclaims any stale assignments, then assigns the next pending member.
-    Returns the assigned member or None if no pending members.
+    First reclaims any stale assignments (at most once per
+    RECLAIM_INTERVAL_SECONDS), then assigns the next pending member, all in
+    one transaction. Returns the assigned member or None if no pending members.
     """
     # Reclaim stale assignments before assigning new ones
-    reclaimed = reclaim_stale_assignments(db)
+    reclaimed = reclaim_stale_assignments(db) if _reclaim_due() else 0
     if reclaimed > 0:
         # Log that we reclaimed some assignments (for monitoring)
         audit_service.log_action(
@@ -74,28 +137,41 @@ def auto_assign_next_member(db: Session, vetter_id: int) -> Optional[Member]:
             details=f"Reclaimed {reclaimed} stale assignment(s) during auto-assignment"
         )
 
-    # Get the first pending member (oldest first)
-    next_member = db.query(Member).filter(
-        Member.status == MemberStatus.PENDING
-    ).order_by(Member.created_at.asc()).first()
-
-    if next_member:
-        next_member.assigned_vetter_id = vetter_id
-        next_member.status = MemberStatus.ASSIGNED
-
-        # Log the auto-assignment
-        audit_service.log_action(
-            db=db,
-            user_id=vetter_id,
-            member_id=next_member.id,
-            action="AUTO_ASSIGNED",
-            details=f"Automatically assigned to vetter"
-        )
-
-        db.commit()
-        db.refresh(next_member)
+    # Claim the oldest pending member in a single statement. The status
+    # check is repeated in the outer WHERE, so if two logins race for the
+    # same row only one UPDATE matches; SQLite serializes writers, so this
+    # needs no row locks (SKIP LOCKED is Postgres-only). RETURNING hands
+    # back the whole updated row as a Member, so no reload is needed.
+    oldest_pending = (
+        select(Member.id)
+        .where(Member.status == MemberStatus.PENDING)
+        .order_by(Member.created_at.asc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    member = db.execute(
+        update(Member)
+        .where(Member.id == oldest_pending, Member.status == MemberStatus.PENDING)
+        .values(status=MemberStatus.ASSIGNED, assigned_vetter_id=vetter_id)
+        .returning(Member)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    ).scalar()
+
+    if member is None:
+        db.commit()  # persist any reclaim done above
+        return None
+
+    # Log the auto-assignment
+    audit_service.log_action(
+        db=db,
+        user_id=vetter_id,
+        member_id=member.id,
+        action="AUTO_ASSIGNED",
+        details=f"Automatically assigned to vetter"
+    )
 
-    return next_member
+    db.commit()
+    return member
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -111,9 +187,11 @@ def login(credentials: LoginRequest, request: Request, db: Session = Depends(get
             detail="Too many failed login attempts. Try again later.",
         )
 
-    user = db.query(User).filter(func.lower(User.username) == credentials.username.lower()).first()
+    user = db.execute(
+        _USER_BY_USERNAME, {"username": credentials.username.lower()}
+    ).scalars().first()
 
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    if not user or not _check_password(credentials.password, user.hashed_password):
         login_limiter.record_failure(throttle_key)
         logger.warning("Login failed for username=%r", credentials.username)
         raise HTTPException(
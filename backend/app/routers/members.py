@@ -1,14 +1,18 @@
 import csv
 import io
+import json
 import logging
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime, timezone
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Response
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import case, exists, func, lambda_stmt, or_, select, tuple_, update as sql_update
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List, Optional
 from app.database import get_db
 from app.models.user import User, UserRole
-from app.models.member import Member, MemberStatus
+from app.models.member import Member, MemberStatus, PII_FIELDS, SEARCH_FIELDS, decrypt_members
+from app.models.search_token import MemberSearchToken
 from app.schemas.member import (
     MemberResponse,
     MemberDetailResponse,
@@ -22,10 +26,13 @@ from app.schemas.member import (
     BulkArchiveUpdate,
     BulkTagUpdate,
 )
-from app.dependencies import get_current_user, require_admin, check_member_access, ADMIN_ROLES
+from app.dependencies import get_current_user, require_admin, get_accessible_member, ADMIN_ROLES
 from app.services.audit import audit_service
+from app.services.blind_index import generate_search_tokens
+from app.services.encryption import encryption_service
 from app.services.notifications import notify_status_change
 from app.routers.auth import auto_assign_next_member, reclaim_stale_assignments
+from app.utils.responses import list_response
 
 logger = logging.getLogger(__name__)
 
@@ -41,21 +48,92 @@ def escape_csv_formula(value: str) -> str:
     return value
 
 
-def apply_status_timestamps(member: Member, new_status: MemberStatus):
+def apply_status_timestamps(member: Member, new_status: MemberStatus, now: Optional[datetime] = None):
     """Update follow-up scheduling anchors when a member's status changes.
     VETTED starts the one-month follow-up timer; IN_SIGNAL (the resting
-    status) starts/restarts the recurring six-month follow-up timer."""
+    status) starts/restarts the recurring six-month follow-up timer.
+    Bulk callers pass one `now` so the whole batch shares a timestamp."""
     if new_status == MemberStatus.VETTED:
-        member.vetted_at = datetime.utcnow()
+        member.vetted_at = now or datetime.utcnow()
         member.one_month_followup_sent = False
     elif new_status == MemberStatus.IN_SIGNAL:
-        member.resting_since = datetime.utcnow()
+        member.resting_since = now or datetime.utcnow()
+
+
+# Columns MemberResponse serializes. List views select only these as plain
+# rows (no ORM objects), skipping the larger encrypted blobs (custom
+# fields, search text) and notes.
+LIST_VIEW_FIELDS = (
+    Member.id,
+    Member._first_name.label("first_name"),
+    Member._last_name.label("last_name"),
+    Member._city.label("city"),
+    Member._zip_code.label("zip_code"),
+    Member.status,
+    Member.archived,
+    Member._tags.label("tags"),
+    Member.assigned_vetter_id,
+    Member.created_at,
+    Member.updated_at,
+)
+LIST_VIEW_ENCRYPTED = ("first_name", "last_name", "city", "zip_code")
+
+
+def list_view_rows(rows) -> List[dict]:
+    """MemberResponse dicts for LIST_VIEW_FIELDS rows, with every row's
+    encrypted columns decrypted as one batch."""
+    if not rows:
+        return []
+    plaintexts = iter(encryption_service.decrypt_many(
+        row._mapping[field] for row in rows for field in LIST_VIEW_ENCRYPTED
+    ))
+    results = []
+    for row in rows:
+        item = dict(row._mapping)
+        for field in LIST_VIEW_ENCRYPTED:
+            item[field] = next(plaintexts)
+        item["tags"] = json.loads(item["tags"]) if item["tags"] else {}
+        results.append(item)
+    return results
+
+
+# Keyset pagination for list and search. Pages are opt-in (no limit returns
+# every row, as the frontend expects); the cursor for the next page is sent
+# in the X-Next-Cursor header so the response body stays a plain list.
+MAX_PAGE_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+NEWEST_FIRST = (Member.created_at.desc(), Member.id.desc())
+
+
+def encode_cursor(row) -> str:
+    return f"{row.created_at.isoformat()}_{row.id}"
+
+
+def decode_cursor(cursor: str):
+    """Parse a cursor into the (created_at, id) of the last row already seen."""
+    try:
+        created_at, member_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(created_at), int(member_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def page_response(rows, limit: Optional[int]) -> Response:
+    """Trim rows fetched with limit + 1 to one page and return it as a
+    MemberResponse list, with the next cursor header when there is more."""
+    headers = {}
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1])
+    return list_response(MemberResponse, list_view_rows(rows), headers)
 
 
 @router.get("", response_model=List[MemberResponse])
 def list_members(
     status_filter: Optional[MemberStatus] = Query(None),
     include_archived: bool = Query(False),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -64,38 +142,97 @@ def list_members(
     Admins see all members.
     Vetters see only assigned members.
     By default, archived members are hidden unless include_archived=True.
+    Pass limit (and then the returned X-Next-Cursor as cursor) to page.
     """
-    query = db.query(Member)
+    # Built as a lambda statement so the query is constructed and cached
+    # once per variant; later calls only supply the bound values.
+    stmt = lambda_stmt(lambda: select(*LIST_VIEW_FIELDS))
 
     # CRITICAL: Vetter isolation - only show assigned members
     if current_user.role not in ADMIN_ROLES:
-        query = query.filter(Member.assigned_vetter_id == current_user.id)
+        vetter_id = current_user.id
+        stmt += lambda s: s.where(Member.assigned_vetter_id == vetter_id)
 
     # Hide archived by default
     if not include_archived:
-        query = query.filter(Member.archived == False)
+        stmt += lambda s: s.where(Member.archived == False)
 
     # Optional status filter
     if status_filter:
-        query = query.filter(Member.status == status_filter)
+        stmt += lambda s: s.where(Member.status == status_filter)
 
-    members = query.order_by(Member.created_at.desc()).all()
-    return members
+    # Keyset: rows strictly older than the last one already returned
+    if cursor:
+        after_created, after_id = decode_cursor(cursor)
+        stmt += lambda s: s.where(
+            tuple_(Member.created_at, Member.id) < tuple_(after_created, after_id)
+        )
+
+    stmt += lambda s: s.order_by(*NEWEST_FIRST)
+    if limit is not None:
+        fetch = limit + 1
+        stmt += lambda s: s.limit(fetch)
+    return page_response(db.execute(stmt).all(), limit)
+
+
+SEARCH_SCAN_BATCH = 500
+
+# Any subset of a query's tokens still yields a superset of its matches
+# (each candidate is verified after decryption), so long queries only use
+# this many to keep the IN list short.
+SEARCH_MAX_TOKENS = 32
+
+
+# Rows searched without stored search text only need its source columns
+SEARCH_SOURCE_COLUMNS = load_only(
+    Member._search_text,
+    *(getattr(Member, "_" + field) for field in SEARCH_FIELDS),
+    Member._custom_fields,
+    raiseload=True,
+)
+
+
+def _decrypt_search_texts(candidates):
+    """Decrypt (member_id, search_text ciphertext) pairs as one batch,
+    falling back to row by row so a corrupt row is skipped, not fatal.
+
+    Sequential on purpose: per-token decryption is a few microseconds,
+    mostly Python-level work under the GIL, so a thread pool adds overhead
+    without parallel speedup, and search tokens already keep most queries
+    to a handful of candidates."""
+    try:
+        texts = encryption_service.decrypt_many(c for _, c in candidates)
+        return [(member_id, text) for (member_id, _), text in zip(candidates, texts)]
+    except Exception:
+        pass
+    results = []
+    for member_id, ciphertext in candidates:
+        try:
+            results.append((member_id, encryption_service.decrypt(ciphertext)))
+        except Exception:
+            logger.exception("Error searching member %s; skipping row", member_id)
+    return results
 
 
 @router.get("/search/query", response_model=List[MemberResponse])
 def search_members(
+    background_tasks: BackgroundTasks,
     q: str = Query(..., min_length=1),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Search members by name, location, notes, or custom fields.
-    All PII fields are encrypted, so search is done in-memory after decryption.
+    All PII fields are encrypted, so matches are confirmed in-memory after
+    decryption; blind-index search tokens limit which rows are decrypted.
     Notes are searched via DB query (not encrypted).
+    Paged like list_members; a page stops decrypting once it is full.
     """
-    # Log the search in audit log
-    audit_service.log_action(
+    # Log the search in audit log (written after the response)
+    audit_service.log_read(
+        background_tasks,
         db=db,
         user_id=current_user.id,
         member_id=None,
@@ -103,52 +240,91 @@ def search_members(
         details=f"Query: {q}"
     )
 
-    # Get base query with RBAC filtering
-    base_query = db.query(Member)
+    # Scan only id, encrypted search text and a notes-match flag (notes
+    # are not encrypted, so that part is matched in SQL), without
+    # hydrating ORM objects. Matching rows are loaded afterwards. The notes
+    # match escapes LIKE wildcards so "%" and "_" in q match literally,
+    # like the substring match on search text.
+    q_lower = q.lower()
+    notes_match = func.lower(Member.notes).contains(q_lower, autoescape=True)
+    scan = select(Member.id, Member._search_text, notes_match)
     if current_user.role not in ADMIN_ROLES:
-        base_query = base_query.filter(Member.assigned_vetter_id == current_user.id)
-
-    # Notes are not encrypted — search via DB for efficiency
-    search_term = f"%{q}%"
-    note_matches = set(
-        m.id for m in base_query.filter(Member.notes.ilike(search_term)).all()
+        scan = scan.where(Member.assigned_vetter_id == current_user.id)
+
+    # A row containing q contains every one of q's search tokens, so only
+    # rows holding all of them (plus notes matches and rows without tokens
+    # yet) need decrypting. Shorter queries have no tokens and scan all rows.
+    tokens = list(generate_search_tokens(q_lower))[:SEARCH_MAX_TOKENS]
+    if tokens:
+        token_match = (
+            select(MemberSearchToken.member_id)
+            .where(MemberSearchToken.token.in_(tokens))
+            .group_by(MemberSearchToken.member_id)
+            .having(func.count() == len(tokens))
+        )
+        untokenized = ~exists().where(MemberSearchToken.member_id == Member.id)
+        scan = scan.where(or_(notes_match, Member.id.in_(token_match), untokenized))
+
+    # Paged: scan newest first from the cursor, so scanning can stop once
+    # more than a page of matches is confirmed; every row before that point
+    # has been checked, so those matches are exactly the page.
+    if cursor:
+        after_created, after_id = decode_cursor(cursor)
+        scan = scan.where(tuple_(Member.created_at, Member.id) < tuple_(after_created, after_id))
+    if limit is not None:
+        scan = scan.order_by(*NEWEST_FIRST)
+
+    match_ids = []
+    unindexed_ids = []
+    for partition in db.execute(scan.execution_options(yield_per=SEARCH_SCAN_BATCH)).partitions():
+        candidates = []
+        for member_id, search_ciphertext, notes_match in partition:
+            if notes_match:
+                match_ids.append(member_id)
+            elif search_ciphertext:
+                candidates.append((member_id, search_ciphertext))
+            else:
+                unindexed_ids.append(member_id)
+        match_ids.extend(
+            member_id for member_id, text in _decrypt_search_texts(candidates)
+            if q_lower in text
+        )
+        if limit is not None and len(match_ids) > limit:
+            break
+
+    # Rows without search text yet (not backfilled, or undecryptable):
+    # build it from the individual fields, as one lowercased string per row
+    # (see build_search_text). One undecryptable row must not break search
+    # for everyone, so decryption errors skip the row.
+    if unindexed_ids:
+        unindexed = (
+            db.query(Member)
+            .options(SEARCH_SOURCE_COLUMNS)
+            .filter(Member.id.in_(unindexed_ids))
+        )
+        for member in unindexed:
+            try:
+                if q_lower in member.search_text:
+                    match_ids.append(member.id)
+            except Exception:
+                logger.exception("Error searching member %s; skipping row", member.id)
+
+    if not match_ids:
+        return []
+
+    # Newest first, sorted by the database rather than in Python
+    matches = (
+        select(*LIST_VIEW_FIELDS)
+        .where(Member.id.in_(match_ids))
+        .order_by(*NEWEST_FIRST)
     )
+    if limit is not None:
+        matches = matches.limit(limit + 1)
 
-    # All PII is encrypted — search in-memory after decryption
-    all_members = base_query.all()
-    q_lower = q.lower()
-    matches = []
+    return page_response(db.execute(matches).all(), limit)
 
-    for member in all_members:
-        # Already matched by notes query
-        if member.id in note_matches:
-            matches.append(member)
-            continue
 
-        # Search decrypted PII fields. One undecryptable row must not
-        # break search for everyone, so decryption errors skip the row.
-        try:
-            if (q_lower in member.first_name.lower()
-                    or q_lower in member.last_name.lower()
-                    or q_lower in member.city.lower()
-                    or q_lower in member.zip_code.lower()
-                    or q_lower in member.street_address.lower()):
-                matches.append(member)
-                continue
-
-            # Search custom fields
-            custom_fields = member.custom_fields
-            for field_value in custom_fields.values():
-                if field_value and q_lower in str(field_value).lower():
-                    matches.append(member)
-                    break
-        except Exception:
-            logger.exception("Error searching member %s; skipping row", member.id)
-
-    # Sort by creation date (newest first)
-    matches.sort(key=lambda m: m.created_at, reverse=True)
-
-    return matches
+CONTACT_FIELDS = ("first_name", "last_name", "email", "phone_number", "city", "zip_code")
 
 
 @router.get("/contacts", response_model=List[MemberContactResponse])
@@ -190,8 +366,10 @@ def get_contacts(
         action="VIEWED_CONTACT_LIST",
         details=f"Admin viewed contact list ({len(members)} members, filters: status={status_filter}, tag={tag_category}:{tag_value})"
     )
+    db.commit()
 
-    return members
+    decrypt_members(members, CONTACT_FIELDS)
+    return list_response(MemberContactResponse, members)
 
 
 EXPORTABLE_FIELDS = {
@@ -210,6 +388,16 @@ EXPORTABLE_FIELDS = {
 }
 
 
+# Export sort fields stored in plaintext, ordered by the database (notes
+# case-insensitively, like the Python sort used for encrypted fields)
+SQL_SORT_COLUMNS = {
+    "created_at": Member.created_at,
+    "updated_at": Member.updated_at,
+    "status": Member.status,
+    "notes": func.lower(Member.notes),
+}
+
+
 @router.get("/export")
 def export_members_csv(
     fields: str = Query(..., description="Comma-separated field names to include"),
@@ -235,19 +423,28 @@ def export_members_csv(
     if status_filter:
         query = query.filter(Member.status == status_filter)
 
-    members = query.all()
-
-    # Sort in Python (PII fields are encrypted in DB, can't sort there)
     reverse = sort_order == "desc"
-    def sort_key(m):
-        val = getattr(m, sort_by, "") or ""
-        if isinstance(val, str):
-            return val.lower()
-        return val
-    try:
-        members.sort(key=sort_key, reverse=reverse)
-    except TypeError:
-        pass
+    sort_column = SQL_SORT_COLUMNS.get(sort_by)
+    if sort_column is not None:
+        direction = sort_column.desc() if reverse else sort_column.asc()
+        query = query.order_by(direction, Member.id.desc() if reverse else Member.id)
+
+    members = query.all()
+    encrypted_fields = [f for f in PII_FIELDS if f in requested_fields or f == sort_by]
+    decrypt_members(members, encrypted_fields)
+
+    # Sort in Python only what the database cannot (PII fields are
+    # encrypted in the DB)
+    if sort_column is None:
+        def sort_key(m):
+            val = getattr(m, sort_by, "") or ""
+            if isinstance(val, str):
+                return val.lower()
+            return val
+        try:
+            members.sort(key=sort_key, reverse=reverse)
+        except TypeError:
+            pass
 
     # Build CSV
     output = io.StringIO()
@@ -273,6 +470,7 @@ def export_members_csv(
         action="EXPORTED_CSV",
         details=f"{current_user.username} exported {len(members)} members, fields: {','.join(requested_fields)}"
     )
+    db.commit()
 
     output.seek(0)
     return StreamingResponse(
@@ -285,6 +483,7 @@ def export_members_csv(
 @router.patch("/bulk-status", response_model=List[MemberResponse])
 def bulk_update_status(
     update: BulkStatusUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
@@ -293,36 +492,37 @@ def bulk_update_status(
     if not members:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No members found")
 
+    now = datetime.utcnow()
+    entries = []
     for member in members:
         old_status = member.status
         member.status = update.status
-        apply_status_timestamps(member, update.status)
-        audit_service.log_action(
-            db=db,
-            user_id=current_user.id,
-            member_id=member.id,
-            action="STATUS_CHANGED",
-            details=f"Bulk status change from {old_status} to {update.status}"
-        )
-
-    audit_service.log_action(
-        db=db,
-        user_id=current_user.id,
-        member_id=None,
-        action="BULK_STATUS_UPDATE",
-        details=f"Bulk updated {len(members)} member(s) to status {update.status}"
-    )
+        apply_status_timestamps(member, update.status, now)
+        entries.append({
+            "user_id": current_user.id,
+            "member_id": member.id,
+            "action": "STATUS_CHANGED",
+            "details": f"Bulk status change from {old_status} to {update.status}",
+        })
+
+    entries.append({
+        "user_id": current_user.id,
+        "member_id": None,
+        "action": "BULK_STATUS_UPDATE",
+        "details": f"Bulk updated {len(members)} member(s) to status {update.status}",
+    })
+    audit_service.log_actions(db, entries, timestamp=now)
 
     db.commit()
-    for member in members:
-        db.refresh(member)
+    decrypt_members(members, LIST_VIEW_ENCRYPTED)
 
-    # Single digest email for VETTED / NEEDS_FOLLOW_UP bulk changes
+    # Single digest email for VETTED / NEEDS_FOLLOW_UP bulk changes, sent
+    # after the response
     if update.status in (MemberStatus.VETTED, MemberStatus.NEEDS_FOLLOW_UP):
         names = [f"{m.first_name} {m.last_name}" for m in members]
-        notify_status_change(names, update.status)
+        background_tasks.add_task(notify_status_change, names, update.status)
 
-    return members
+    return list_response(MemberResponse, members)
 
 
 @router.patch("/bulk-archive", response_model=List[MemberResponse])
@@ -336,28 +536,27 @@ def bulk_update_archived(
     if not members:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No members found")
 
+    entries = []
     for member in members:
         member.archived = update.archived
-        audit_service.log_action(
-            db=db,
-            user_id=current_user.id,
-            member_id=member.id,
-            action="ARCHIVED_UPDATED",
-            details=f"Bulk archived set to {update.archived}"
-        )
-
-    audit_service.log_action(
-        db=db,
-        user_id=current_user.id,
-        member_id=None,
-        action="BULK_ARCHIVE_UPDATE",
-        details=f"Bulk updated {len(members)} member(s) archived to {update.archived}"
-    )
+        entries.append({
+            "user_id": current_user.id,
+            "member_id": member.id,
+            "action": "ARCHIVED_UPDATED",
+            "details": f"Bulk archived set to {update.archived}",
+        })
+
+    entries.append({
+        "user_id": current_user.id,
+        "member_id": None,
+        "action": "BULK_ARCHIVE_UPDATE",
+        "details": f"Bulk updated {len(members)} member(s) archived to {update.archived}",
+    })
+    audit_service.log_actions(db, entries)
 
     db.commit()
-    for member in members:
-        db.refresh(member)
-    return members
+    decrypt_members(members, LIST_VIEW_ENCRYPTED)
+    return list_response(MemberResponse, members)
 
 
 @router.patch("/bulk-tags", response_model=List[MemberResponse])
@@ -371,30 +570,29 @@ def bulk_update_tags(
     if not members:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No members found")
 
+    entries = []
     for member in members:
         tags = dict(member.tags or {})
         tags[update.tag_key] = update.tag_value
         member.tags = tags
-        audit_service.log_action(
-            db=db,
-            user_id=current_user.id,
-            member_id=member.id,
-            action="TAGS_UPDATED",
-            details=f"Bulk tag update: {update.tag_key} set to {update.tag_value}"
-        )
-
-    audit_service.log_action(
-        db=db,
-        user_id=current_user.id,
-        member_id=None,
-        action="BULK_TAGS_UPDATE",
-        details=f"Bulk updated {len(members)} member(s) tag {update.tag_key} to {update.tag_value}"
-    )
+        entries.append({
+            "user_id": current_user.id,
+            "member_id": member.id,
+            "action": "TAGS_UPDATED",
+            "details": f"Bulk tag update: {update.tag_key} set to {update.tag_value}",
+        })
+
+    entries.append({
+        "user_id": current_user.id,
+        "member_id": None,
+        "action": "BULK_TAGS_UPDATE",
+        "details": f"Bulk updated {len(members)} member(s) tag {update.tag_key} to {update.tag_value}",
+    })
+    audit_service.log_actions(db, entries)
 
     db.commit()
-    for member in members:
-        db.refresh(member)
-    return members
+    decrypt_members(members, LIST_VIEW_ENCRYPTED)
+    return list_response(MemberResponse, members)
 
 
 @router.get("/queue-count")
@@ -415,6 +613,7 @@ def get_queue_count(
 @router.get("/{member_id}", response_model=MemberDetailResponse)
 def get_member(
     member_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -422,19 +621,14 @@ def get_member(
     Get member details with decrypted PII.
     Checks access permissions and logs audit entry.
     """
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
-
-    # Check access permission
-    if not check_member_access(member, current_user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have permission to access this member"
-        )
+    member = get_accessible_member(
+        db, member_id, current_user,
+        "You do not have permission to access this member",
+    )
 
-    # Log PII access
-    audit_service.log_action(
+    # Log PII access (written after the response)
+    audit_service.log_read(
+        background_tasks,
         db=db,
         user_id=current_user.id,
         member_id=member.id,
@@ -442,6 +636,7 @@ def get_member(
         details=f"User {current_user.username} viewed PII for member {member.id}"
     )
 
+    member.decrypt_fields()
     return member
 
 
@@ -451,20 +646,15 @@ def get_member(
 def update_member_status(
     member_id: int,
     update: MemberUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Update member status (admin or assigned vetter)."""
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
-
-    # Check access permission
-    if not check_member_access(member, current_user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have permission to update this member"
-        )
+    member = get_accessible_member(
+        db, member_id, current_user,
+        "You do not have permission to update this member",
+    )
 
     if update.status:
         old_status = member.status
@@ -486,15 +676,24 @@ def update_member_status(
             auto_assign_next_member(db, current_user.id)
 
     db.commit()
-    db.refresh(member)
 
-    # Email notification for VETTED / NEEDS_FOLLOW_UP (after commit, fire-and-forget)
+    # Email notification for VETTED / NEEDS_FOLLOW_UP, sent after the
+    # response so the Resend call does not hold up the request
     if update.status in (MemberStatus.VETTED, MemberStatus.NEEDS_FOLLOW_UP):
-        notify_status_change([f"{member.first_name} {member.last_name}"], update.status)
+        background_tasks.add_task(
+            notify_status_change,
+            [f"{member.first_name} {member.last_name}"],
+            update.status,
+        )
 
     return member
 
 
+# Notes are one plaintext log (shown verbatim in the UI, matched by search
+# and exported as a column); entries are separated by a blank line.
+NOTE_SEPARATOR = "\n\n"
+
+
 @router.post("/{member_id}/notes", response_model=MemberDetailResponse)
 def add_member_note(
     member_id: int,
@@ -503,25 +702,32 @@ def add_member_note(
     current_user: User = Depends(get_current_user)
 ):
     """Add a note to a member (admin or assigned vetter)."""
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
-
-    # Check access permission
-    if not check_member_access(member, current_user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have permission to add notes to this member"
-        )
+    member = get_accessible_member(
+        db, member_id, current_user,
+        "You do not have permission to add notes to this member",
+    )
 
-    # Append note with timestamp and user
-    timestamp = datetime.utcnow().isoformat()
+    # Append note with timestamp (to the second, explicitly UTC) and user.
+    # An aware datetime: utcnow() is deprecated as of Python 3.12.
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
     new_note = f"[{timestamp}] {current_user.username}: {note_data.note}"
 
-    if member.notes:
-        member.notes = f"{member.notes}\n\n{new_note}"
-    else:
-        member.notes = new_note
+    # Append in SQL rather than read-concatenate-write in Python, so
+    # concurrent notes on the same member cannot overwrite each other.
+    # RETURNING hands back the combined text and new timestamp for the
+    # response without another SELECT.
+    notes, updated_at = db.execute(
+        sql_update(Member)
+        .where(Member.id == member.id)
+        .values(notes=case(
+            (func.coalesce(Member.notes, "") == "", new_note),
+            else_=Member.notes + NOTE_SEPARATOR + new_note,
+        ))
+        .returning(Member.notes, Member.updated_at)
+        .execution_options(synchronize_session=False)
+    ).one()
+    set_committed_value(member, "notes", notes)
+    set_committed_value(member, "updated_at", updated_at)
 
     # Log note addition
     audit_service.log_action(
@@ -533,7 +739,6 @@ def add_member_note(
     )
 
     db.commit()
-    db.refresh(member)
 
     return member
 
@@ -580,6 +785,7 @@ def reclaim_stale_assignments_endpoint(
         action="MANUAL_STALE_RECLAIM",
         details=f"Admin manually reclaimed {reclaimed_count} stale assignment(s)"
     )
+    db.commit()
 
     return {
         "reclaimed_count": reclaimed_count,
@@ -595,15 +801,10 @@ def update_member_tags(
     current_user: User = Depends(get_current_user)
 ):
     """Update member tags (admin or assigned vetter)."""
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
-
-    if not check_member_access(member, current_user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have permission to update this member"
-        )
+    member = get_accessible_member(
+        db, member_id, current_user,
+        "You do not have permission to update this member",
+    )
 
     member.tags = update.tags
 
@@ -616,7 +817,6 @@ def update_member_tags(
     )
 
     db.commit()
-    db.refresh(member)
     return member
 
 
@@ -628,15 +828,10 @@ def update_custom_fields(
     current_user: User = Depends(get_current_user)
 ):
     """Update custom fields with merge semantics (admin or assigned vetter)."""
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
-
-    if not check_member_access(member, current_user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have permission to update this member"
-        )
+    member = get_accessible_member(
+        db, member_id, current_user,
+        "You do not have permission to update this member",
+    )
 
     # Merge semantics: preserve existing fields, add/update new ones
     existing = member.custom_fields or {}
@@ -652,7 +847,6 @@ def update_custom_fields(
     )
 
     db.commit()
-    db.refresh(member)
     return member
 
 
@@ -664,15 +858,10 @@ def update_archived(
     current_user: User = Depends(get_current_user)
 ):
     """Update archived flag (admin or assigned vetter)."""
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
-
-    if not check_member_access(member, current_user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have permission to update this member"
-        )
+    member = get_accessible_member(
+        db, member_id, current_user,
+        "You do not have permission to update this member",
+    )
 
     member.archived = update.archived
 
@@ -685,7 +874,6 @@ def update_archived(
     )
 
     db.commit()
-    db.refresh(member)
     return member
 
 
@@ -696,16 +884,12 @@ def delete_member(
     current_user: User = Depends(require_admin)
 ):
     """Delete a member (admin only)."""
-    member = db.query(Member).filter(Member.id == member_id).first()
+    member = db.get(Member, member_id)
     if not member:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
 
-    # Delete related audit logs first (to handle foreign key constraint)
-    from app.models.audit_log import AuditLog
-    db.query(AuditLog).filter(AuditLog.member_id == member_id).delete()
-
     # Log the deletion with member_id=None so this entry survives the
-    # purge of the member's own audit history above.
+    # cascade that removes the member's own audit history.
     audit_service.log_action(
         db=db,
         user_id=current_user.id,
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.member import Member, MemberStatus
 from app.schemas.member import MemberCreate
 from app.services.blind_index import generate_blind_index
 from app.services.notifications import send_notification
+from app.utils.config_cache import load_json_config, load_json_config_bytes
 from app.config import settings
-import json
 import logging
 import os
 
@@ -19,36 +20,65 @@ router = APIRouter(prefix="/public", tags=["Public"])
 # the encrypted custom_fields blob).
 DEFAULT_MAX_FIELD_LENGTH = 5000
 
+DUPLICATE_EMAIL_DETAIL = "An application with this email address already exists"
+
 # Path to configuration files
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data")
 FORM_CONFIG_PATH = os.path.join(DATA_DIR, "form_config.json")
 TAG_CONFIG_PATH = os.path.join(DATA_DIR, "tag_config.json")
 
 
-def load_form_config():
-    """Load form configuration, with optional local override."""
+def form_config_path():
+    """The local override if present, else the shipped form config."""
     local_path = FORM_CONFIG_PATH.replace('.json', '.local.json')
-    path = local_path if os.path.exists(local_path) else FORM_CONFIG_PATH
-    with open(path, 'r') as f:
-        return json.load(f)
+    return local_path if os.path.exists(local_path) else FORM_CONFIG_PATH
+
+
+def load_form_config():
+    """Load form configuration, with optional local override.
+    Cached until the file changes; treat the result as read-only."""
+    return load_json_config(form_config_path())
 
 
 def load_tag_config():
-    """Load and return the tag configuration."""
-    with open(TAG_CONFIG_PATH, 'r') as f:
-        return json.load(f)
+    """Load and return the tag configuration (cached, read-only)."""
+    return load_json_config(TAG_CONFIG_PATH)
+
+
+# Per-field validation rules derived from the form config, rebuilt only
+# when load_form_config returns a new (reloaded) config object.
+_field_rules = (None, ())
+
+
+def form_field_rules():
+    """(key, label, required, max_length) for each configured form field."""
+    global _field_rules
+    config = load_form_config()
+    if _field_rules[0] is not config:
+        rules = tuple(
+            (
+                field['key'],
+                field.get('label', field['key']),
+                bool(field.get('required')),
+                field.get('validation', {}).get('maxLength') or DEFAULT_MAX_FIELD_LENGTH,
+            )
+            for field in config['fields']
+        )
+        _field_rules = (config, rules)
+    return _field_rules[1]
 
 
 @router.get("/form-config")
 def get_form_config():
-    """Return the form field configuration for dynamic form rendering."""
-    return load_form_config()
+    """Return the form field configuration for dynamic form rendering.
+    Served as pre-encoded JSON, re-encoded only when the file changes."""
+    return Response(content=load_json_config_bytes(form_config_path()), media_type="application/json")
 
 
 @router.get("/tag-config")
 def get_tag_config():
     """Return the tag category configuration for member tagging."""
-    return load_tag_config()
+    return Response(content=load_json_config_bytes(TAG_CONFIG_PATH), media_type="application/json")
 
 
 @router.post("/apply", status_code=status.HTTP_201_CREATED)
@@ -59,9 +89,6 @@ def submit_application(
 ):
     """Public endpoint for submitting membership applications."""
 
-    # Load form config for validation
-    config = load_form_config()
-
     # Extract and validate standard fields
     try:
         standard_fields = MemberCreate(
@@ -79,40 +106,39 @@ def submit_application(
             detail=f"Validation error: {str(e)}"
         )
 
-    # Check for duplicate email using blind index
+    # Check for duplicate email using blind index (EXISTS on the indexed
+    # column; no member row is loaded). This rejects the common case before
+    # taking SQLite's write lock; concurrent races are re-checked below.
     email_index = generate_blind_index(standard_fields.email)
-    existing = db.query(Member).filter(Member.email_blind_index == email_index).first()
+    existing = db.scalar(select(exists().where(Member.email_blind_index == email_index)))
 
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="An application with this email address already exists"
+            detail=DUPLICATE_EMAIL_DETAIL
         )
 
     # Validate and extract custom fields
     custom_fields = {}
-    for field_config in config['fields']:
-        key = field_config['key']
+    for key, label, required, max_length in form_field_rules():
         value = application.get(key)
 
         # Validate required fields
-        if field_config.get('required') and not value:
+        if required and not value:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"{field_config['label']} is required"
+                detail=f"{label} is required"
             )
 
-        # Validate max length (config-specified, with a global fallback cap)
         if value:
-            max_length = field_config.get('validation', {}).get('maxLength') or DEFAULT_MAX_FIELD_LENGTH
+            # Validate max length (config-specified, with a global fallback cap)
             if len(str(value)) > max_length:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"{field_config['label']} exceeds maximum length of {max_length}"
+                    detail=f"{label} exceeds maximum length of {max_length}"
                 )
 
-        # Store non-empty values
-        if value:
+            # Store non-empty values
             custom_fields[key] = value
 
     # Create new member — all PII set via hybrid properties for encryption
@@ -126,9 +152,22 @@ def submit_application(
     member.email = standard_fields.email  # Also sets blind index
     member.custom_fields = custom_fields
 
+    # Re-check after the INSERT: the flush takes SQLite's single write lock,
+    # so a concurrent signup for the same email has either committed (and
+    # is counted here) or waits until this transaction ends. Emails are not
+    # a unique constraint because CSV imports may share one per household.
     db.add(member)
+    db.flush()
+    same_email = db.scalar(
+        select(func.count()).where(Member.email_blind_index == member.email_blind_index)
+    )
+    if same_email > 1:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=DUPLICATE_EMAIL_DETAIL
+        )
     db.commit()
-    db.refresh(member)
 
     # Send email notification after the response, off the request path
     if settings.NOTIFICATION_EMAIL:
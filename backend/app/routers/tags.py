@@ -1,9 +1,13 @@
+import copy
 import json
 import os
 import re
+import threading
+from contextlib import contextmanager
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel, field_validator
+from sqlalchemy import func, select, true
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -11,6 +15,7 @@ from app.dependencies import require_admin
 from app.models.member import Member
 from app.models.user import User
 from app.services.audit import audit_service
+from app.utils.config_cache import load_json_config, load_json_config_bytes
 
 router = APIRouter(prefix="/tags", tags=["Tags"])
 
@@ -21,8 +26,35 @@ KEY_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
 
 
 def load_tag_config():
-    with open(TAG_CONFIG_PATH, "r") as f:
-        return json.load(f)
+    """Return a private copy of the tag config; callers edit and save it."""
+    return copy.deepcopy(load_json_config(TAG_CONFIG_PATH))
+
+
+# Category key -> (position, category) for the cached tag config, rebuilt
+# only when load_json_config returns a new (reloaded) config object.
+_category_index = (None, {})
+
+
+def tag_category_index():
+    """Look up categories by key without scanning; entries are read-only.
+    The position indexes the same category in a load_tag_config() copy."""
+    global _category_index
+    config = load_json_config(TAG_CONFIG_PATH)
+    if _category_index[0] is not config:
+        index = {c["key"]: (i, c) for i, c in enumerate(config["categories"])}
+        _category_index = (config, index)
+    return _category_index[1]
+
+
+def find_category(key: str):
+    """(position, category) for the key, or 404."""
+    entry = tag_category_index().get(key)
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Category '{key}' not found",
+        )
+    return entry
 
 
 def save_tag_config(config):
@@ -35,6 +67,21 @@ def save_tag_config(config):
     os.replace(tmp_path, TAG_CONFIG_PATH)
 
 
+# Serializes read-modify-write of the config file (the app runs as a single
+# process), so concurrent admin edits cannot overwrite each other.
+_edit_lock = threading.Lock()
+
+
+@contextmanager
+def editing_tag_config():
+    """Yield a private copy of the tag config and save it when the block
+    completes (an exception, e.g. a 404, discards the edit)."""
+    with _edit_lock:
+        config = load_tag_config()
+        yield config
+        save_tag_config(config)
+
+
 class CategoryCreate(BaseModel):
     key: str
     label: str
@@ -77,7 +124,7 @@ class CategoryUpdate(BaseModel):
 @router.get("")
 def get_tag_config(current_user: User = Depends(require_admin)):
     """Return the full tag configuration."""
-    return load_tag_config()
+    return Response(content=load_json_config_bytes(TAG_CONFIG_PATH), media_type="application/json")
 
 
 @router.post("/categories", status_code=status.HTTP_201_CREATED)
@@ -86,17 +133,13 @@ def add_category(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin),
 ):
-    config = load_tag_config()
-    existing_keys = {c["key"] for c in config["categories"]}
-
-    if category.key in existing_keys:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Category with key '{category.key}' already exists",
-        )
-
-    config["categories"].append(category.model_dump())
-    save_tag_config(config)
+    with editing_tag_config() as config:
+        if category.key in tag_category_index():
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Category with key '{category.key}' already exists",
+            )
+        config["categories"].append(category.model_dump())
 
     audit_service.log_action(
         db=db,
@@ -105,6 +148,7 @@ def add_category(
         action="TAG_CATEGORY_ADDED",
         details=f"Added tag category '{category.key}' ({category.label})",
     )
+    db.commit()
 
     return category.model_dump()
 
@@ -116,36 +160,30 @@ def update_category(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin),
 ):
-    config = load_tag_config()
-    for cat in config["categories"]:
-        if cat["key"] == key:
-            changes = []
-            if update.label is not None:
-                cat["label"] = update.label
-                changes.append(f"label='{update.label}'")
-            if update.options is not None:
-                cat["options"] = update.options
-                changes.append(f"options={update.options}")
-            if update.multiple is not None:
-                cat["multiple"] = update.multiple
-                changes.append(f"multiple={update.multiple}")
-
-            save_tag_config(config)
-
-            audit_service.log_action(
-                db=db,
-                user_id=current_user.id,
-                member_id=None,
-                action="TAG_CATEGORY_UPDATED",
-                details=f"Updated tag category '{key}': {', '.join(changes)}",
-            )
-
-            return cat
+    with editing_tag_config() as config:
+        position, _ = find_category(key)
+        cat = config["categories"][position]
+        changes = []
+        if update.label is not None:
+            cat["label"] = update.label
+            changes.append(f"label='{update.label}'")
+        if update.options is not None:
+            cat["options"] = update.options
+            changes.append(f"options={update.options}")
+        if update.multiple is not None:
+            cat["multiple"] = update.multiple
+            changes.append(f"multiple={update.multiple}")
 
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Category '{key}' not found",
+    audit_service.log_action(
+        db=db,
+        user_id=current_user.id,
+        member_id=None,
+        action="TAG_CATEGORY_UPDATED",
+        details=f"Updated tag category '{key}': {', '.join(changes)}",
     )
+    db.commit()
+
+    return cat
 
 
 @router.delete("/categories/{key}")
@@ -154,17 +192,9 @@ def delete_category(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin),
 ):
-    config = load_tag_config()
-    original_len = len(config["categories"])
-    config["categories"] = [c for c in config["categories"] if c["key"] != key]
-
-    if len(config["categories"]) == original_len:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Category '{key}' not found",
-        )
-
-    save_tag_config(config)
+    with editing_tag_config() as config:
+        position, _ = find_category(key)
+        del config["categories"][position]
 
     audit_service.log_action(
         db=db,
@@ -173,6 +203,7 @@ def delete_category(
         action="TAG_CATEGORY_DELETED",
         details=f"Deleted tag category '{key}'",
     )
+    db.commit()
 
     return {"message": f"Category '{key}' deleted"}
 
@@ -184,37 +215,27 @@ def get_option_usage(
     current_user: User = Depends(require_admin),
 ):
     """Get per-option member usage counts for a category."""
-    config = load_tag_config()
-    category = next((c for c in config["categories"] if c["key"] == key), None)
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Category '{key}' not found",
-        )
-
-    # Filter on the raw column: the `tags` hybrid property has no SQL
-    # expression, so Member.tags cannot be used in a query.
-    members = db.query(Member).filter(Member._tags.isnot(None)).all()
-    usage = {}
-    for option in category["options"]:
-        usage[option] = 0
-
-    for member in members:
-        tags = member.tags or {}
-        value = tags.get(key)
-        if value is None:
-            continue
-        if isinstance(value, list):
-            for v in value:
-                if v in usage:
-                    usage[v] = usage[v] + 1
-                else:
-                    usage[v] = 1
-        else:
-            if value in usage:
-                usage[value] = usage[value] + 1
-            else:
-                usage[value] = 1
+    _, category = find_category(key)
+
+    # Count in SQL with SQLite's json_each, which yields one row per list
+    # element, or a single row for a scalar value. Only string and number
+    # values are options; nulls, booleans and nested arrays or objects are
+    # skipped. The LIKE on the raw column skips rows whose JSON never
+    # mentions the key before any parsing. The `tags` hybrid property has
+    # no SQL expression, so the column is used.
+    key_marker = json.dumps(key) + ":"
+    values = func.json_each(Member._tags, f"$.{json.dumps(key)}").table_valued("value", "type")
+    counts = db.execute(
+        select(values.c.value, func.count())
+        .select_from(Member)
+        .join(values, true())
+        .where(Member._tags.contains(key_marker, autoescape=True), values.c.type.in_(("text", "integer", "real")))
+        .group_by(values.c.value)
+    ).all()
+
+    usage = {option: 0 for option in category["options"]}
+    for value, count in counts:
+        usage[value] = usage.get(value, 0) + count
 
     total = sum(usage.values())
     return {"category": key, "usage": usage, "total_members_using": total}
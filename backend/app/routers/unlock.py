@@ -5,50 +5,54 @@ When the app is in vault mode (a .vault file exists), all other routes
 return 503 until the master password is entered here.
 """
 
+from string import Template
+
 from fastapi import APIRouter, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, RedirectResponse
 
+from app.config import load_secrets_from_vault
 from app.services.rate_limit import unlock_limiter
 from app.vault import vault_manager
 
 router = APIRouter()
 
-UNLOCK_HTML = """<!DOCTYPE html>
+UNLOCK_HTML = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Unlock - Signup Manager</title>
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
             background: #0f172a; color: #e2e8f0;
             display: flex; align-items: center; justify-content: center;
             min-height: 100vh;
-        }}
-        .card {{
+        }
+        .card {
             background: #1e293b; border-radius: 12px; padding: 2.5rem;
             width: 100%; max-width: 400px;
             box-shadow: 0 25px 50px rgba(0,0,0,.3);
-        }}
-        h1 {{ font-size: 1.5rem; margin-bottom: 0.5rem; }}
-        .subtitle {{ color: #94a3b8; font-size: 0.875rem; margin-bottom: 1.5rem; }}
-        label {{ display: block; font-size: 0.875rem; margin-bottom: 0.5rem; color: #cbd5e1; }}
-        input[type="password"] {{
+        }
+        h1 { font-size: 1.5rem; margin-bottom: 0.5rem; }
+        .subtitle { color: #94a3b8; font-size: 0.875rem; margin-bottom: 1.5rem; }
+        label { display: block; font-size: 0.875rem; margin-bottom: 0.5rem; color: #cbd5e1; }
+        input[type="password"] {
             width: 100%; padding: 0.75rem 1rem; border-radius: 8px;
             border: 1px solid #334155; background: #0f172a; color: #e2e8f0;
             font-size: 1rem; margin-bottom: 1.25rem; outline: none;
-        }}
-        input:focus {{ border-color: #3b82f6; }}
-        button {{
+        }
+        input:focus { border-color: #3b82f6; }
+        button {
             width: 100%; padding: 0.75rem; border-radius: 8px; border: none;
             background: #3b82f6; color: white; font-size: 1rem; font-weight: 600;
             cursor: pointer; transition: background 0.2s;
-        }}
-        button:hover {{ background: #2563eb; }}
-        .error {{ color: #f87171; font-size: 0.875rem; margin-bottom: 1rem; }}
-        .lock-icon {{ font-size: 2.5rem; margin-bottom: 1rem; }}
+        }
+        button:hover { background: #2563eb; }
+        .error { color: #f87171; font-size: 0.875rem; margin-bottom: 1rem; }
+        .lock-icon { font-size: 2.5rem; margin-bottom: 1rem; }
     </style>
 </head>
 <body>
@@ -56,7 +60,7 @@ UNLOCK_HTML = """<!DOCTYPE html>
         <div class="lock-icon">&#x1f512;</div>
         <h1>Unlock Application</h1>
         <p class="subtitle">Enter the master password to decrypt secrets and start the application.</p>
-        {error}
+        $error
         <form method="post" action="/api/unlock">
             <label for="password">Master Password</label>
             <input type="password" id="password" name="password" required autofocus
@@ -65,7 +69,27 @@ UNLOCK_HTML = """<!DOCTYPE html>
         </form>
     </div>
 </body>
-</html>"""
+</html>""")
+
+# Every page the unlock flow can return, rendered once at import
+UNLOCK_ERRORS = {
+    "": "",
+    "rate_limited": "Too many failed attempts. Try again later.",
+    "no_vault": "Vault file not found. Run: python vault.py create",
+    "corrupt_vault": "Vault file is corrupt. Restore it from backup or recreate it with: python vault.py create",
+    "invalid_password": "Invalid master password.",
+}
+UNLOCK_PAGES = {
+    key: UNLOCK_HTML.substitute(
+        error=f'<div class="error">{message}</div>' if message else ""
+    ).encode()
+    for key, message in UNLOCK_ERRORS.items()
+}
+
+
+def unlock_response(error: str = "", status_code: int = 200) -> HTMLResponse:
+    """The pre-rendered unlock page for the given error key."""
+    return HTMLResponse(UNLOCK_PAGES[error], status_code=status_code)
 
 
 @router.get("/unlock", response_class=HTMLResponse)
@@ -73,7 +97,7 @@ async def unlock_page():
     """Serve the unlock form, or redirect to home if already unlocked."""
     if vault_manager.is_unlocked:
         return RedirectResponse(url="/", status_code=302)
-    return UNLOCK_HTML.format(error="")
+    return unlock_response()
 
 
 @router.post("/unlock")
@@ -84,49 +108,31 @@ async def unlock(request: Request, password: str = Form(...)):
 
     client_ip = request.client.host if request.client else "unknown"
     if unlock_limiter.is_blocked(client_ip):
-        return HTMLResponse(
-            UNLOCK_HTML.format(
-                error='<div class="error">Too many failed attempts. Try again later.</div>'
-            ),
-            status_code=429,
-        )
+        return unlock_response("rate_limited", 429)
 
+    # Key derivation (Argon2id, or PBKDF2 for older vaults) and app
+    # initialization are slow and blocking, so run them off the event loop
     try:
-        success = vault_manager.unlock(password)
+        success = await run_in_threadpool(vault_manager.unlock, password)
     except FileNotFoundError:
-        return HTMLResponse(
-            UNLOCK_HTML.format(
-                error='<div class="error">Vault file not found. Run: python vault.py create</div>'
-            ),
-            status_code=500,
-        )
+        return unlock_response("no_vault", 500)
     except RuntimeError:
-        return HTMLResponse(
-            UNLOCK_HTML.format(
-                error='<div class="error">Vault file is corrupt. Restore it from backup or recreate it with: python vault.py create</div>'
-            ),
-            status_code=500,
-        )
+        return unlock_response("corrupt_vault", 500)
 
     if not success:
         unlock_limiter.record_failure(client_ip)
-        return HTMLResponse(
-            UNLOCK_HTML.format(
-                error='<div class="error">Invalid master password.</div>'
-            ),
-            status_code=401,
-        )
+        return unlock_response("invalid_password", 401)
 
     unlock_limiter.record_success(client_ip)
 
     # Load secrets into settings and initialize the app (encryption,
     # table creation, schema migrations, first-admin seeding) — the
-    # same startup path used in direct mode.
-    from app.config import load_secrets_from_vault
+    # same startup path used in direct mode. app.main imports this router,
+    # so initialize_app is imported here; by now it is a sys.modules hit.
     from app.main import initialize_app
 
     load_secrets_from_vault(vault_manager.secrets)
-    initialize_app()
+    await run_in_threadpool(initialize_app)
 
     # 303 See Other — browser follows redirect with GET
     return RedirectResponse(url="/", status_code=303)
@@ -1,15 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func
+from sqlalchemy import exists, func, select, update
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
 from app.services.auth import hash_password
 from app.dependencies import require_admin, ADMIN_ROLES
+from app.utils.responses import list_response
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+USER_RESPONSE_COLUMNS = tuple(getattr(User, name) for name in UserResponse.model_fields)
+
 
 def _check_role_permission(current_user: User, target_role: UserRole):
     """
@@ -29,9 +32,14 @@ def list_users(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
-    """List all users (admin only)."""
-    users = db.query(User).all()
-    return users
+    """List all users (admin only).
+
+    Selects only the UserResponse columns, so no User objects are built
+    and no relationship can be lazy-loaded per row, and encodes the rows
+    straight to JSON (see list_response).
+    """
+    rows = db.execute(select(*USER_RESPONSE_COLUMNS).order_by(User.id)).all()
+    return list_response(UserResponse, rows)
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -44,7 +52,9 @@ def create_user(
     _check_role_permission(current_user, user_data.role)
 
     # Check if username already exists
-    existing = db.query(User).filter(func.lower(User.username) == user_data.username.lower()).first()
+    existing = db.scalar(
+        select(exists().where(func.lower(User.username) == user_data.username.lower()))
+    )
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -61,7 +71,6 @@ def create_user(
 
     db.add(user)
     db.commit()
-    db.refresh(user)
 
     return user
 
@@ -73,12 +82,26 @@ def get_user(
     current_user: User = Depends(require_admin)
 ):
     """Get a specific user (admin only)."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return user
 
 
+def _check_editable(current_user: User, target_role: Optional[UserRole]):
+    """
+    Raise 404 if the target user does not exist (target_role is None), or
+    403 if a GROUP_ADMIN is editing a non-vetter.
+    """
+    if target_role is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    if current_user.role == UserRole.GROUP_ADMIN and target_role != UserRole.VETTER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Group admins can only manage vetter accounts"
+        )
+
+
 @router.patch("/{user_id}", response_model=UserResponse)
 def update_user(
     user_id: int,
@@ -86,33 +109,43 @@ def update_user(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
-    """Update a user (admin only). GROUP_ADMIN can only edit vetters."""
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
-    # GROUP_ADMIN cannot edit non-vetter users
-    if current_user.role == UserRole.GROUP_ADMIN and user.role != UserRole.VETTER:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Group admins can only manage vetter accounts"
-        )
+    """Update a user (admin only). GROUP_ADMIN can only edit vetters.
 
+    Applied as one UPDATE ... RETURNING; the group-admin restriction is
+    part of the WHERE clause, and the row is only read separately when
+    nothing matched, to tell 404 from 403. A group admin setting a
+    password is checked against the target's role first, so a forbidden
+    request never pays for the bcrypt hash.
+    """
     # If changing role, enforce hierarchy
     if user_data.role:
         _check_role_permission(current_user, user_data.role)
 
+    if user_data.password and current_user.role == UserRole.GROUP_ADMIN:
+        _check_editable(current_user, db.scalar(select(User.role).where(User.id == user_id)))
+
+    values = {}
     if user_data.password:
-        user.hashed_password = hash_password(user_data.password)
+        values["hashed_password"] = hash_password(user_data.password)
     if user_data.role:
-        user.role = user_data.role
+        values["role"] = user_data.role
     if user_data.full_name:
-        user.full_name = user_data.full_name
+        values["full_name"] = user_data.full_name
     if user_data.is_active is not None:
-        user.is_active = user_data.is_active
+        values["is_active"] = user_data.is_active
 
-    db.commit()
-    db.refresh(user)
+    user = None
+    if values:
+        stmt = update(User).where(User.id == user_id)
+        # GROUP_ADMIN cannot edit non-vetter users
+        if current_user.role == UserRole.GROUP_ADMIN:
+            stmt = stmt.where(User.role == UserRole.VETTER)
+        user = db.scalars(stmt.values(**values).returning(User)).one_or_none()
+        db.commit()
+
+    if user is None:
+        user = db.get(User, user_id)
+        _check_editable(current_user, user.role if user else None)
 
     return user
 
@@ -124,7 +157,7 @@ def delete_user(
     current_user: User = Depends(require_admin)
 ):
     """Delete a user (admin only). GROUP_ADMIN can only delete vetters."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
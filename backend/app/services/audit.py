@@ -1,10 +1,81 @@
+import logging
+import threading
 from datetime import datetime
+from typing import List, Optional
+from fastapi import BackgroundTasks
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
+from app.config import settings
 from app.models.audit_log import AuditLog
 
+# Read events logged on every detail view / search; skipped when
+# AUDIT_LEVEL is "writes_only"
+READ_ACTIONS = frozenset({"VIEWED_PII", "SEARCHED_MEMBERS"})
+
+logger = logging.getLogger(__name__)
+
+# Read events waiting to be written, as (engine, row) pairs. Whichever
+# background task takes _flush_lock next writes everything queued so far,
+# so under load many requests' events share one INSERT and transaction.
+_pending = []
+_pending_lock = threading.Lock()
+_flush_lock = threading.Lock()
+
 
 class AuditService:
-    """Service for logging all PII access and sensitive actions."""
+    """Service for logging all PII access and sensitive actions.
+
+    Entries are added to the caller's session and written by the caller's
+    commit, so a request that logs several events (bulk updates) issues
+    one batched INSERT in one transaction instead of a commit per event.
+    Callers must commit. Loops that log one event per member use
+    log_actions, a single bulk INSERT without per-row ORM objects.
+    Read-only endpoints use log_read instead, which
+    writes after the response. With AUDIT_LEVEL="writes_only",
+    READ_ACTIONS are not recorded.
+    """
+
+    @staticmethod
+    def log_read(
+        background_tasks: BackgroundTasks,
+        db: Session,
+        user_id: int,
+        member_id: Optional[int],
+        action: str,
+        details: str = None,
+    ) -> None:
+        """Queue an audit event from a read-only request. It is timestamped
+        now and written by a background task after the response is sent,
+        batched with any other queued events."""
+        if settings.AUDIT_LEVEL == "writes_only" and action in READ_ACTIONS:
+            return
+        row = {
+            "user_id": user_id,
+            "member_id": member_id,
+            "action": action,
+            "details": details,
+            "timestamp": datetime.utcnow(),
+        }
+        with _pending_lock:
+            _pending.append((db.get_bind(), row))
+        background_tasks.add_task(AuditService.write_queued)
+
+    @staticmethod
+    def write_queued() -> None:
+        """Write every queued read event, one multi-row INSERT per database."""
+        with _flush_lock:
+            with _pending_lock:
+                batch = _pending[:]
+                del _pending[:]
+            by_bind = {}
+            for bind, row in batch:
+                by_bind.setdefault(bind, []).append(row)
+            for bind, rows in by_bind.items():
+                try:
+                    with bind.begin() as conn:
+                        conn.execute(insert(AuditLog), rows)
+                except Exception:
+                    logger.exception("Failed to write %d audit log entries", len(rows))
 
     @staticmethod
     def log_action(
@@ -12,21 +83,45 @@ class AuditService:
         user_id: int,
         member_id: int,
         action: str,
-        details: str = None
-    ) -> AuditLog:
-        """Log an audit event."""
+        details: str = None,
+        timestamp: Optional[datetime] = None,
+    ) -> Optional[AuditLog]:
+        """Stage an audit event on the session (persisted on commit).
+        Batch callers may pass one shared timestamp. Returns None if the
+        audit level skips this action."""
+        if settings.AUDIT_LEVEL == "writes_only" and action in READ_ACTIONS:
+            return None
         audit_entry = AuditLog(
             user_id=user_id,
             member_id=member_id,
             action=action,
             details=details,
-            timestamp=datetime.utcnow()
+            timestamp=timestamp or datetime.utcnow()
         )
         db.add(audit_entry)
-        db.commit()
-        db.refresh(audit_entry)
         return audit_entry
 
+    @staticmethod
+    def log_actions(
+        db: Session,
+        entries: List[dict],
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """Insert several audit events (dicts with user_id, member_id,
+        action and optional details) in one statement on the caller's
+        transaction, all with the same timestamp. Callers must commit."""
+        timestamp = timestamp or datetime.utcnow()
+        writes_only = settings.AUDIT_LEVEL == "writes_only"
+        rows = [
+            {"details": None, **entry, "timestamp": timestamp}
+            for entry in entries
+            if not (writes_only and entry["action"] in READ_ACTIONS)
+        ]
+        if rows:
+            # Core executemany on the session's connection: the ORM bulk
+            # path would split rows into one INSERT per NULL pattern
+            db.connection().execute(insert(AuditLog.__table__), rows)
+
 
 # Singleton instance
 audit_service = AuditService()
@@ -1,6 +1,30 @@
 import hashlib
+from typing import Set
 from app.config import settings
 
+# Encoded salt and the search-token key derived from it, keyed by the
+# settings value they came from. The salt is only known after the vault
+# unlocks, so these are cached lazily rather than at import, and rebuilt if
+# settings are ever repopulated.
+_salt_cache = ("", b"", b"")
+
+# Length of the substrings hashed into search tokens
+SEARCH_TOKEN_LENGTH = 3
+
+
+def _salt_keys():
+    global _salt_cache
+    salt = settings.EMAIL_BLIND_INDEX_SALT
+    if _salt_cache[0] != salt:
+        salt_bytes = salt.encode()
+        token_key = hashlib.sha256(b"search-token:" + salt_bytes).digest()
+        _salt_cache = (salt, salt_bytes, token_key)
+    return _salt_cache
+
+
+def _salt_bytes() -> bytes:
+    return _salt_keys()[1]
+
 
 def generate_blind_index(email: str) -> str:
     """
@@ -13,8 +37,26 @@ def generate_blind_index(email: str) -> str:
     # Normalize email: lowercase and strip whitespace
     normalized = email.lower().strip()
 
-    # Create salted hash
-    salted = f"{normalized}{settings.EMAIL_BLIND_INDEX_SALT}"
-    hash_obj = hashlib.sha256(salted.encode())
+    # Salted hash of normalized + salt (byte-for-byte the same as hashing
+    # the concatenated string, so existing indexes stay valid)
+    hash_obj = hashlib.sha256(normalized.encode() + _salt_bytes())
 
     return hash_obj.hexdigest()
+
+
+def generate_search_tokens(text: str) -> Set[int]:
+    """
+    Keyed 64-bit hashes of every SEARCH_TOKEN_LENGTH-character substring of
+    text (already lowercased). Any substring match of a query at least that
+    long implies all of the query's tokens are present, so the token table
+    narrows search to a few candidate rows without storing plaintext.
+    """
+    key = _salt_keys()[2]
+    n = SEARCH_TOKEN_LENGTH
+    return {
+        int.from_bytes(
+            hashlib.blake2b(text[i:i + n].encode(), key=key, digest_size=8).digest(),
+            "big", signed=True,
+        )
+        for i in range(len(text) - n + 1)
+    }
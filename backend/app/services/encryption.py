@@ -1,41 +1,135 @@
-from cryptography.fernet import Fernet
-from typing import Optional
+import base64
+import binascii
+import os
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from typing import Iterable, List
+
+
+NOT_INITIALIZED = "Encryption service not initialized. Unlock the vault first."
+
+# Ciphertexts are urlsafe-base64 tokens versioned by their first byte.
+# Fernet tokens start with 0x80 ("g" once encoded); AES-256-GCM tokens are
+# AEAD_VERSION + 12-byte nonce + ciphertext/tag, so they start with "A".
+AEAD_VERSION = b"\x02"
+AEAD_TOKEN_PREFIX = b"A"
+NONCE_SIZE = 12
+AEAD_KEY_INFO = b"signup-manager pii aes-256-gcm"
+
+
+class _UninitializedCipher:
+    """Stands in for the cipher until initialize() runs, so the
+    encrypt/decrypt hot path needs no per-call None check."""
+
+    def _fail(self, *args, **kwargs):
+        raise RuntimeError(NOT_INITIALIZED)
+
+    encrypt = encrypt_many = decrypt = _fail
+
+
+_UNINITIALIZED = _UninitializedCipher()
+
+
+class VersionedCipher:
+    """Encrypts with AES-256-GCM (one AES-NI pass plus GMAC) and decrypts
+    both GCM tokens and legacy Fernet tokens, so existing rows stay
+    readable and are upgraded whenever they are rewritten. The GCM key is
+    derived from the Fernet key with HKDF, so no new secret is needed.
+    Both failure modes raise Fernet's InvalidToken."""
+
+    def __init__(self, key: str):
+        self.fernet = Fernet(key.encode())
+        self._aead = AESGCM(HKDF(
+            algorithm=hashes.SHA256(), length=32, salt=None, info=AEAD_KEY_INFO,
+        ).derive(base64.urlsafe_b64decode(key)))
+
+    def encrypt(self, data: bytes) -> bytes:
+        nonce = os.urandom(NONCE_SIZE)
+        return base64.urlsafe_b64encode(AEAD_VERSION + nonce + self._aead.encrypt(nonce, data, None))
+
+    def encrypt_many(self, items: List[bytes]) -> List[bytes]:
+        """Encrypt several values, drawing all their nonces with one
+        os.urandom call."""
+        encrypt = self._aead.encrypt
+        nonces = os.urandom(NONCE_SIZE * len(items))
+        tokens = []
+        for i, data in enumerate(items):
+            nonce = nonces[i * NONCE_SIZE:(i + 1) * NONCE_SIZE]
+            tokens.append(base64.urlsafe_b64encode(AEAD_VERSION + nonce + encrypt(nonce, data, None)))
+        return tokens
+
+    def decrypt(self, token: bytes) -> bytes:
+        if token[:1] != AEAD_TOKEN_PREFIX:
+            return self.fernet.decrypt(token)
+        try:
+            raw = base64.urlsafe_b64decode(token)
+            return self._aead.decrypt(raw[1:NONCE_SIZE + 1], raw[NONCE_SIZE + 1:], None)
+        except (InvalidTag, binascii.Error, ValueError):
+            raise InvalidToken
 
 
 class EncryptionService:
-    """Service for encrypting and decrypting PII fields using Fernet symmetric encryption.
+    """Service for encrypting and decrypting PII fields with AES-256-GCM
+    (legacy Fernet ciphertexts are still decrypted; see VersionedCipher).
 
     Supports two modes:
     - Direct: initialized immediately from settings (dev with .env)
     - Deferred: initialized later via initialize() after vault unlock
+
+    The cipher (and its derived keys) is built once in initialize() and
+    shared; it is safe to use across threads. Its encrypt/decrypt methods
+    are bound there too, so each call skips the attribute lookups.
+
+    Encryption is CPU-bound and blocking. Every current caller already runs
+    off the event loop (sync routes run in the threadpool; startup and the
+    follow-up scheduler use asyncio.to_thread). Async code must do the
+    same, wrapping whole batches (e.g. decrypt_many) in run_in_threadpool
+    rather than calling per field.
     """
 
     def __init__(self):
-        self._cipher: Optional[Fernet] = None
+        self._set_cipher(_UNINITIALIZED)
 
     def initialize(self, key: str):
         """Initialize the cipher with the given Fernet key."""
-        self._cipher = Fernet(key.encode())
+        self._set_cipher(VersionedCipher(key))
+
+    def _set_cipher(self, cipher):
+        self._cipher = cipher
+        self._encrypt = cipher.encrypt
+        self._decrypt = cipher.decrypt
 
     @property
-    def cipher(self) -> Fernet:
-        if self._cipher is None:
-            raise RuntimeError("Encryption service not initialized. Unlock the vault first.")
+    def cipher(self) -> VersionedCipher:
+        if self._cipher is _UNINITIALIZED:
+            raise RuntimeError(NOT_INITIALIZED)
         return self._cipher
 
     def encrypt(self, plaintext: str) -> str:
         """Encrypt a plaintext string and return the ciphertext as a string."""
         if not plaintext:
             return ""
-        encrypted_bytes = self.cipher.encrypt(plaintext.encode())
-        return encrypted_bytes.decode()
+        return self._encrypt(plaintext.encode()).decode()
 
     def decrypt(self, ciphertext: str) -> str:
         """Decrypt a ciphertext string and return the plaintext."""
         if not ciphertext:
             return ""
-        decrypted_bytes = self.cipher.decrypt(ciphertext.encode())
-        return decrypted_bytes.decode()
+        return self._decrypt(ciphertext.encode()).decode()
+
+    def encrypt_many(self, plaintexts: List[str]) -> List[str]:
+        """Encrypt several plaintexts in one call (empty strings stay
+        empty), e.g. all of a row's PII fields."""
+        tokens = iter(self._cipher.encrypt_many([p.encode() for p in plaintexts if p]))
+        return [next(tokens).decode() if p else "" for p in plaintexts]
+
+    def decrypt_many(self, ciphertexts: Iterable[str]) -> List[str]:
+        """Decrypt several ciphertexts in one call."""
+        decrypt = self._decrypt
+        return [decrypt(c.encode()).decode() if c else "" for c in ciphertexts]
 
 
 # Singleton instance
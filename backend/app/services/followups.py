@@ -41,11 +41,13 @@ def run_followup_checks():
         for m in one_month_due:
             m.status = MemberStatus.ONE_MONTH_FOLLOWUP
             m.one_month_followup_sent = True
-            audit_service.log_action(
-                db=db, user_id=None, member_id=m.id,
-                action="STATUS_CHANGED",
-                details="System: one-month follow-up due, status set to ONE_MONTH_FOLLOWUP",
-            )
+        audit_service.log_actions(db, [
+            {
+                "user_id": None, "member_id": m.id, "action": "STATUS_CHANGED",
+                "details": "System: one-month follow-up due, status set to ONE_MONTH_FOLLOWUP",
+            }
+            for m in one_month_due
+        ], timestamp=now)
         db.commit()
 
         if one_month_due:
@@ -67,11 +69,13 @@ def run_followup_checks():
 
         for m in six_month_due:
             m.status = MemberStatus.SIX_MONTH_FOLLOWUP
-            audit_service.log_action(
-                db=db, user_id=None, member_id=m.id,
-                action="STATUS_CHANGED",
-                details="System: six-month follow-up due, status set to SIX_MONTH_FOLLOWUP",
-            )
+        audit_service.log_actions(db, [
+            {
+                "user_id": None, "member_id": m.id, "action": "STATUS_CHANGED",
+                "details": "System: six-month follow-up due, status set to SIX_MONTH_FOLLOWUP",
+            }
+            for m in six_month_due
+        ], timestamp=now)
         db.commit()
 
         if six_month_due:
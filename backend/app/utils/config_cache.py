@@ -0,0 +1,40 @@
+import json
+import os
+import threading
+
+# Parsed JSON config files, keyed by path and validated against the file's
+# stat signature, so a file is only re-read after it changes on disk (an
+# atomic save replaces the inode, which changes the signature too).
+_cache = {}
+# Compact JSON encoding of each cached config, keyed by path and tied to
+# the parsed object it was encoded from
+_encoded = {}
+_lock = threading.Lock()
+
+
+def load_json_config(path: str):
+    """Return the parsed contents of a JSON config file, re-reading it only
+    when it has changed. The result is shared: callers must not mutate it."""
+    st = os.stat(path)
+    signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+    entry = _cache.get(path)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    with open(path, "r") as f:
+        data = json.load(f)
+    with _lock:
+        _cache[path] = (signature, data)
+    return data
+
+
+def load_json_config_bytes(path: str) -> bytes:
+    """Return the config as compact JSON bytes, ready to send as a response
+    body. Encoded once per (re)load, so serving it costs no JSON work."""
+    data = load_json_config(path)
+    entry = _encoded.get(path)
+    if entry is not None and entry[0] is data:
+        return entry[1]
+    body = json.dumps(data, separators=(",", ":")).encode()
+    with _lock:
+        _encoded[path] = (data, body)
+    return body
@@ -1,5 +1,10 @@
+from sqlalchemy import exists, insert, select
 from sqlalchemy.orm import Session
+from app.models.member import Member, build_search_text
+from app.models.search_token import MemberSearchToken
+from app.services.blind_index import generate_search_tokens
 from app.models.user import User, UserRole
+from app.services.encryption import encryption_service
 from app.services.auth import hash_password
 from app.config import settings
 
@@ -10,10 +15,13 @@ def create_first_admin(db: Session) -> None:
         print("FIRST_RUN_ADMIN_USER or FIRST_RUN_ADMIN_PASSWORD not set, skipping admin creation")
         return
 
-    # Check if admin already exists
-    existing_admin = db.query(User).filter(User.username == settings.FIRST_RUN_ADMIN_USER).first()
-    if existing_admin:
-        print(f"Admin user '{settings.FIRST_RUN_ADMIN_USER}' already exists, skipping creation")
+    # Check if admin already exists (before hashing: this runs on every
+    # startup and unlock, and bcrypt is only needed on the first)
+    if db.scalar(select(exists().where(User.username == settings.FIRST_RUN_ADMIN_USER))):
+        print(
+            f"Admin user '{settings.FIRST_RUN_ADMIN_USER}' already exists, skipping creation. "
+            "FIRST_RUN_ADMIN_PASSWORD is no longer needed; remove it from the environment or vault."
+        )
         return
 
     # Create admin user
@@ -27,3 +35,63 @@ def create_first_admin(db: Session) -> None:
     db.add(admin)
     db.commit()
     print(f"Created first admin user: {settings.FIRST_RUN_ADMIN_USER}")
+
+
+def backfill_search_text(db: Session, batch_size: int = 500) -> None:
+    """Populate search_text for members created before the column existed.
+    Rows that cannot be decrypted are left empty (search skips them)."""
+    filled = 0
+    last_id = 0
+    while True:
+        batch = (
+            db.query(Member)
+            .filter(Member._search_text.is_(None), Member.id > last_id)
+            .order_by(Member.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            break
+        for member in batch:
+            try:
+                member._search_text = encryption_service.encrypt(build_search_text(member))
+                filled += 1
+            except Exception:
+                print(f"Could not build search text for member {member.id}, skipping")
+        last_id = batch[-1].id
+        db.commit()
+    if filled:
+        print(f"Backfilled search text for {filled} members")
+
+
+def backfill_search_tokens(db: Session, batch_size: int = 500) -> None:
+    """Build search tokens for indexed members that have none (rows
+    written before the token table existed). Run after
+    backfill_search_text; undecryptable rows are skipped."""
+    has_tokens = exists().where(MemberSearchToken.member_id == Member.id)
+    filled = 0
+    last_id = 0
+    while True:
+        batch = db.execute(
+            select(Member.id, Member._search_text)
+            .where(Member._search_text.is_not(None), ~has_tokens, Member.id > last_id)
+            .order_by(Member.id)
+            .limit(batch_size)
+        ).all()
+        if not batch:
+            break
+        rows = []
+        for member_id, ciphertext in batch:
+            try:
+                tokens = generate_search_tokens(encryption_service.decrypt(ciphertext))
+            except Exception:
+                print(f"Could not build search tokens for member {member_id}, skipping")
+                continue
+            rows.extend({"token": token, "member_id": member_id} for token in tokens)
+            filled += 1
+        if rows:
+            db.execute(insert(MemberSearchToken), rows)
+        last_id = batch[-1][0]
+        db.commit()
+    if filled:
+        print(f"Backfilled search tokens for {filled} members")
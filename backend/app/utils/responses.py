@@ -0,0 +1,28 @@
+from functools import lru_cache
+from typing import List, Mapping, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema):
+    return TypeAdapter(List[schema])
+
+
+def list_response(schema, rows, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """Validate rows (dicts, ORM objects or Row tuples) as a list of schema
+    and encode them straight to JSON bytes in pydantic-core.
+
+    FastAPI's response_model path validates, dumps to Python objects, runs
+    jsonable_encoder and then json.dumps; for list endpoints returning
+    hundreds of rows that costs about 2.5x as much. Routes keep their
+    response_model for the OpenAPI schema. Headers set on an injected
+    Response are not merged into a returned one, so pass them here.
+    """
+    adapter = _list_adapter(schema)
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(rows, from_attributes=True)),
+        media_type="application/json",
+        headers=headers,
+    )
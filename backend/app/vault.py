@@ -4,22 +4,59 @@ and holds secrets in memory only.
 """
 
 import base64
+import hashlib
+import hmac
 import json
 import logging
 import os
+from types import MappingProxyType
+from typing import Mapping
 
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.argon2 import Argon2id
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 logger = logging.getLogger(__name__)
 
+# Message MACed with the derived key to make the vault's password
+# verifier (vault.py writes it; vaults without one skip the check)
+VERIFIER_CONTEXT = b"vault-v1"
+
+
+def derive_vault_key(master_password: str, vault_data: dict) -> bytes:
+    """Derive the raw 32-byte vault key with the KDF the vault records:
+    Argon2id for vaults written by current vault.py, PBKDF2-SHA256 for
+    older vaults with no "kdf" field."""
+    salt = base64.b64decode(vault_data["salt"])
+    if vault_data.get("kdf") == "argon2id":
+        kdf = Argon2id(
+            salt=salt,
+            length=32,
+            iterations=vault_data["iterations"],
+            lanes=vault_data["lanes"],
+            memory_cost=vault_data["memory_cost"],
+        )
+    else:
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=vault_data.get("iterations", 600_000),
+        )
+    return kdf.derive(master_password.encode())
+
+
+def vault_verifier(derived_key: bytes) -> str:
+    """Password verifier for a raw vault key derived by derive_vault_key."""
+    return hmac.new(derived_key, VERIFIER_CONTEXT, hashlib.sha256).hexdigest()
+
 
 class VaultManager:
     """Manages the encrypted vault lifecycle at runtime."""
 
     def __init__(self):
-        self._secrets: dict = {}
+        self._secrets: Mapping[str, str] = MappingProxyType({})
         self._unlocked = False
 
     @property
@@ -27,10 +64,11 @@ class VaultManager:
         return self._unlocked
 
     @property
-    def secrets(self) -> dict:
+    def secrets(self) -> Mapping[str, str]:
+        """Read-only view of the decrypted secrets (no copy per access)."""
         if not self._unlocked:
             raise RuntimeError("Vault is locked")
-        return self._secrets.copy()
+        return self._secrets
 
     def get_vault_path(self) -> str:
         # Single source of truth: settings reads VAULT_FILE from the
@@ -48,32 +86,30 @@ class VaultManager:
         Raises FileNotFoundError if vault file is missing.
         """
         vault_path = self.get_vault_path()
-        if not os.path.exists(vault_path):
+        try:
+            with open(vault_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Vault file not found: {vault_path}")
+        vault_data = json.loads(raw)
 
-        with open(vault_path) as f:
-            vault_data = json.load(f)
+        derived = derive_vault_key(master_password, vault_data)
 
-        salt = base64.b64decode(vault_data["salt"])
-        iterations = vault_data.get("iterations", 600_000)
-
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=iterations,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(master_password.encode()))
+        # A wrong password fails on the verifier without attempting the
+        # decrypt; the KDF above is the cost every attempt still pays
+        verifier = vault_data.get("verifier")
+        if verifier is not None and not hmac.compare_digest(vault_verifier(derived), verifier):
+            return False
 
         try:
-            fernet = Fernet(key)
+            fernet = Fernet(base64.urlsafe_b64encode(derived))
             decrypted = fernet.decrypt(vault_data["data"].encode())
         except InvalidToken:
             # Wrong master password (or tampered vault) — expected path
             return False
 
         try:
-            self._secrets = json.loads(decrypted)
+            self._secrets = MappingProxyType(json.loads(decrypted))
         except ValueError:
             # Password was right but the payload is corrupt — surface it
             # instead of reporting "invalid password" to the operator.
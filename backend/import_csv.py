@@ -19,6 +19,7 @@ Example:
 import argparse
 import csv
 import getpass
+import json
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -27,13 +28,43 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.database import SessionLocal, engine
-from app.models.member import Member, MemberStatus
-from app.models.audit_log import AuditLog
+from app.models.member import PII_FIELDS, Member, MemberStatus, join_search_text
+from app.models.search_token import MemberSearchToken
+from app.services.audit import audit_service
 from app.services.encryption import encryption_service
-from app.services.blind_index import generate_blind_index
+from app.services.blind_index import generate_blind_index, generate_search_tokens
 from app.vault import vault_manager
 from app.config import settings, load_secrets_from_vault
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, load_only
+
+# Members inserted per executemany statement
+IMPORT_BATCH_SIZE = 1000
+
+# Member columns stored encrypted; import rows hold their plaintext until
+# the batch is inserted
+ENCRYPTED_COLUMNS = PII_FIELDS + ("custom_fields", "search_text")
+
+# Custom field -> CSV columns it is read from (Google Form question, then
+# the short header used by newer exports). Built once rather than spelling
+# the long headers out in the row loop.
+CUSTOM_FIELD_COLUMNS = (
+    ("where_learn", ("Where did you learn about IPA+?", "Referral source")),
+    ("superpower", (
+        "What personal talent, skill, experience, or superpower do you bring to the group? We believe everyone has a superpower!",
+        "Talent/skill",
+    )),
+    ("occupational_background", (
+        "What is your occupational background? Feel free to share your LinkedIn if you like. This helps us connect people to each other and to understand the skills and experience in the group.",
+        "Background",
+    )),
+    ("know_member", ("Do you know someone who is a member of IPA+? If so, who?", "Person they know")),
+    ("hoped_impact", (
+        "What impact do you hope to have by joining IPA+? (If you don't know, that's OK!)",
+        "Impact want to have",
+    )),
+    ("original_timestamp", ("Timestamp",)),
+)
 
 
 def unlock_vault():
@@ -90,15 +121,23 @@ def get_csv_field(row: dict, *candidate_keys: str) -> str:
     return ""
 
 
+def get_csv_email(row: dict) -> str:
+    """Return the row's email address, under either column name."""
+    return get_csv_field(row, "Email address (for newsletter)", "Email")
+
+
 def build_existing_member_set(db: Session) -> set[tuple[str, str]]:
     """
     Load all existing members and build a set of (normalized_full_name, normalized_phone)
     tuples for duplicate detection. Since PII is encrypted, we must decrypt each record.
     """
     existing = set()
-    members = db.query(Member).all()
+    members = db.query(Member).options(
+        load_only(Member._first_name, Member._last_name, Member._phone_number)
+    )
     for m in members:
         try:
+            m.decrypt_fields(("first_name", "last_name", "phone_number"))
             fname = normalize_name(m.first_name or "")
             lname = normalize_name(m.last_name or "")
             phone = normalize_phone(m.phone_number or "")
@@ -111,6 +150,87 @@ def build_existing_member_set(db: Session) -> set[tuple[str, str]]:
     return existing
 
 
+def build_existing_email_index(db: Session, blind_indexes: set[str]) -> dict[str, int]:
+    """
+    Map each of the given email blind indexes that already belongs to a
+    member to that member's ID, for email-only duplicate detection. Only the
+    file's own indexes are looked up, IMPORT_BATCH_SIZE per IN query, rather
+    than one query per CSV row or loading every member's index.
+    """
+    blind_indexes = sorted(blind_indexes - {""})
+    existing = {}
+    for i in range(0, len(blind_indexes), IMPORT_BATCH_SIZE):
+        existing.update(
+            db.query(Member.email_blind_index, Member.id)
+            .filter(Member.email_blind_index.in_(blind_indexes[i:i + IMPORT_BATCH_SIZE]))
+            .all()
+        )
+    return existing
+
+
+def encrypt_rows(rows: list[dict]) -> list[dict]:
+    """
+    Return copies of plaintext member rows with ENCRYPTED_COLUMNS encrypted,
+    the whole batch in one encrypt_many call. Empty custom fields and
+    search text are stored as NULL, as the model does.
+    """
+    ciphertexts = encryption_service.encrypt_many(
+        [row[column] for row in rows for column in ENCRYPTED_COLUMNS]
+    )
+    width = len(ENCRYPTED_COLUMNS)
+    encrypted = []
+    for i, row in enumerate(rows):
+        values = dict(zip(ENCRYPTED_COLUMNS, ciphertexts[i * width:(i + 1) * width]))
+        values["custom_fields"] = values["custom_fields"] or None
+        values["search_text"] = values["search_text"] or None
+        encrypted.append({**row, **values})
+    return encrypted
+
+
+def insert_members(
+    db: Session,
+    rows: list[dict],
+    vetter_id: int | None,
+    source: str,
+) -> None:
+    """
+    Encrypt a batch of plaintext member rows and insert them with one
+    executemany INSERT, then their search tokens and audit entries. Core
+    inserts bypass the Member flush events, so the rows must carry their
+    search text (see join_search_text); its tokens are written here.
+    """
+    members = Member.__table__
+    plaintext_rows, rows = rows, encrypt_rows(rows)
+    # RETURNING order is not guaranteed, and sort_by_parameter_order would
+    # fall back to one INSERT per row (members.id is not a sentinel column
+    # on SQLite). Every row has a first name, and its ciphertext has a
+    # random nonce, so it identifies the row instead.
+    returned = dict(db.execute(
+        insert(members).returning(members.c.first_name, members.c.id), rows
+    ).all())
+    ids = [returned[row["first_name"]] for row in rows]
+
+    tokens = [
+        {"token": token, "member_id": member_id}
+        for member_id, row in zip(ids, plaintext_rows)
+        for token in generate_search_tokens(row["search_text"])
+    ]
+    if tokens:
+        db.execute(insert(MemberSearchToken.__table__), tokens)
+
+    # Create audit log entries (only if user_id is provided)
+    if vetter_id:
+        audit_service.log_actions(db, [
+            {
+                "user_id": vetter_id,
+                "member_id": member_id,
+                "action": "CSV Import",
+                "details": f"Imported from {source} as {row['status'].value}",
+            }
+            for member_id, row in zip(ids, rows)
+        ])
+
+
 def decision_is_vetted(decision: str) -> bool:
     """Check if a CSV Decision value indicates the member was vetted."""
     d = decision.strip().lower()
@@ -147,182 +267,157 @@ def import_csv(
     }
 
     db: Session = SessionLocal()
+    source = Path(csv_file).name
+    # Plaintext member rows waiting for the next batch INSERT
+    pending_rows: list[dict] = []
 
     try:
+        with open(csv_file, 'r', encoding='utf-8', errors='replace') as f:
+            rows = list(csv.DictReader(f))
+
         # Build dedup sets
         if match_emails:
-            print("Using email-only duplicate detection...")
+            print("Loading existing email indexes for email-only duplicate detection...")
+            existing_emails = build_existing_email_index(
+                db, {generate_blind_index(get_csv_email(row)) for row in rows}
+            )
+            print(f"  Found {len(existing_emails)} emails already in the database")
+            # Blind index -> row number, for duplicates within the file
+            file_emails: dict[str, int] = {}
         else:
             print("Loading existing members for name+phone duplicate detection...")
             existing_name_phone = build_existing_member_set(db)
             print(f"  Found {len(existing_name_phone)} existing members")
 
-        with open(csv_file, 'r', encoding='utf-8', errors='replace') as f:
-            reader = csv.DictReader(f)
+        for row_num, row in enumerate(rows, start=2):  # Start at 2 (1 is header)
+            stats["total"] += 1
 
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (1 is header)
-                stats["total"] += 1
+            try:
+                # Parse name
+                full_name = row.get("Name", "").strip()
+                first_name, last_name = parse_name(full_name)
 
-                try:
-                    # Parse name
-                    full_name = row.get("Name", "").strip()
-                    first_name, last_name = parse_name(full_name)
+                if not first_name and not last_name:
+                    stats["skipped"] += 1
+                    stats["errors"].append(f"Row {row_num}: Empty name field")
+                    continue
 
-                    if not first_name and not last_name:
+                # Extract fields — support both old and new column name formats
+                street_address = get_csv_field(row, "Street address", "Street Address")
+                city = get_csv_field(row, "City")
+                zip_code = get_csv_field(row, "Zip code", "Zip")
+                phone_number = get_csv_field(row, "Phone number", "Phone")
+                email = get_csv_email(row)
+
+                # Duplicate detection
+                if match_emails:
+                    # Email-only dedup
+                    blind_index = generate_blind_index(email)
+                    if blind_index in existing_emails:
                         stats["skipped"] += 1
-                        stats["errors"].append(f"Row {row_num}: Empty name field")
+                        stats["duplicate_email"] += 1
+                        stats["errors"].append(
+                            f"Row {row_num}: Email already exists (Member ID: {existing_emails[blind_index]})"
+                        )
                         continue
-
-                    # Extract fields — support both old and new column name formats
-                    street_address = get_csv_field(row, "Street address", "Street Address")
-                    city = get_csv_field(row, "City")
-                    zip_code = get_csv_field(row, "Zip code", "Zip")
-                    phone_number = get_csv_field(row, "Phone number", "Phone")
-                    email = get_csv_field(row, "Email address (for newsletter)", "Email")
-
-                    # Duplicate detection
-                    if match_emails:
-                        # Email-only dedup
-                        if email:
-                            blind_index = generate_blind_index(email)
-                            existing = db.query(Member).filter(
-                                Member.email_blind_index == blind_index
-                            ).first()
-
-                            if existing:
-                                stats["skipped"] += 1
-                                stats["duplicate_email"] += 1
-                                stats["errors"].append(
-                                    f"Row {row_num}: Email already exists (Member ID: {existing.id})"
-                                )
-                                continue
-                    else:
-                        # Name+phone dedup
-                        norm_full = f"{normalize_name(first_name)} {normalize_name(last_name)}".strip()
-                        norm_phone = normalize_phone(phone_number)
-                        if (norm_full, norm_phone) in existing_name_phone:
-                            stats["skipped"] += 1
-                            stats["duplicate_name_phone"] += 1
-                            stats["errors"].append(
-                                f"Row {row_num}: Duplicate name+phone ({full_name} / {phone_number})"
-                            )
-                            continue
-
-                    # Build custom fields dictionary
-                    custom_fields = {}
-
-                    where_learn = get_csv_field(
-                        row, "Where did you learn about IPA+?", "Referral source"
-                    )
-                    if where_learn:
-                        custom_fields["where_learn"] = where_learn
-
-                    superpower = get_csv_field(
-                        row,
-                        "What personal talent, skill, experience, or superpower do you bring to the group? We believe everyone has a superpower!",
-                        "Talent/skill",
-                    )
-                    if superpower:
-                        custom_fields["superpower"] = superpower
-
-                    background = get_csv_field(
-                        row,
-                        "What is your occupational background? Feel free to share your LinkedIn if you like. This helps us connect people to each other and to understand the skills and experience in the group.",
-                        "Background",
-                    )
-                    if background:
-                        custom_fields["occupational_background"] = background
-
-                    know_member = get_csv_field(
-                        row, "Do you know someone who is a member of IPA+? If so, who?", "Person they know"
-                    )
-                    if know_member:
-                        custom_fields["know_member"] = know_member
-
-                    hoped_impact = get_csv_field(
-                        row,
-                        "What impact do you hope to have by joining IPA+? (If you don't know, that's OK!)",
-                        "Impact want to have",
-                    )
-                    if hoped_impact:
-                        custom_fields["hoped_impact"] = hoped_impact
-
-                    # Add timestamp if available
-                    if row.get("Timestamp"):
-                        custom_fields["original_timestamp"] = row["Timestamp"].strip()
-
-                    # Determine status from Decision column (or --vetted flag)
-                    csv_decision = get_csv_field(row, "Decision")
-                    csv_vetter = get_csv_field(row, "Vetter")
-                    if is_vetted:
-                        status = MemberStatus.VETTED
-                    elif csv_decision and decision_is_vetted(csv_decision):
-                        status = MemberStatus.VETTED
-                    elif csv_decision:
-                        # Decision exists but isn't yes/Y — keep as pending
-                        status = MemberStatus.PENDING
-                    else:
-                        # No decision at all — processed + archived
-                        status = MemberStatus.PROCESSED
-
-                    # Put CSV Notes into member.notes (visible/editable in detail view)
-                    csv_notes = get_csv_field(row, "Notes")
-                    member_notes = None
-                    note_parts = []
-                    if csv_vetter:
-                        note_parts.append(f"CSV Vetter: {csv_vetter}")
-                    if csv_decision:
-                        note_parts.append(f"CSV Decision: {csv_decision}")
-                    if csv_notes:
-                        note_parts.append(f"CSV Notes: {csv_notes}")
-                    if note_parts:
-                        member_notes = "\n".join(note_parts)
-
-                    # Create member with non-hybrid fields only
-                    member = Member(
-                        status=status,
-                        archived=(status == MemberStatus.PROCESSED and not is_vetted),
-                        assigned_vetter_id=vetter_id if status == MemberStatus.VETTED and vetter_id else None,
-                        notes=member_notes,
-                    )
-
-                    # Set encrypted fields via hybrid properties
-                    member.first_name = first_name
-                    member.last_name = last_name
-                    member.city = city
-                    member.zip_code = zip_code
-                    member.street_address = street_address
-                    member.phone_number = phone_number
-                    member.email = email  # This also sets the blind index
-                    member.custom_fields = custom_fields
-
-                    db.add(member)
-                    db.flush()  # Get the member ID
-
-                    # Track the newly added member for within-file dedup
-                    if not match_emails:
-                        existing_name_phone.add((norm_full, norm_phone))
-
-                    # Create audit log entry (only if user_id is provided)
-                    if vetter_id:
-                        audit = AuditLog(
-                            user_id=vetter_id,
-                            member_id=member.id,
-                            action="CSV Import",
-                            details=f"Imported from {Path(csv_file).name} as {status.value}"
+                    if blind_index in file_emails:
+                        stats["skipped"] += 1
+                        stats["duplicate_email"] += 1
+                        stats["errors"].append(
+                            f"Row {row_num}: Email duplicates row {file_emails[blind_index]}"
                         )
-                        db.add(audit)
-
-                    stats["success"] += 1
-                    if status == MemberStatus.VETTED:
-                        stats["imported_vetted"] += 1
-                    else:
-                        stats["imported_pending"] += 1
+                        continue
+                else:
+                    # Name+phone dedup
+                    norm_full = f"{normalize_name(first_name)} {normalize_name(last_name)}".strip()
+                    norm_phone = normalize_phone(phone_number)
+                    if (norm_full, norm_phone) in existing_name_phone:
+                        stats["skipped"] += 1
+                        stats["duplicate_name_phone"] += 1
+                        stats["errors"].append(
+                            f"Row {row_num}: Duplicate name+phone ({full_name} / {phone_number})"
+                        )
+                        continue
 
-                except Exception as e:
-                    stats["skipped"] += 1
-                    stats["errors"].append(f"Row {row_num}: {str(e)}")
-                    continue
+                # Build custom fields dictionary
+                custom_fields = {}
+                for field, candidate_keys in CUSTOM_FIELD_COLUMNS:
+                    value = get_csv_field(row, *candidate_keys)
+                    if value:
+                        custom_fields[field] = value
+
+                # Determine status from Decision column (or --vetted flag)
+                csv_decision = get_csv_field(row, "Decision")
+                csv_vetter = get_csv_field(row, "Vetter")
+                if is_vetted:
+                    status = MemberStatus.VETTED
+                elif csv_decision and decision_is_vetted(csv_decision):
+                    status = MemberStatus.VETTED
+                elif csv_decision:
+                    # Decision exists but isn't yes/Y — keep as pending
+                    status = MemberStatus.PENDING
+                else:
+                    # No decision at all — resting (IN_SIGNAL, formerly PROCESSED) + archived
+                    status = MemberStatus.IN_SIGNAL
+
+                # Put CSV Notes into member.notes (visible/editable in detail view)
+                csv_notes = get_csv_field(row, "Notes")
+                member_notes = None
+                note_parts = []
+                if csv_vetter:
+                    note_parts.append(f"CSV Vetter: {csv_vetter}")
+                if csv_decision:
+                    note_parts.append(f"CSV Decision: {csv_decision}")
+                if csv_notes:
+                    note_parts.append(f"CSV Notes: {csv_notes}")
+                if note_parts:
+                    member_notes = "\n".join(note_parts)
+
+                # Plain column values for a Core INSERT; no ORM instance
+                # is needed. Encrypted when the batch is inserted.
+                member_row = {
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "city": city,
+                    "zip_code": zip_code,
+                    "street_address": street_address,
+                    "phone_number": phone_number,
+                    "email": email,
+                }
+                member_row.update(
+                    email_blind_index=blind_index if match_emails else generate_blind_index(email),
+                    custom_fields=json.dumps(custom_fields) if custom_fields else "",
+                    search_text=join_search_text(member_row, custom_fields),
+                    status=status,
+                    archived=(status == MemberStatus.IN_SIGNAL and not is_vetted),
+                    assigned_vetter_id=vetter_id if status == MemberStatus.VETTED and vetter_id else None,
+                    notes=member_notes,
+                )
+                pending_rows.append(member_row)
+
+                # Track the newly added member for within-file dedup
+                if not match_emails:
+                    existing_name_phone.add((norm_full, norm_phone))
+                elif blind_index:
+                    file_emails[blind_index] = row_num
+
+                stats["success"] += 1
+                if status == MemberStatus.VETTED:
+                    stats["imported_vetted"] += 1
+                else:
+                    stats["imported_pending"] += 1
+
+            except Exception as e:
+                stats["skipped"] += 1
+                stats["errors"].append(f"Row {row_num}: {str(e)}")
+                continue
+
+            if len(pending_rows) >= IMPORT_BATCH_SIZE:
+                insert_members(db, pending_rows, vetter_id, source)
+                pending_rows = []
+
+        if pending_rows:
+            insert_members(db, pending_rows, vetter_id, source)
 
         # Commit all changes
         db.commit()
@@ -20,11 +20,12 @@ from pathlib import Path
 # Add the app directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
 
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Enum, ForeignKey, inspect
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, DateTime, Enum, ForeignKey, inspect
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.sql import text
 
 from app.config import settings
+from app.database import set_sqlite_pragma
 from app.services.encryption import encryption_service
 
 Base = declarative_base()
@@ -174,22 +175,26 @@ def populate_custom_fields(engine, member_data):
     """Populate the custom_fields column with encrypted JSON data."""
     print("\nPopulating custom_fields data...")
 
-    with engine.connect() as conn:
-        for member in member_data:
-            # Encrypt custom fields JSON
-            if member['custom_fields']:
-                json_str = json.dumps(member['custom_fields'])
-                encrypted_json = encryption_service.encrypt(json_str)
-            else:
-                encrypted_json = None
-
-            # Update the member record
-            conn.execute(
-                text("UPDATE members SET custom_fields = :custom_fields WHERE id = :id"),
-                {"custom_fields": encrypted_json, "id": member['id']}
-            )
-
-        conn.commit()
+    if not member_data:
+        print("✓ No members to populate")
+        return
+
+    # Encrypt every member's JSON in one batch (empty dicts stay NULL)
+    encrypted = encryption_service.encrypt_many([
+        json.dumps(member['custom_fields']) if member['custom_fields'] else ""
+        for member in member_data
+    ])
+
+    # One transaction, committed on exit (rolled back on error)
+    with engine.begin() as conn:
+        # Update the member records in one executemany
+        conn.execute(
+            text("UPDATE members SET custom_fields = :custom_fields WHERE id = :id"),
+            [
+                {"custom_fields": encrypted_json or None, "id": member['id']}
+                for member, encrypted_json in zip(member_data, encrypted)
+            ]
+        )
 
     print(f"✓ Populated custom_fields for {len(member_data)} members")
 
@@ -238,6 +243,8 @@ def main():
 
         # Connect to database
         engine = create_engine(settings.DATABASE_URL)
+        # Same PRAGMAs as the app (WAL, synchronous=NORMAL, larger cache)
+        event.listen(engine, "connect", set_sqlite_pragma)
 
         # Read old data
         member_data = read_old_data(engine)
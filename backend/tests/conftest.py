@@ -6,19 +6,24 @@ Provides:
 - Encryption service initialization
 - Reusable fixtures for admin, vetter, and member creation
 - Auth helper to get JWT tokens
+- SQL statement recorder
 """
 
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.main import app, initialize_app
 from app.database import Base, get_db
 from app.models.user import User, UserRole
 from app.models.member import Member, MemberStatus
 from app.models.audit_log import AuditLog
-from app.services.auth import hash_password
+from app.models.search_token import MemberSearchToken
+from app.services.auth import hash_password, pwd_context
 from app.services.encryption import encryption_service
 from app.config import settings
 
@@ -26,9 +31,14 @@ from app.config import settings
 # Database & encryption setup
 # ---------------------------------------------------------------------------
 
-TEST_DB_URL = "sqlite:///./test_suite.db"
-engine = create_engine(TEST_DB_URL, connect_args={"check_same_thread": False})
+# One in-memory database shared by every session: StaticPool hands out the
+# same connection, so tests never touch the disk
+TEST_DB_URL = "sqlite://"
+engine = create_engine(TEST_DB_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool)
 TestSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Request sessions mirror SessionLocal (no expire on commit); the fixture
+# session keeps the default so tests see writes made by the API.
+RequestSession = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Ensure encryption is initialized for tests
 _TEST_KEY = "UJiLdEHqngyMSWzs4a70Y11rQ70faKLG4AdNo-PW0GM="  # Valid Fernet key for tests
@@ -45,6 +55,14 @@ if not settings.ENCRYPTION_KEY:
 object.__setattr__(settings, "RESEND_API_KEY", None)
 object.__setattr__(settings, "NOTIFICATION_EMAIL", None)
 
+# Accidental N+1 lazy loads fail tests instead of only being logged
+object.__setattr__(settings, "LAZY_LOADS", "raise")
+
+# bcrypt at its minimum cost (4 rounds instead of 12): hash strength is
+# irrelevant here, and the user fixtures and logins hash or verify a
+# password in most tests
+pwd_context.update(bcrypt__rounds=4)
+
 try:
     encryption_service.initialize(settings.ENCRYPTION_KEY)
 except Exception:
@@ -52,7 +70,7 @@ except Exception:
 
 
 def override_get_db():
-    db = TestSession()
+    db = RequestSession()
     try:
         yield db
     finally:
@@ -76,11 +94,14 @@ def create_tables():
 
 @pytest.fixture(autouse=True)
 def reset_rate_limiters():
-    """Reset failed-attempt throttling between tests so failed-login
-    tests can't trip the limiter for later tests."""
+    """Reset failed-attempt and reclaim throttling between tests so
+    failed-login tests can't trip the limiter for later tests, and each
+    test's first auto-assignment reclaims stale members."""
+    from app.routers.auth import reset_reclaim_throttle
     from app.services.rate_limit import login_limiter, unlock_limiter
     login_limiter.reset()
     unlock_limiter.reset()
+    reset_reclaim_throttle()
     yield
 
 
@@ -90,6 +111,7 @@ def clean_tables():
     yield
     db = TestSession()
     db.query(AuditLog).delete()
+    db.query(MemberSearchToken).delete()
     db.query(Member).delete()
     db.query(User).delete()
     db.commit()
@@ -263,3 +285,23 @@ def vetter_token(client, vetter_user):
 def vetter2_token(client, vetter_user2):
     """Return a valid second vetter JWT token."""
     return login(client, "vetter2", "vetter-password")
+
+
+# ---------------------------------------------------------------------------
+# SQL statement recorder
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def record_statements(db):
+    """Collect the SQL statements executed on the test engine in the block."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
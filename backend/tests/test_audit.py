@@ -1,7 +1,11 @@
 """Tests for the audit logging service."""
 
+from fastapi import BackgroundTasks
+
 from app.services.audit import audit_service
 from app.models.audit_log import AuditLog
+from app.config import settings
+from tests.conftest import record_statements
 
 
 def test_log_action_creates_entry(db, admin_user, pending_member):
@@ -13,6 +17,7 @@ def test_log_action_creates_entry(db, admin_user, pending_member):
         action="TEST_ACTION",
         details="Test details",
     )
+    db.commit()
     assert entry.id is not None
     assert entry.user_id == admin_user.id
     assert entry.member_id == pending_member.id
@@ -30,6 +35,7 @@ def test_log_action_with_null_member_id(db, admin_user):
         action="SYSTEM_ACTION",
         details="No specific member",
     )
+    db.commit()
     assert entry.id is not None
     assert entry.member_id is None
 
@@ -42,6 +48,7 @@ def test_log_action_persists_to_database(db, admin_user, pending_member):
         member_id=pending_member.id,
         action="PERSIST_TEST",
     )
+    db.commit()
     logs = db.query(AuditLog).filter(AuditLog.action == "PERSIST_TEST").all()
     assert len(logs) == 1
     assert logs[0].user_id == admin_user.id
@@ -56,7 +63,87 @@ def test_multiple_log_entries(db, admin_user, pending_member):
             member_id=pending_member.id,
             action=f"ACTION_{i}",
         )
+    db.commit()
     logs = db.query(AuditLog).filter(
         AuditLog.member_id == pending_member.id
     ).all()
     assert len(logs) == 3
+
+
+def test_log_action_is_staged_until_commit(db, admin_user):
+    """Entries join the caller's transaction: a rollback discards them."""
+    audit_service.log_action(
+        db=db,
+        user_id=admin_user.id,
+        member_id=None,
+        action="ROLLED_BACK",
+    )
+    db.rollback()
+    assert db.query(AuditLog).filter(AuditLog.action == "ROLLED_BACK").count() == 0
+
+
+def test_writes_only_level_skips_read_events(db, admin_user, pending_member, monkeypatch):
+    """AUDIT_LEVEL=writes_only drops detail views and searches, not writes."""
+    monkeypatch.setattr(settings, "AUDIT_LEVEL", "writes_only")
+    for action in ("VIEWED_PII", "SEARCHED_MEMBERS", "STATUS_CHANGED"):
+        audit_service.log_action(
+            db=db,
+            user_id=admin_user.id,
+            member_id=pending_member.id,
+            action=action,
+        )
+    db.commit()
+    actions = [log.action for log in db.query(AuditLog).all()]
+    assert actions == ["STATUS_CHANGED"]
+
+
+def test_log_actions_bulk_inserts_in_callers_transaction(db, admin_user, pending_member):
+    """log_actions writes all entries in one INSERT with a shared timestamp,
+    and they roll back with the caller's transaction."""
+    entries = [
+        {"user_id": admin_user.id, "member_id": pending_member.id, "action": "TAGS_UPDATED"},
+        {"user_id": admin_user.id, "member_id": None, "action": "BULK_TAGS_UPDATE", "details": "1 member"},
+    ]
+    with record_statements(db) as statements:
+        audit_service.log_actions(db, entries)
+    assert len([s for s in statements if s.startswith("INSERT INTO audit_logs")]) == 1
+
+    logs = db.query(AuditLog).order_by(AuditLog.id).all()
+    assert [log.action for log in logs] == ["TAGS_UPDATED", "BULK_TAGS_UPDATE"]
+    assert logs[0].details is None and logs[1].details == "1 member"
+    assert logs[0].timestamp == logs[1].timestamp
+
+    db.rollback()
+    assert db.query(AuditLog).count() == 0
+
+
+def test_log_read_writes_queued_events_in_one_insert(db, admin_user, pending_member):
+    """Read events are written after the response, batched into one INSERT."""
+    tasks = BackgroundTasks()
+    for _ in range(3):
+        audit_service.log_read(
+            tasks,
+            db=db,
+            user_id=admin_user.id,
+            member_id=pending_member.id,
+            action="VIEWED_PII",
+        )
+    assert db.query(AuditLog).count() == 0
+
+    with record_statements(db) as statements:
+        audit_service.write_queued()
+        audit_service.write_queued()  # nothing left to write
+
+    inserts = [s for s in statements if s.startswith("INSERT INTO audit_logs")]
+    assert len(inserts) == 1
+    assert db.query(AuditLog).filter(AuditLog.action == "VIEWED_PII").count() == 3
+
+
+def test_log_read_respects_writes_only(db, admin_user, monkeypatch):
+    """AUDIT_LEVEL=writes_only drops read events before they are queued."""
+    monkeypatch.setattr(settings, "AUDIT_LEVEL", "writes_only")
+    tasks = BackgroundTasks()
+    audit_service.log_read(
+        tasks, db=db, user_id=admin_user.id, member_id=None, action="SEARCHED_MEMBERS",
+    )
+    assert tasks.tasks == []
@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 from tests.conftest import make_member, auth_header
+from app.models.audit_log import AuditLog
 from app.models.member import Member, MemberStatus
 
 
@@ -51,6 +52,29 @@ def test_login_inactive_user(client, inactive_user):
 
 # ── Auto-assign on vetter login ───────────────────────────────────────────
 
+def test_repeat_login_skips_password_hash(client, db, admin_user, monkeypatch):
+    """A repeat successful login is served from the verification cache,
+    and a password change invalidates it."""
+    import app.routers.auth as auth_router
+    from app.services.auth import hash_password
+
+    calls = []
+    original = auth_router.verify_password
+    monkeypatch.setattr(
+        auth_router, "verify_password",
+        lambda pw, hashed: calls.append(pw) or original(pw, hashed),
+    )
+    creds = {"username": "admin", "password": "admin-password"}
+
+    assert client.post("/api/auth/login", json=creds).status_code == 200
+    assert client.post("/api/auth/login", json=creds).status_code == 200
+    assert len(calls) == 1
+
+    admin_user.hashed_password = hash_password("new-password")
+    db.commit()
+    assert client.post("/api/auth/login", json=creds).status_code == 401
+
+
 def test_vetter_login_auto_assigns_pending_member(client, db, vetter_user):
     """When a vetter logs in, the oldest pending member is auto-assigned."""
     m = make_member(db, email="pending@test.com")
@@ -109,6 +133,92 @@ def test_stale_assignment_reclaimed_on_login(client, db, vetter_user, vetter_use
     assert m.assigned_vetter_id == vetter_user2.id
     assert m.status == MemberStatus.ASSIGNED
 
+    reclaimed = db.query(AuditLog).filter(AuditLog.action == "ASSIGNMENT_RECLAIMED").all()
+    assert [(e.member_id, e.user_id) for e in reclaimed] == [(m.id, None)]
+    assert f"from vetter {vetter_user.id}" in reclaimed[0].details
+
+
+def test_login_reclaim_is_throttled(client, db, vetter_user, vetter_user2):
+    """Opportunistic reclaim runs at most once per interval across logins."""
+    from app.routers.auth import auto_assign_next_member
+
+    auto_assign_next_member(db, vetter_user.id)  # uses up this interval's reclaim
+    m = make_member(
+        db,
+        email="stale2@test.com",
+        status=MemberStatus.ASSIGNED,
+        assigned_vetter_id=vetter_user.id,
+    )
+    db.execute(
+        Member.__table__.update()
+        .where(Member.__table__.c.id == m.id)
+        .values(updated_at=datetime.utcnow() - timedelta(days=8))
+    )
+    db.commit()
+
+    client.post("/api/auth/login", json={
+        "username": "vetter2",
+        "password": "vetter-password",
+    })
+
+    db.refresh(m)
+    assert m.assigned_vetter_id == vetter_user.id
+    assert m.status == MemberStatus.ASSIGNED
+
+
+def test_reclaim_uses_given_now(db, vetter_user):
+    """Staleness is measured from the caller's `now`, with one timestamp
+    shared by the whole batch's audit rows."""
+    from app.routers.auth import reclaim_stale_assignments
+
+    m = make_member(
+        db,
+        email="fresh@test.com",
+        status=MemberStatus.ASSIGNED,
+        assigned_vetter_id=vetter_user.id,
+    )
+    assert reclaim_stale_assignments(db) == 0
+
+    later = datetime.utcnow() + timedelta(days=8)
+    assert reclaim_stale_assignments(db, now=later) == 1
+    db.commit()
+    entry = db.query(AuditLog).filter(AuditLog.member_id == m.id).one()
+    assert entry.timestamp == later
+
+
+def test_reclaim_skips_member_reassigned_after_select(db, vetter_user, vetter_user2):
+    """A member that stops being stale between the SELECT and the UPDATE is
+    neither reset, audited nor counted."""
+    from sqlalchemy import event
+    from app.routers.auth import reclaim_stale_assignments
+
+    kept = make_member(db, email="kept@test.com", status=MemberStatus.ASSIGNED,
+                       assigned_vetter_id=vetter_user.id)
+    reclaimed = make_member(db, email="gone@test.com", status=MemberStatus.ASSIGNED,
+                            assigned_vetter_id=vetter_user.id)
+    later = datetime.utcnow() + timedelta(days=8)
+
+    def reassign(conn, cursor, statement, parameters, context, executemany):
+        # Another vetter picks the member up just before the reclaim UPDATE
+        if statement.startswith("UPDATE members SET status"):
+            conn.connection.cursor().execute(
+                "UPDATE members SET assigned_vetter_id = ?, updated_at = ? WHERE id = ?",
+                (vetter_user2.id, later, kept.id),
+            )
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", reassign)
+    try:
+        assert reclaim_stale_assignments(db, now=later) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", reassign)
+    db.commit()
+
+    db.refresh(kept)
+    assert kept.status == MemberStatus.ASSIGNED
+    assert kept.assigned_vetter_id == vetter_user2.id
+    assert [a.member_id for a in db.query(AuditLog).filter(AuditLog.action == "ASSIGNMENT_RECLAIMED")] == [reclaimed.id]
+
 
 def test_manual_reclaim_stale_admin_only(client, admin_token, vetter_token):
     """Only admins can manually trigger stale reclamation."""
@@ -1,6 +1,10 @@
 """Tests for the blind index service."""
 
-from app.services.blind_index import generate_blind_index
+import hashlib
+
+from app.config import settings
+from app.services import blind_index
+from app.services.blind_index import generate_blind_index, generate_search_tokens
 
 
 def test_consistent_hash_for_same_email():
@@ -40,3 +44,22 @@ def test_empty_string_returns_empty():
 def test_none_returns_empty():
     """None input returns empty string."""
     assert generate_blind_index(None) == ""
+
+
+def test_matches_stored_index_format():
+    """Index stays sha256(normalized email + salt) so stored rows still match."""
+    expected = hashlib.sha256(
+        f"test@example.com{settings.EMAIL_BLIND_INDEX_SALT}".encode()
+    ).hexdigest()
+    assert generate_blind_index(" Test@Example.com ") == expected
+
+
+def test_keys_derived_once_per_salt(monkeypatch):
+    """Salt encoding and the search-token key are cached until the salt changes."""
+    tokens = generate_search_tokens("abc")
+    keys = blind_index._salt_keys()
+    generate_search_tokens("abcd")
+    assert blind_index._salt_keys() is keys
+
+    monkeypatch.setattr(settings, "EMAIL_BLIND_INDEX_SALT", "rotated-salt")
+    assert generate_search_tokens("abc") != tokens
@@ -0,0 +1,37 @@
+"""Tests for the JSON config file cache."""
+
+import json
+import os
+
+from app.utils.config_cache import load_json_config, load_json_config_bytes
+
+
+def _write(path, data):
+    tmp = str(path) + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def test_returns_cached_object_until_file_changes(tmp_path):
+    path = tmp_path / "config.json"
+    _write(path, {"fields": []})
+
+    first = load_json_config(str(path))
+    assert first == {"fields": []}
+    assert load_json_config(str(path)) is first
+
+    _write(path, {"fields": ["email"]})
+    assert load_json_config(str(path)) == {"fields": ["email"]}
+
+
+def test_encoded_bytes_follow_reloads(tmp_path):
+    path = tmp_path / "config.json"
+    _write(path, {"fields": []})
+
+    body = load_json_config_bytes(str(path))
+    assert json.loads(body) == {"fields": []}
+    assert load_json_config_bytes(str(path)) is body
+
+    _write(path, {"fields": ["email"]})
+    assert json.loads(load_json_config_bytes(str(path))) == {"fields": ["email"]}
@@ -0,0 +1,57 @@
+"""Tests for the session-wide lazy-load guard."""
+
+import logging
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, create_engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, declarative_base, relationship, selectinload
+
+from app.config import settings
+
+# Throwaway models: no app model declares a relationship yet
+LocalBase = declarative_base()
+
+
+class Parent(LocalBase):
+    __tablename__ = "parents"
+    id = Column(Integer, primary_key=True)
+    children = relationship("Child")
+
+
+class Child(LocalBase):
+    __tablename__ = "children"
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(Integer, ForeignKey("parents.id"))
+
+
+@pytest.fixture
+def local_engine():
+    engine = create_engine("sqlite://")
+    LocalBase.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Parent(id=1, children=[Child(id=1)]))
+        session.commit()
+    return engine
+
+
+def test_lazy_load_raises_in_raise_mode(local_engine):
+    """conftest runs the suite with LAZY_LOADS="raise"."""
+    with Session(local_engine) as session:
+        parent = session.get(Parent, 1)
+        with pytest.raises(InvalidRequestError):
+            parent.children
+
+
+def test_eager_load_overrides_raise(local_engine):
+    with Session(local_engine) as session:
+        parent = session.query(Parent).options(selectinload(Parent.children)).one()
+        assert [child.id for child in parent.children] == [1]
+
+
+def test_lazy_load_logged_in_log_mode(local_engine, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "LAZY_LOADS", "log")
+    with Session(local_engine) as session, caplog.at_level(logging.WARNING):
+        parent = session.get(Parent, 1)
+        assert len(parent.children) == 1
+    assert "Lazy load on Parent" in caplog.text
@@ -1,6 +1,11 @@
 """Tests for the encryption service."""
 
+import base64
+
 import pytest
+from cryptography.fernet import Fernet, InvalidToken
+
+from app.config import settings
 from app.services.encryption import EncryptionService, encryption_service
 
 
@@ -26,10 +31,10 @@ def test_different_plaintexts_produce_different_ciphertexts():
 
 
 def test_same_plaintext_produces_different_ciphertexts():
-    """Fernet includes randomness — same input gives different ciphertext each time."""
+    """Encryption is randomized — same input gives different ciphertext each time."""
     c1 = encryption_service.encrypt("same-input")
     c2 = encryption_service.encrypt("same-input")
-    assert c1 != c2  # Fernet uses random IV
+    assert c1 != c2  # random nonce
     # But both decrypt to the same value
     assert encryption_service.decrypt(c1) == encryption_service.decrypt(c2)
 
@@ -51,3 +56,60 @@ def test_uninitialized_service_raises():
     svc = EncryptionService()
     with pytest.raises(RuntimeError, match="not initialized"):
         svc.encrypt("test")
+
+
+def test_decrypt_many_round_trip():
+    """decrypt_many preserves order and maps empty ciphertexts to empty strings."""
+    values = ["alice@example.com", "", "Oakland"]
+    ciphertexts = [encryption_service.encrypt(v) for v in values]
+    assert encryption_service.decrypt_many(ciphertexts) == values
+
+
+def test_uninitialized_cipher_property_raises():
+    """The cipher property reports the same error before initialization."""
+    svc = EncryptionService()
+    with pytest.raises(RuntimeError, match="not initialized"):
+        svc.cipher
+    with pytest.raises(RuntimeError, match="not initialized"):
+        svc.decrypt_many(["x"])
+
+
+def test_initialize_rebinds_cipher_methods():
+    """Re-initializing with a new key switches the bound encrypt/decrypt."""
+    svc = EncryptionService()
+    svc.initialize(Fernet.generate_key().decode())
+    old = svc.encrypt("rotated")
+    svc.initialize(Fernet.generate_key().decode())
+    assert svc.decrypt(svc.encrypt("rotated")) == "rotated"
+    with pytest.raises(InvalidToken):
+        svc.decrypt(old)
+
+
+def test_new_ciphertexts_are_aes_gcm_tokens():
+    """New values use the versioned AES-GCM format, not Fernet."""
+    ciphertext = encryption_service.encrypt("gcm@example.com")
+    assert ciphertext.startswith("A")
+    assert base64.urlsafe_b64decode(ciphertext)[:1] == b"\x02"
+
+
+def test_legacy_fernet_ciphertexts_still_decrypt():
+    """Rows written before the switch (Fernet tokens) remain readable."""
+    legacy = Fernet(settings.ENCRYPTION_KEY.encode()).encrypt(b"legacy value").decode()
+    assert encryption_service.decrypt(legacy) == "legacy value"
+    assert encryption_service.decrypt_many([legacy, ""]) == ["legacy value", ""]
+
+
+def test_tampered_aes_gcm_ciphertext_rejected():
+    """A modified GCM token fails authentication with InvalidToken."""
+    raw = bytearray(base64.urlsafe_b64decode(encryption_service.encrypt("integrity")))
+    raw[-1] ^= 1
+    with pytest.raises(InvalidToken):
+        encryption_service.decrypt(base64.urlsafe_b64encode(bytes(raw)).decode())
+
+
+def test_encrypt_many_round_trip_with_unique_nonces():
+    """Batch encryption keeps empty values empty and gives each value its own nonce."""
+    ciphertexts = encryption_service.encrypt_many(["same", "", "same"])
+    assert ciphertexts[1] == ""
+    assert ciphertexts[0] != ciphertexts[2]
+    assert encryption_service.decrypt_many(ciphertexts) == ["same", "", "same"]
@@ -442,6 +442,29 @@ def test_group_admin_cannot_edit_another_group_admin(client, db, group_admin_tok
     assert resp.status_code == 403
 
 
+def test_group_admin_password_change_forbidden_before_hashing(client, db, admin_user, group_admin_token, monkeypatch):
+    """A forbidden password change is rejected without running bcrypt."""
+    from app.routers import users
+
+    def fail_hash(password):
+        raise AssertionError("hash_password called for a forbidden update")
+
+    monkeypatch.setattr(users, "hash_password", fail_hash)
+    resp = client.patch(
+        f"/api/users/{admin_user.id}",
+        headers=auth_header(group_admin_token),
+        json={"password": "new-password-123"},
+    )
+    assert resp.status_code == 403
+
+    resp = client.patch(
+        "/api/users/999999",
+        headers=auth_header(group_admin_token),
+        json={"password": "new-password-123"},
+    )
+    assert resp.status_code == 404
+
+
 def test_group_admin_can_change_vetter_password(client, db, group_admin_token):
     """GROUP_ADMIN can reset a vetter's password."""
     vetter = User(
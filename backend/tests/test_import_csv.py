@@ -0,0 +1,90 @@
+"""Tests for the CSV import script."""
+
+import csv
+
+import pytest
+
+import import_csv
+from app.models.audit_log import AuditLog
+from app.models.member import Member, MemberStatus
+from app.models.search_token import MemberSearchToken
+from app.services.blind_index import generate_blind_index
+from tests.conftest import TestSession, make_member, record_statements
+
+
+@pytest.fixture(autouse=True)
+def test_session(monkeypatch):
+    monkeypatch.setattr(import_csv, "SessionLocal", TestSession)
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["Name", "City", "Zip", "Phone", "Email", "Decision", "Talent/skill"])
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+
+def _row(name, email, phone="555-0100", decision="yes", talent=""):
+    return {
+        "Name": name, "City": "Springfield", "Zip": "62701", "Phone": phone,
+        "Email": email, "Decision": decision, "Talent/skill": talent,
+    }
+
+
+def test_imports_rows_with_search_text_tokens_and_audit(db, tmp_path, vetter_user):
+    path = _write_csv(tmp_path / "members.csv", [
+        _row("Ada Lovelace", "ada@example.com", talent="Engines"),
+        _row("Alan Turing", "alan@example.com", decision="maybe"),
+    ])
+
+    stats = import_csv.import_csv(path, vetter_id=vetter_user.id)
+
+    assert stats["success"] == 2 and stats["errors"] == []
+    ada, alan = db.query(Member).order_by(Member.id).all()
+    assert ada.first_name == "Ada" and ada.last_name == "Lovelace"
+    assert ada.email_blind_index == generate_blind_index("ada@example.com")
+    assert ada.custom_fields == {"superpower": "Engines"}
+    assert ada.status == MemberStatus.VETTED and ada.assigned_vetter_id == vetter_user.id
+    assert "engines" in ada.search_text and ada._search_text
+    assert alan.status == MemberStatus.PENDING and alan.assigned_vetter_id is None
+    assert db.query(MemberSearchToken).filter_by(member_id=alan.id).count() > 0
+    assert {(a.member_id, a.details) for a in db.query(AuditLog)} == {
+        (ada.id, "Imported from members.csv as VETTED"),
+        (alan.id, "Imported from members.csv as PENDING"),
+    }
+
+
+def test_inserts_in_batches(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(import_csv, "IMPORT_BATCH_SIZE", 2)
+    path = _write_csv(tmp_path / "members.csv", [
+        _row(f"Person {i}", f"p{i}@example.com", phone=f"555-010{i}") for i in range(5)
+    ])
+
+    with record_statements(db) as statements:
+        stats = import_csv.import_csv(path)
+
+    assert stats["success"] == 5
+    assert db.query(Member).count() == 5
+    assert len([s for s in statements if s.startswith("INSERT INTO members")]) == 3
+
+
+def test_email_dedup_against_database_and_file(db, tmp_path):
+    existing = make_member(db, email="taken@example.com")
+    path = _write_csv(tmp_path / "members.csv", [
+        _row("Ada Lovelace", "taken@example.com"),
+        _row("Alan Turing", "alan@example.com"),
+        _row("Alan Again", "ALAN@example.com"),
+    ])
+
+    with record_statements(db) as statements:
+        stats = import_csv.import_csv(path, match_emails=True)
+
+    lookups = [s for s in statements if s.startswith("SELECT members.email_blind_index")]
+    assert len(lookups) == 1 and " IN (" in lookups[0]
+    assert stats["success"] == 1
+    assert stats["duplicate_email"] == 2
+    assert stats["errors"] == [
+        f"Row 2: Email already exists (Member ID: {existing.id})",
+        "Row 4: Email duplicates row 3",
+    ]
@@ -0,0 +1,91 @@
+"""Tests for the lock middleware and health probes."""
+
+import pytest
+
+import app.main as main
+from app.vault import vault_manager
+
+
+@pytest.fixture
+def locked(monkeypatch):
+    monkeypatch.setattr(main, "_VAULT_MODE", True)
+    monkeypatch.setattr(vault_manager, "_unlocked", False)
+
+
+def test_unlocked_requests_pass_through(client):
+    assert client.get("/api/health").json() == {"status": "healthy"}
+
+
+def test_locked_blocks_api_routes(client, locked):
+    response = client.get("/api/members/")
+    assert response.status_code == 503
+    assert "locked" in response.json()["detail"]
+
+
+def test_locked_allows_health_and_unlock(client, locked):
+    assert client.get("/api/health").json() == {"status": "locked"}
+    assert client.get("/api/unlock").status_code == 200
+
+
+def test_unlock_error_page_is_prerendered(client, locked, monkeypatch, tmp_path):
+    monkeypatch.setattr(vault_manager, "get_vault_path", lambda: str(tmp_path / "missing.vault"))
+    response = client.post("/api/unlock", data={"password": "anything"})
+    assert response.status_code == 500
+    assert "Vault file not found" in response.text
+    assert "* { margin: 0;" in response.text
+    assert "$error" not in response.text
+
+
+@pytest.fixture
+def starting(monkeypatch):
+    monkeypatch.setattr(main, "_startup_task", object())
+    monkeypatch.setattr(main, "app_ready", main.threading.Event())
+
+
+def test_starting_blocks_api_routes(client, starting):
+    response = client.get("/api/members/")
+    assert response.status_code == 503
+    assert "starting" in response.json()["detail"]
+    assert client.get("/api/health").json() == {"status": "starting"}
+
+
+def test_liveness_and_readiness_probes(client, starting):
+    assert client.get("/api/health/live").status_code == 200
+    assert client.get("/api/health/ready").status_code == 503
+
+    main.app_ready.set()
+    assert client.get("/api/health/ready").json() == {"status": "ready"}
+    assert client.get("/api/health").json() == {"status": "healthy"}
+
+
+def test_failed_startup_reports_unhealthy(client, monkeypatch):
+    monkeypatch.setattr(main, "_startup_task", object())
+    monkeypatch.setattr(main, "_startup_failed", False)
+    monkeypatch.setattr(main, "app_ready", main.threading.Event())
+
+    def fail():
+        raise RuntimeError("migration failed")
+
+    monkeypatch.setattr(main, "initialize_app", fail)
+    main.asyncio.run(main.deferred_initialize())
+
+    response = client.get("/api/health")
+    assert response.status_code == 503
+    assert response.json() == {"status": "failed"}
+    assert client.get("/api/health/ready").status_code == 503
+    assert client.get("/api/health/live").status_code == 200
+    response = client.get("/api/members/")
+    assert response.status_code == 503
+    assert "failed to start" in response.json()["detail"]
+
+
+def test_initialize_app_skips_when_already_initialized(monkeypatch):
+    ready = main.threading.Event()
+    ready.set()
+    monkeypatch.setattr(main, "app_ready", ready)
+
+    def fail():
+        raise AssertionError("initialize_app ran twice")
+
+    monkeypatch.setattr(main, "validate_secrets", fail)
+    main.initialize_app()
@@ -0,0 +1,166 @@
+"""Tests for Member PII encryption and plaintext memoization."""
+
+from app.models.member import Member, build_search_text, decrypt_members
+from app.models.search_token import MemberSearchToken
+from app.services.blind_index import generate_search_tokens
+from app.services.encryption import encryption_service
+
+
+def _count_decrypts(monkeypatch):
+    calls = []
+    original = encryption_service.decrypt
+
+    def counting_decrypt(ciphertext):
+        calls.append(ciphertext)
+        return original(ciphertext)
+
+    monkeypatch.setattr(encryption_service, "decrypt", counting_decrypt)
+    return calls
+
+
+def _member(**fields):
+    member = Member()
+    for key, value in fields.items():
+        setattr(member, key, value)
+    return member
+
+
+def test_pii_is_stored_encrypted():
+    member = _member(email="jane@example.com", first_name="Jane")
+    assert member._email != "jane@example.com"
+    assert encryption_service.decrypt(member._email) == "jane@example.com"
+
+
+def test_repeated_access_decrypts_once(monkeypatch):
+    member = _member(first_name="Jane")
+    member._first_name = encryption_service.encrypt("Janet")
+    calls = _count_decrypts(monkeypatch)
+
+    assert member.first_name == "Janet"
+    assert member.first_name == "Janet"
+    assert len(calls) == 1
+
+
+def test_setter_primes_cache(monkeypatch):
+    member = Member()
+    member.email = "jane@example.com"
+    member.custom_fields = {"occupation": "Nurse"}
+    calls = _count_decrypts(monkeypatch)
+
+    assert member.email == "jane@example.com"
+    assert member.custom_fields == {"occupation": "Nurse"}
+    assert calls == []
+
+
+def test_cache_follows_ciphertext_changes():
+    member = _member(city="Oakland")
+    member._city = encryption_service.encrypt("Berkeley")
+    assert member.city == "Berkeley"
+
+
+def test_custom_fields_mutation_does_not_leak_into_cache():
+    member = _member(custom_fields={"occupation": "Nurse"})
+    member.custom_fields["occupation"] = "Doctor"
+    assert member.custom_fields == {"occupation": "Nurse"}
+
+
+def test_empty_values_round_trip():
+    member = _member(phone_number="", zip_code=None)
+    assert member.phone_number == ""
+    assert member.zip_code == ""
+
+
+def test_decrypt_fields_primes_cache_in_one_batch(monkeypatch):
+    member = _member(email="jane@example.com", city="Oakland", custom_fields={"a": 1})
+    member._email = encryption_service.encrypt("janet@example.com")
+    member._city = encryption_service.encrypt("Berkeley")
+    batches = []
+    original = encryption_service.decrypt_many
+    monkeypatch.setattr(
+        encryption_service, "decrypt_many",
+        lambda cs: batches.append(list(cs)) or original(batches[-1]),
+    )
+    calls = _count_decrypts(monkeypatch)
+
+    member.decrypt_fields()
+    assert len(batches) == 1 and len(batches[0]) == 2  # custom_fields already cached
+    assert member.email == "janet@example.com"
+    assert member.city == "Berkeley"
+    assert member.custom_fields == {"a": 1}
+    assert calls == []
+
+
+def test_decrypt_members_batches_across_members(monkeypatch):
+    members = [_member(first_name=f"Name{i}", city="Oakland") for i in range(3)]
+    for i, member in enumerate(members):
+        member._first_name = encryption_service.encrypt(f"Stored{i}")
+    batches = []
+    original = encryption_service.decrypt_many
+    monkeypatch.setattr(
+        encryption_service, "decrypt_many",
+        lambda cs: batches.append(list(cs)) or original(batches[-1]),
+    )
+    calls = _count_decrypts(monkeypatch)
+
+    decrypt_members(members, ("first_name", "city"))
+    assert len(batches) == 1 and len(batches[0]) == 3  # city already cached
+    assert [m.first_name for m in members] == ["Stored0", "Stored1", "Stored2"]
+    assert calls == []
+
+
+def test_search_text_maintained_on_flush(db):
+    member = _member(
+        first_name="Jane", last_name="Doe", city="Oakland", zip_code="94601",
+        street_address="1 Main St", phone_number="555", email="jane@example.com",
+    )
+    db.add(member)
+    db.commit()
+    assert member._search_text
+    assert "oakland" in encryption_service.decrypt(member._search_text)
+
+    member.custom_fields = {"occupation": "Nurse"}
+    db.commit()
+    assert "nurse" in member.search_text.split("\n")
+
+
+def test_build_search_text_decrypts_in_one_batch(monkeypatch):
+    member = _member(first_name="Jane", custom_fields={"occupation": "Nurse"})
+    member._first_name = encryption_service.encrypt("Janet")
+    member._custom_fields = encryption_service.encrypt('{"occupation": "Doctor"}')
+    batches = []
+    original = encryption_service.decrypt_many
+    monkeypatch.setattr(
+        encryption_service, "decrypt_many",
+        lambda cs: batches.append(list(cs)) or original(batches[-1]),
+    )
+    calls = _count_decrypts(monkeypatch)
+
+    assert build_search_text(member).split("\n") == ["janet", "", "", "", "", "doctor"]
+    assert len(batches) == 1 and len(batches[0]) == 2
+    assert not any(calls)  # only unset fields, which need no cipher
+
+
+def _tokens(db, member_id):
+    return {t for (t,) in db.query(MemberSearchToken.token).filter_by(member_id=member_id)}
+
+
+def test_search_tokens_follow_search_text(db):
+    member = _member(
+        first_name="Jane", last_name="Doe", city="Oakland", zip_code="94601",
+        street_address="1 Main St", phone_number="555", email="jane@example.com",
+    )
+    db.add(member)
+    db.commit()
+    assert _tokens(db, member.id) == generate_search_tokens(member.search_text)
+    assert generate_search_tokens("oak") <= _tokens(db, member.id)
+
+    member.city = "Berkeley"
+    db.commit()
+    assert _tokens(db, member.id) == generate_search_tokens(member.search_text)
+    assert not generate_search_tokens("oak") <= _tokens(db, member.id)
+
+    member_id = member.id
+    db.delete(member)
+    db.commit()
+    assert _tokens(db, member_id) == set()
+
@@ -1,8 +1,12 @@
 """Tests for the members router — CRUD, search, RBAC, and vetter isolation."""
 
-from tests.conftest import make_member, auth_header
-from app.models.member import MemberStatus
+import re
+from datetime import datetime
+
+from tests.conftest import make_member, auth_header, record_statements
+from app.models.member import Member, MemberStatus
 from app.models.audit_log import AuditLog
+from app.models.search_token import MemberSearchToken
 
 
 # ── List members ───────────────────────────────────────────────────────────
@@ -49,6 +53,99 @@ def test_list_members_filter_by_status(client, db, admin_token, vetter_user):
     assert resp.status_code == 200
     assert all(m["status"] == "PENDING" for m in resp.json())
 
+    # Same cached statement, different bound value
+    resp = client.get(
+        "/api/members?status_filter=ASSIGNED",
+        headers=auth_header(admin_token),
+    )
+    assert [m["status"] for m in resp.json()] == ["ASSIGNED"]
+
+
+def _walk_pages(client, token, url, limit, **query):
+    """Follow X-Next-Cursor through every page, returning ids per page."""
+    pages, cursor = [], None
+    while True:
+        params = {**query, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get(url, params=params, headers=auth_header(token))
+        assert resp.status_code == 200
+        pages.append([m["id"] for m in resp.json()])
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+
+
+def test_list_members_queries_avoid_sorting(db):
+    """The list orderings are read straight from an index, with no sort step."""
+    from sqlalchemy import select, text
+    from app.routers.members import LIST_VIEW_FIELDS, NEWEST_FIRST
+
+    listing = select(*LIST_VIEW_FIELDS).where(Member.archived == False).order_by(*NEWEST_FIRST)
+    queries = {
+        "ix_member_created": listing,
+        "ix_member_status_created": listing.where(Member.status == MemberStatus.PENDING),
+        "ix_member_vetter_status_created": listing.where(
+            Member.assigned_vetter_id == 1, Member.status == MemberStatus.ASSIGNED
+        ),
+    }
+    for index_name, stmt in queries.items():
+        compiled = stmt.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+        plan = " ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+        assert index_name in plan
+        assert "TEMP B-TREE" not in plan
+
+
+def test_list_members_decrypts_in_one_batch(client, db, admin_token, monkeypatch):
+    """List rows are decrypted together, never field by field."""
+    from app.services.encryption import encryption_service
+
+    for i in range(3):
+        make_member(db, first_name=f"Batch{i}", email=f"batch{i}@test.com")
+
+    batches = []
+    real_decrypt_many = encryption_service.decrypt_many
+
+    def counting_decrypt_many(ciphertexts):
+        result = real_decrypt_many(ciphertexts)
+        batches.append(len(result))
+        return result
+
+    monkeypatch.setattr(encryption_service, "decrypt_many", counting_decrypt_many)
+    def per_field_decrypt(ciphertext):
+        raise AssertionError("decrypted field by field")
+
+    monkeypatch.setattr(encryption_service, "decrypt", per_field_decrypt)
+
+    resp = client.get("/api/members", headers=auth_header(admin_token))
+    assert sorted(m["first_name"] for m in resp.json()) == ["Batch0", "Batch1", "Batch2"]
+    assert batches == [3 * 4]
+
+
+def test_list_members_keyset_pages(client, db, admin_token):
+    """Pages follow (created_at, id) newest first, ties included, no overlap."""
+    members = [make_member(db, first_name="Paged", email=f"page{i}@test.com") for i in range(5)]
+    db.execute(Member.__table__.update().values(created_at=datetime(2024, 1, 1)))
+    db.commit()
+    expected = [m.id for m in reversed(members)]
+
+    assert _walk_pages(client, admin_token, "/api/members", 2) == [
+        expected[0:2], expected[2:4], expected[4:5]
+    ]
+    # Same cached statement with a different page size
+    assert _walk_pages(client, admin_token, "/api/members", 3) == [expected[0:3], expected[3:5]]
+
+    # Without a limit every row comes back and no cursor is sent
+    resp = client.get("/api/members", headers=auth_header(admin_token))
+    assert len(resp.json()) == 5
+    assert "X-Next-Cursor" not in resp.headers
+
+
+def test_list_members_invalid_cursor(client, admin_token):
+    """A malformed cursor is a 400, not a server error."""
+    resp = client.get("/api/members?limit=2&cursor=garbage", headers=auth_header(admin_token))
+    assert resp.status_code == 400
+
 
 def test_list_members_unauthenticated(client):
     """Unauthenticated request is rejected."""
@@ -131,6 +228,64 @@ def test_update_status(client, db, admin_token, vetter_user):
     assert resp.json()["status"] == "VETTED"
 
 
+def test_update_status_returns_new_updated_at(client, db, admin_token, vetter_user):
+    """The response carries the onupdate timestamp without a refresh."""
+    m = make_member(
+        db, email="stamp@test.com",
+        status=MemberStatus.ASSIGNED,
+        assigned_vetter_id=vetter_user.id,
+    )
+    before = m.updated_at
+    resp = client.patch(
+        f"/api/members/{m.id}/status",
+        headers=auth_header(admin_token),
+        json={"status": "VETTED"},
+    )
+    assert resp.status_code == 200
+    db.refresh(m)
+    assert m.updated_at > before
+    assert datetime.fromisoformat(resp.json()["updated_at"]) == m.updated_at
+
+
+def test_member_writes_do_not_reload_the_member(client, db, admin_token):
+    """Status and note updates respond from the loaded object: the member
+    is selected once, and never again after the write."""
+    m = make_member(db, email="noreload@test.com")
+
+    for method, path, body in (
+        ("patch", f"/api/members/{m.id}/status", {"status": "VETTED"}),
+        ("post", f"/api/members/{m.id}/notes", {"note": "Checked in"}),
+    ):
+        with record_statements(db) as statements:
+            resp = getattr(client, method)(path, json=body, headers=auth_header(admin_token))
+        assert resp.status_code == 200
+        member_selects = [s for s in statements if s.startswith("SELECT") and "FROM members" in s]
+        assert len(member_selects) == 1
+        assert statements.index(member_selects[0]) < min(
+            i for i, s in enumerate(statements) if s.startswith("UPDATE members")
+        )
+
+
+def test_vetted_notification_sent_after_response(client, db, admin_token, vetter_user, monkeypatch):
+    """The status email is queued as a background task, not sent inline."""
+    from app.routers import members as members_router
+
+    sent = []
+    monkeypatch.setattr(members_router, "notify_status_change", lambda *args: sent.append(args))
+    m = make_member(
+        db, first_name="Nora", last_name="Notify", email="notify@test.com",
+        status=MemberStatus.ASSIGNED,
+        assigned_vetter_id=vetter_user.id,
+    )
+    resp = client.patch(
+        f"/api/members/{m.id}/status",
+        headers=auth_header(admin_token),
+        json={"status": "VETTED"},
+    )
+    assert resp.status_code == 200
+    assert sent == [(["Nora Notify"], MemberStatus.VETTED)]
+
+
 def test_vetter_can_update_own_member_status(client, db, vetter_user, vetter_token):
     """Vetter can change status of their assigned member."""
     m = make_member(
@@ -247,6 +402,25 @@ def test_append_multiple_notes(client, db, admin_token):
     assert "Second note" in notes
 
 
+def test_add_note_appends_to_stored_notes(client, db, admin_token):
+    """The append happens in SQL, and the response matches the stored row."""
+    m = make_member(db, email="sql-note@test.com")
+    m.notes = "Existing"
+    db.commit()
+
+    resp = client.post(
+        f"/api/members/{m.id}/notes",
+        headers=auth_header(admin_token),
+        json={"note": "Appended"},
+    )
+    assert resp.status_code == 200
+    db.refresh(m)
+    existing, entry = m.notes.split("\n\n")
+    assert existing == "Existing"
+    assert re.fullmatch(r"\[\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\+00:00\] admin: Appended", entry)
+    assert resp.json()["notes"] == m.notes
+
+
 # ── Search ─────────────────────────────────────────────────────────────────
 
 def test_search_by_first_name(client, db, admin_token):
@@ -291,6 +465,51 @@ def test_search_by_notes(client, db, admin_token):
     assert len(resp.json()) == 1
 
 
+def test_search_notes_treats_wildcards_literally(client, db, admin_token):
+    """A "%" in the query matches a literal percent sign, not anything."""
+    m = make_member(db, email="pct@test.com")
+    client.post(
+        f"/api/members/{m.id}/notes",
+        headers=auth_header(admin_token),
+        json={"note": "Pledged 100% support"},
+    )
+    make_member(db, email="other@test.com")
+
+    resp = client.get("/api/members/search/query?q=0%25", headers=auth_header(admin_token))
+    assert [r["id"] for r in resp.json()] == [m.id]
+    resp = client.get("/api/members/search/query?q=%25", headers=auth_header(admin_token))
+    assert [r["id"] for r in resp.json()] == [m.id]
+
+
+def test_search_results_newest_first(client, db, admin_token):
+    """Matches come back ordered by creation date, newest first."""
+    older = make_member(db, first_name="Ordered", email="older@test.com")
+    newer = make_member(db, first_name="Ordered", email="newer@test.com")
+    db.execute(
+        Member.__table__.update()
+        .where(Member.__table__.c.id == older.id)
+        .values(created_at=datetime(2020, 1, 1))
+    )
+    db.commit()
+
+    resp = client.get("/api/members/search/query?q=ordered", headers=auth_header(admin_token))
+    assert [r["id"] for r in resp.json()] == [newer.id, older.id]
+
+
+def test_search_keyset_pages(client, db, admin_token):
+    """Search pages match the unpaged result, split at the limit."""
+    for i in range(5):
+        make_member(db, first_name="Searchpaged", email=f"spage{i}@test.com")
+    make_member(db, first_name="Other", email="other@test.com")
+
+    resp = client.get("/api/members/search/query?q=searchpaged", headers=auth_header(admin_token))
+    expected = [r["id"] for r in resp.json()]
+    assert len(expected) == 5
+
+    pages = _walk_pages(client, admin_token, "/api/members/search/query", 2, q="searchpaged")
+    assert pages == [expected[0:2], expected[2:4], expected[4:5]]
+
+
 def test_search_no_results(client, db, admin_token):
     """Search with no matches returns empty list."""
     make_member(db, email="noresult@test.com")
@@ -303,6 +522,71 @@ def test_search_no_results(client, db, admin_token):
     assert len(resp.json()) == 0
 
 
+def test_search_by_updated_custom_field(client, db, admin_token):
+    """Search sees custom field edits (search text is rebuilt on write)."""
+    m = make_member(db, email="custom@test.com")
+    resp = client.patch(
+        f"/api/members/{m.id}/custom-fields",
+        headers=auth_header(admin_token),
+        json={"custom_fields": {"occupation": "Beekeeper"}},
+    )
+    assert resp.status_code == 200
+
+    resp = client.get(
+        "/api/members/search/query?q=beekeep",
+        headers=auth_header(admin_token),
+    )
+    assert [r["id"] for r in resp.json()] == [m.id]
+
+
+def test_search_finds_member_without_search_text(client, db, admin_token):
+    """Rows predating the search_text column are still searchable."""
+    m = make_member(db, last_name="Legacyson", email="legacy@test.com")
+    db.execute(Member.__table__.update().values(search_text=None))
+    db.commit()
+
+    resp = client.get(
+        "/api/members/search/query?q=legacyson",
+        headers=auth_header(admin_token),
+    )
+    assert [r["id"] for r in resp.json()] == [m.id]
+
+
+def test_search_without_search_text_matches_custom_fields(client, db, admin_token):
+    """The fallback path builds the full search text, custom fields included."""
+    m = make_member(db, email="legacycf@test.com")
+    m.custom_fields = {"employer": "Legacycorp"}
+    db.commit()
+    db.execute(Member.__table__.update().values(search_text=None))
+    db.commit()
+
+    resp = client.get("/api/members/search/query?q=legacycorp", headers=auth_header(admin_token))
+    assert [r["id"] for r in resp.json()] == [m.id]
+
+
+def test_search_finds_member_without_search_tokens(client, db, admin_token):
+    """Rows predating the search token table are still searchable."""
+    m = make_member(db, last_name="Untokened", email="untokened@test.com")
+    db.query(MemberSearchToken).delete()
+    db.commit()
+
+    resp = client.get(
+        "/api/members/search/query?q=untoken",
+        headers=auth_header(admin_token),
+    )
+    assert [r["id"] for r in resp.json()] == [m.id]
+
+
+def test_search_confirms_token_candidates(client, db, admin_token):
+    """Holding all of a query's tokens is not enough; the text must match."""
+    make_member(db, first_name="Abcaxcab", email="tokens@test.com")
+    resp = client.get(
+        "/api/members/search/query?q=abcab",
+        headers=auth_header(admin_token),
+    )
+    assert resp.json() == []
+
+
 def test_search_respects_vetter_isolation(client, db, vetter_user, vetter_user2, vetter_token):
     """Vetter search only returns their own assigned members."""
     make_member(
@@ -336,6 +620,11 @@ def test_next_candidate_assigns_pending(client, db, vetter_user, vetter_token):
     assert data["id"] == m.id
     assert data["status"] == "ASSIGNED"
 
+    # The response comes from the UPDATE's RETURNING row, new timestamp included
+    db.refresh(m)
+    assert data["first_name"] == m.first_name
+    assert datetime.fromisoformat(data["updated_at"]) == m.updated_at
+
 
 def test_next_candidate_returns_null_when_none(client, vetter_token):
     """Next-candidate returns null when no pending members exist."""
@@ -364,6 +653,21 @@ def test_delete_member(client, db, admin_token):
     assert resp.status_code == 404
 
 
+def test_delete_member_cascades_audit_history(client, db, admin_token):
+    """The member's audit entries go with it; the deletion record stays."""
+    from app.models.audit_log import AuditLog
+
+    m = make_member(db, email="cascade@test.com")
+    client.get(f"/api/members/{m.id}", headers=auth_header(admin_token))
+    assert db.query(AuditLog).filter(AuditLog.member_id == m.id).count() == 1
+
+    resp = client.delete(f"/api/members/{m.id}", headers=auth_header(admin_token))
+    assert resp.status_code == 204
+
+    assert db.query(AuditLog).filter(AuditLog.member_id == m.id).count() == 0
+    assert db.query(AuditLog).filter(AuditLog.action == "MEMBER_DELETED").count() == 1
+
+
 def test_delete_member_as_vetter_forbidden(client, db, vetter_user, vetter_token):
     """Vetters cannot delete members."""
     m = make_member(
@@ -379,3 +683,18 @@ def test_delete_nonexistent_member(client, admin_token):
     """Deleting nonexistent member returns 404."""
     resp = client.delete("/api/members/9999", headers=auth_header(admin_token))
     assert resp.status_code == 404
+
+
+# ── Routing ───────────────────────────────────────────────────────────────
+
+def test_member_routes_registered_once():
+    """Each members endpoint is served by exactly one handler."""
+    from app.main import app
+
+    seen = [
+        (route.path, method)
+        for route in app.routes
+        if route.path.startswith("/api/members")
+        for method in getattr(route, "methods", ())
+    ]
+    assert seen and len(seen) == len(set(seen))
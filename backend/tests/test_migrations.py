@@ -0,0 +1,129 @@
+"""Tests for startup migrations and data backfills."""
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.main import run_migrations
+from app.models.member import Member
+from app.models.search_token import MemberSearchToken
+from app.services.blind_index import generate_search_tokens
+from app.services.encryption import encryption_service
+from app.config import settings
+from app.utils import db_init
+from app.utils.db_init import backfill_search_text, backfill_search_tokens, create_first_admin
+from tests.conftest import make_member
+
+
+def _legacy_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE members (id INTEGER PRIMARY KEY, status VARCHAR, "
+            "assigned_vetter_id INTEGER, created_at DATETIME, updated_at DATETIME)"
+        ))
+        conn.execute(text(
+            "CREATE INDEX ix_member_vetter_status ON members (assigned_vetter_id, status)"
+        ))
+        conn.execute(text(
+            "INSERT INTO members (status, updated_at) VALUES "
+            "('ARCHIVED', '2026-01-01'), ('UNSURE', '2026-01-01'), ('VETTED', '2026-01-01')"
+        ))
+    return engine
+
+
+def _migrate(engine):
+    with engine.begin() as conn:
+        run_migrations(conn)
+
+
+def test_migrations_upgrade_legacy_schema(tmp_path):
+    engine = _legacy_engine(tmp_path)
+    _migrate(engine)
+
+    inspector = inspect(engine)
+    columns = {col["name"] for col in inspector.get_columns("members")}
+    assert {
+        "tags", "archived", "vetted_at", "resting_since",
+        "one_month_followup_sent", "search_text",
+    } <= columns
+    indexes = {ix["name"] for ix in inspector.get_indexes("members")}
+    assert {
+        "ix_member_vetter_status_created", "ix_member_status_created",
+        "ix_member_status_updated", "ix_member_created",
+    } <= indexes
+    assert "ix_member_vetter_status" not in indexes
+
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT status, archived FROM members ORDER BY id")).all()
+    assert [tuple(r) for r in rows] == [("IN_SIGNAL", 1), ("NEEDS_FOLLOW_UP", 0), ("VETTED", 0)]
+
+
+def test_username_lookup_uses_expression_index(tmp_path):
+    """Legacy users tables gain the lower(username) index, and the
+    case-insensitive login lookup searches it instead of scanning."""
+    engine = _legacy_engine(tmp_path)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, username VARCHAR UNIQUE)"))
+    _migrate(engine)
+
+    with engine.connect() as conn:
+        plan = " ".join(row[-1] for row in conn.execute(text(
+            "EXPLAIN QUERY PLAN SELECT id FROM users WHERE lower(username) = 'admin'"
+        )))
+    assert "ix_users_username_lower" in plan
+
+
+def test_migrations_are_idempotent(tmp_path):
+    engine = _legacy_engine(tmp_path)
+    _migrate(engine)
+    _migrate(engine)
+
+
+def test_create_first_admin_skips_hashing_when_admin_exists(db, admin_user, monkeypatch, capsys):
+    monkeypatch.setattr(settings, "FIRST_RUN_ADMIN_USER", "admin")
+    monkeypatch.setattr(settings, "FIRST_RUN_ADMIN_PASSWORD", "first-run-password")
+
+    def no_hash(password):
+        raise AssertionError("hashed a password for an existing admin")
+
+    monkeypatch.setattr(db_init, "hash_password", no_hash)
+    create_first_admin(db)
+    assert "remove it" in capsys.readouterr().out
+
+
+def test_backfill_search_text(db):
+    member = make_member(db, first_name="Backfilled", email="backfill@example.com")
+    db.execute(Member.__table__.update().values(search_text=None))
+    db.commit()
+
+    backfill_search_text(db)
+    db.refresh(member)
+    assert "backfilled" in encryption_service.decrypt(member._search_text)
+
+
+def test_backfill_search_tokens(db):
+    member = make_member(db, first_name="Tokenless", email="tokens@example.com")
+    db.query(MemberSearchToken).delete()
+    db.commit()
+
+    backfill_search_tokens(db)
+    tokens = {t for (t,) in db.query(MemberSearchToken.token).filter_by(member_id=member.id)}
+    assert tokens == generate_search_tokens(member.search_text)
+
+    backfill_search_tokens(db)  # members that already have tokens are skipped
+    assert db.query(MemberSearchToken).filter_by(member_id=member.id).count() == len(tokens)
+
+
+def test_audit_cascade_trigger_added_to_existing_database(tmp_path):
+    engine = _legacy_engine(tmp_path)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE audit_logs (id INTEGER PRIMARY KEY, member_id INTEGER, action VARCHAR)"
+        ))
+        conn.execute(text("INSERT INTO audit_logs (member_id, action) VALUES (1, 'VIEWED_PII'), (2, 'VIEWED_PII')"))
+    _migrate(engine)
+    _migrate(engine)  # idempotent
+
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM members WHERE id = 1"))
+        remaining = conn.execute(text("SELECT member_id FROM audit_logs")).scalars().all()
+    assert remaining == [2]
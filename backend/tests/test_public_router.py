@@ -1,6 +1,7 @@
 """Tests for the public router — application submission and form config."""
 
 from app.models.member import Member
+from tests.conftest import record_statements
 
 
 # ── Form config ────────────────────────────────────────────────────────────
@@ -43,6 +44,23 @@ def test_submit_valid_application(client, db):
     assert member.email == "alice@wonderland.com"
 
 
+def test_submit_does_not_reload_the_new_member(client, db):
+    """The id comes from the INSERT; the member row is never selected."""
+    payload = {
+        "first_name": "Fresh",
+        "last_name": "Insert",
+        "street_address": "1 Main",
+        "city": "Town",
+        "zip_code": "11111",
+        "phone_number": "555-0000",
+        "email": "fresh@test.com",
+    }
+    with record_statements(db) as statements:
+        resp = client.post("/api/public/apply", json=payload)
+    assert resp.status_code == 201
+    assert not any(s.startswith("SELECT members.") for s in statements)
+
+
 def test_submit_with_custom_fields(client, db):
     """Application with custom fields stores them encrypted."""
     resp = client.post("/api/public/apply", json={
@@ -73,6 +91,26 @@ def test_submit_missing_required_field(client):
     assert resp.status_code == 400
 
 
+def test_field_rules_follow_config_reloads(client, monkeypatch):
+    """Validation rules are rebuilt when the form config is reloaded."""
+    from app.routers import public
+
+    config = {"fields": [{"key": "bio", "label": "Bio", "validation": {"maxLength": 5}}]}
+    monkeypatch.setattr(public, "load_form_config", lambda: config)
+    application = {
+        "first_name": "Len", "last_name": "Limit", "street_address": "1 St",
+        "city": "Town", "zip_code": "00001", "phone_number": "555-0101",
+        "email": "len@example.com", "bio": "too long",
+    }
+    resp = client.post("/api/public/apply", json=application)
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Bio exceeds maximum length of 5"
+
+    config = {"fields": [{"key": "bio", "label": "Bio", "required": True}]}
+    resp = client.post("/api/public/apply", json={**application, "bio": ""})
+    assert resp.json()["detail"] == "Bio is required"
+
+
 def test_submit_duplicate_email(client, db):
     """Duplicate email (via blind index) returns 409."""
     payload = {
@@ -92,6 +130,28 @@ def test_submit_duplicate_email(client, db):
     assert "already exists" in resp2.json()["detail"].lower()
 
 
+def test_concurrent_duplicate_email_returns_409(client, db, monkeypatch):
+    """A duplicate that slips past the pre-check is caught after the insert."""
+    from app.routers import public
+
+    payload = {
+        "first_name": "Race",
+        "last_name": "Test",
+        "street_address": "1 Main",
+        "city": "Town",
+        "zip_code": "11111",
+        "phone_number": "555-0000",
+        "email": "race@test.com",
+    }
+    assert client.post("/api/public/apply", json=payload).status_code == 201
+
+    # Simulate the other request committing between our check and insert
+    monkeypatch.setattr(public, "generate_blind_index", lambda email: "not-yet-inserted")
+    resp = client.post("/api/public/apply", json=payload)
+    assert resp.status_code == 409
+    assert db.query(Member).count() == 1
+
+
 def test_submit_duplicate_email_case_insensitive(client, db):
     """Duplicate detection is case-insensitive."""
     base = {
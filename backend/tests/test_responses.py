@@ -0,0 +1,25 @@
+"""Tests for the pre-encoded list response helper."""
+
+import json
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models.user import UserRole
+from app.schemas.user import UserResponse
+from app.utils.responses import list_response
+
+
+def test_list_response_matches_fastapi_encoding():
+    """Bytes match what the response_model path would have produced."""
+    now = datetime(2024, 5, 1, 12, 30, 0, 123456)
+    rows = [{
+        "id": 1, "username": "admin", "role": UserRole.SUPER_ADMIN,
+        "full_name": "Admin", "is_active": True, "created_at": now, "updated_at": now,
+    }]
+    response = list_response(UserResponse, rows, {"X-Next-Cursor": "abc"})
+
+    expected = jsonable_encoder([UserResponse(**row) for row in rows])
+    assert json.loads(response.body) == expected
+    assert response.media_type == "application/json"
+    assert response.headers["X-Next-Cursor"] == "abc"
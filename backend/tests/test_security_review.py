@@ -27,9 +27,9 @@ from app.models.audit_log import AuditLog
 from app.models.member import Member
 from app.routers.members import escape_csv_formula
 from app.services.rate_limit import FailedAttemptLimiter
-from app.vault import VaultManager
+from app.vault import VaultManager, vault_verifier
 
-from tests.conftest import auth_header, make_member
+from tests.conftest import auth_header, make_member, record_statements
 
 
 # ---------------------------------------------------------------------------
@@ -71,10 +71,123 @@ class TestTagUsageEndpoint:
         assert body["usage"][option] == 1
         assert body["total_members_using"] == 1
 
+    def test_usage_counts_list_values_and_ignores_other_categories(self, client, db, admin_token):
+        config_resp = client.get("/api/tags", headers=auth_header(admin_token))
+        category = config_resp.json()["categories"][0]
+        key, options = category["key"], category["options"]
+
+        listed = make_member(db, email="listed@example.com")
+        listed.tags = {key: options[:2]}
+        other = make_member(db, email="other@example.com")
+        other.tags = {"unrelated": key}
+        db.commit()
+
+        resp = client.get(f"/api/tags/categories/{key}/usage", headers=auth_header(admin_token))
+        body = resp.json()
+        assert [body["usage"][o] for o in options[:2]] == [1] * len(options[:2])
+        assert body["total_members_using"] == len(options[:2])
+
+    def test_usage_matches_per_member_count(self, client, db, admin_token):
+        """List-valued, scalar and null tags count as a per-member Python
+        loop over the parsed tags would."""
+        category = client.get("/api/tags", headers=auth_header(admin_token)).json()["categories"][0]
+        key, options = category["key"], category["options"]
+        all_tags = [
+            {key: options[:2]},
+            {key: options[0]},
+            {key: None},
+            {key: []},
+            {key: [options[1], "custom"]},
+            {key: 3},
+            {"unrelated": options[0]},
+        ]
+        for i, tags in enumerate(all_tags):
+            member = make_member(db, email=f"usage{i}@example.com")
+            member.tags = tags
+        db.commit()
+
+        expected = {option: 0 for option in options}
+        for tags in all_tags:
+            value = tags.get(key)
+            if value is None:
+                continue
+            for v in value if isinstance(value, list) else (value,):
+                expected[str(v)] = expected.get(str(v), 0) + 1
+
+        resp = client.get(f"/api/tags/categories/{key}/usage", headers=auth_header(admin_token))
+        body = resp.json()
+        assert body["usage"] == expected
+        assert body["total_members_using"] == sum(expected.values())
+
+    def test_usage_skips_non_option_values(self, client, db, admin_token):
+        """Null list elements, booleans and nested objects are not options."""
+        category = client.get("/api/tags", headers=auth_header(admin_token)).json()["categories"][0]
+        key, option = category["key"], category["options"][0]
+        member = make_member(db, email="odd@example.com")
+        member.tags = {key: [option, None, True, {"nested": option}]}
+        db.commit()
+
+        resp = client.get(f"/api/tags/categories/{key}/usage", headers=auth_header(admin_token))
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["usage"][option] == 1
+        assert body["total_members_using"] == 1
+
     def test_usage_unknown_category_404(self, client, admin_token):
         resp = client.get("/api/tags/categories/nope/usage", headers=auth_header(admin_token))
         assert resp.status_code == 404
 
+    def test_category_edits_follow_reloaded_index(self, client, admin_token, tmp_path, monkeypatch):
+        from app.routers import tags
+
+        path = tmp_path / "tag_config.json"
+        path.write_text(json.dumps({"categories": [
+            {"key": "first", "label": "First", "options": ["a"], "multiple": False},
+            {"key": "second", "label": "Second", "options": ["b"], "multiple": False},
+        ]}))
+        monkeypatch.setattr(tags, "TAG_CONFIG_PATH", str(path))
+        headers = auth_header(admin_token)
+
+        new = {"key": "third", "label": "Third", "options": ["c"], "multiple": True}
+        assert client.post("/api/tags/categories", json=new, headers=headers).status_code == 201
+        assert client.post("/api/tags/categories", json=new, headers=headers).status_code == 409
+
+        resp = client.put("/api/tags/categories/third", json={"label": "Renamed"}, headers=headers)
+        assert resp.json()["label"] == "Renamed"
+
+        assert client.delete("/api/tags/categories/first", headers=headers).status_code == 200
+        assert client.delete("/api/tags/categories/first", headers=headers).status_code == 404
+
+        # Positions shifted after the delete; the index was rebuilt
+        resp = client.put("/api/tags/categories/second", json={"multiple": True}, headers=headers)
+        assert resp.json() == {"key": "second", "label": "Second", "options": ["b"], "multiple": True}
+        saved = json.loads(path.read_text())["categories"]
+        assert [c["key"] for c in saved] == ["second", "third"]
+        assert client.put("/api/tags/categories/first", json={}, headers=headers).status_code == 404
+
+    def test_concurrent_category_edits_are_not_lost(self, tmp_path, monkeypatch):
+        import threading
+        import time
+        from app.routers import tags
+
+        path = tmp_path / "tag_config.json"
+        path.write_text(json.dumps({"categories": []}))
+        monkeypatch.setattr(tags, "TAG_CONFIG_PATH", str(path))
+
+        def add(key):
+            with tags.editing_tag_config() as config:
+                config["categories"].append({"key": key})
+                time.sleep(0.05)  # widen the read-modify-write window
+
+        threads = [threading.Thread(target=add, args=(f"k{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        saved = json.loads(path.read_text())["categories"]
+        assert sorted(c["key"] for c in saved) == ["k0", "k1", "k2", "k3"]
+
 
 # ---------------------------------------------------------------------------
 # Audit trail survives member deletion
@@ -120,6 +233,34 @@ class TestCsvExport:
         assert resp.status_code == 200
         assert "'=2+5" in resp.text
 
+    def test_export_sorts_plaintext_fields_in_sql(self, client, db, admin_token):
+        from datetime import datetime
+        older = make_member(db, first_name="Older", email="older@example.com")
+        make_member(db, first_name="Newer", email="newer@example.com")
+        db.execute(
+            Member.__table__.update()
+            .where(Member.__table__.c.id == older.id)
+            .values(created_at=datetime(2020, 1, 1))
+        )
+        db.commit()
+
+        with record_statements(db) as statements:
+            resp = client.get(
+                "/api/members/export?fields=first_name&sort_by=created_at&sort_order=asc",
+                headers=auth_header(admin_token),
+            )
+        assert resp.text.split()[2:] == ["Older", "Newer"]
+        assert any("ORDER BY members.created_at ASC" in s for s in statements)
+
+    def test_export_sorts_encrypted_fields_in_python(self, client, db, admin_token):
+        for name in ("bravo", "Alpha", "charlie"):
+            make_member(db, last_name=name, email=f"{name}@example.com")
+        resp = client.get(
+            "/api/members/export?fields=last_name&sort_by=last_name&sort_order=asc",
+            headers=auth_header(admin_token),
+        )
+        assert resp.text.split()[2:] == ["Alpha", "bravo", "charlie"]
+
     def test_export_rejects_invalid_sort_field(self, client, admin_token, pending_member):
         resp = client.get(
             "/api/members/export?fields=first_name&sort_by=hashed_password",
@@ -271,22 +412,26 @@ class TestPublicApplicationLimits:
 # Vault error handling
 # ---------------------------------------------------------------------------
 
-def _write_vault(path, password, payload_bytes):
-    """Create a vault file the way vault.py does."""
+def _write_vault(path, password, payload_bytes, verifier=True):
+    """Create a vault file the way vault.py does (verifier=False writes
+    the older format without a password verifier)."""
     from cryptography.fernet import Fernet
     from cryptography.hazmat.primitives import hashes
     from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
     salt = os.urandom(16)
     kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=1000)
-    key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-    data = Fernet(key).encrypt(payload_bytes).decode()
+    derived = kdf.derive(password.encode())
+    data = Fernet(base64.urlsafe_b64encode(derived)).encrypt(payload_bytes).decode()
+    vault_data = {
+        "salt": base64.b64encode(salt).decode(),
+        "iterations": 1000,
+        "data": data,
+    }
+    if verifier:
+        vault_data["verifier"] = vault_verifier(derived)
     with open(path, "w") as f:
-        json.dump({
-            "salt": base64.b64encode(salt).decode(),
-            "iterations": 1000,
-            "data": data,
-        }, f)
+        json.dump(vault_data, f)
 
 
 class TestVaultErrorHandling:
@@ -307,6 +452,45 @@ class TestVaultErrorHandling:
         manager = VaultManager()
         assert manager.unlock("correct-horse") is True
         assert manager.secrets == {"SECRET_KEY": "s"}
+        with pytest.raises(TypeError):
+            manager.secrets["SECRET_KEY"] = "changed"
+
+    def test_wrong_password_rejected_by_verifier_before_decrypt(self, vault_path, monkeypatch):
+        import app.vault
+
+        _write_vault(vault_path, "correct-horse", json.dumps({"SECRET_KEY": "s"}).encode())
+
+        def no_decrypt(key):
+            raise AssertionError("Fernet should not be built for a wrong password")
+
+        monkeypatch.setattr(app.vault, "Fernet", no_decrypt)
+        assert VaultManager().unlock("wrong-password") is False
+
+    def test_vault_without_verifier_still_unlocks(self, vault_path):
+        _write_vault(vault_path, "correct-horse", json.dumps({"SECRET_KEY": "s"}).encode(), verifier=False)
+        assert VaultManager().unlock("wrong-password") is False
+        manager = VaultManager()
+        assert manager.unlock("correct-horse") is True
+        assert manager.secrets == {"SECRET_KEY": "s"}
+
+    def test_argon2id_vault_unlocks(self, vault_path):
+        from cryptography.fernet import Fernet
+        from app.vault import derive_vault_key
+
+        vault_data = {
+            "kdf": "argon2id", "iterations": 1, "memory_cost": 8 * 1024, "lanes": 1,
+            "salt": base64.b64encode(os.urandom(16)).decode(),
+        }
+        derived = derive_vault_key("correct-horse", vault_data)
+        vault_data["verifier"] = vault_verifier(derived)
+        vault_data["data"] = Fernet(base64.urlsafe_b64encode(derived)).encrypt(b'{"SECRET_KEY": "s"}').decode()
+        with open(vault_path, "w") as f:
+            json.dump(vault_data, f)
+
+        assert VaultManager().unlock("wrong-password") is False
+        manager = VaultManager()
+        assert manager.unlock("correct-horse") is True
+        assert manager.secrets == {"SECRET_KEY": "s"}
 
     def test_corrupt_payload_raises_instead_of_wrong_password(self, vault_path):
         _write_vault(vault_path, "correct-horse", b"this is not json")
@@ -337,3 +521,17 @@ class TestSearchResilience:
         ids = [m["id"] for m in resp.json()]
         assert good.id in ids
         assert bad.id not in ids
+
+    def test_search_skips_undecryptable_search_text(self, client, db, admin_token):
+        good = make_member(db, first_name="Findme", email="good@example.com")
+        bad = make_member(db, first_name="Findme", email="bad@example.com")
+        db.execute(
+            Member.__table__.update()
+            .where(Member.__table__.c.id == bad.id)
+            .values(search_text="not-valid-ciphertext")
+        )
+        db.commit()
+
+        resp = client.get("/api/members/search/query?q=findme", headers=auth_header(admin_token))
+        assert resp.status_code == 200
+        assert [m["id"] for m in resp.json()] == [good.id]
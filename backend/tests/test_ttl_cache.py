@@ -0,0 +1,76 @@
+"""Tests for the TTL cache and the verified-token cache built on it."""
+
+from app.dependencies import _authenticate_token, _token_cache, _token_key, invalidate_token
+from app.services.auth import create_access_token
+from app.services.ttl_cache import TTLCache
+
+from tests.conftest import auth_header
+
+
+def test_get_returns_cached_value():
+    cache = TTLCache(maxsize=10, ttl_seconds=30)
+    cache.set("k", 42)
+    assert cache.get("k") == 42
+    assert cache.get("missing") is None
+
+
+def test_entries_expire(monkeypatch):
+    cache = TTLCache(maxsize=10, ttl_seconds=30)
+    now = [1000.0]
+    monkeypatch.setattr("app.services.ttl_cache.time.monotonic", lambda: now[0])
+
+    cache.set("k", "v")
+    now[0] += 31
+    assert cache.get("k") is None
+
+
+def test_per_entry_ttl_cannot_extend_default(monkeypatch):
+    cache = TTLCache(maxsize=10, ttl_seconds=30)
+    now = [1000.0]
+    monkeypatch.setattr("app.services.ttl_cache.time.monotonic", lambda: now[0])
+
+    cache.set("short", "v", ttl_seconds=5)
+    cache.set("long", "v", ttl_seconds=3600)
+    now[0] += 6
+    assert cache.get("short") is None
+    assert cache.get("long") == "v"
+    now[0] += 25
+    assert cache.get("long") is None
+
+
+def test_non_positive_ttl_is_not_cached():
+    cache = TTLCache(maxsize=10, ttl_seconds=30)
+    cache.set("k", "v", ttl_seconds=0)
+    assert cache.get("k") is None
+
+
+def test_evicts_oldest_when_full():
+    cache = TTLCache(maxsize=2, ttl_seconds=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+
+
+def test_verified_token_is_cached_by_digest():
+    token = create_access_token(data={"sub": "7"})
+    assert _authenticate_token(token) == 7
+    # Raw tokens are never used as keys
+    assert _token_cache.get(token) is None
+    assert _token_cache.get(_token_key(token)) == 7
+
+    invalidate_token(token)
+    assert _token_cache.get(_token_key(token)) is None
+
+
+def test_cached_token_rejected_after_user_deactivated(client, db, admin_user, admin_token):
+    resp = client.get("/api/users", headers=auth_header(admin_token))
+    assert resp.status_code == 200
+
+    admin_user.is_active = False
+    db.commit()
+
+    resp = client.get("/api/users", headers=auth_header(admin_token))
+    assert resp.status_code == 401
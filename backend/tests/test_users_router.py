@@ -1,6 +1,6 @@
 """Tests for the users router — CRUD and RBAC."""
 
-from tests.conftest import auth_header
+from tests.conftest import auth_header, record_statements
 
 
 # ── List users ─────────────────────────────────────────────────────────────
@@ -14,6 +14,18 @@ def test_list_users_as_admin(client, admin_token, admin_user):
     assert any(u["username"] == "admin" for u in users)
 
 
+def test_list_users_single_query_in_id_order(client, admin_token, admin_user, vetter_user, vetter_user2, db):
+    """The list is one SELECT on users, ordered by id."""
+    with record_statements(db) as statements:
+        resp = client.get("/api/users", headers=auth_header(admin_token))
+    assert resp.status_code == 200
+    ids = [u["id"] for u in resp.json()]
+    assert ids == sorted(ids) and len(ids) == 3
+    user_selects = [s for s in statements if s.lstrip().startswith("SELECT") and "FROM users" in s]
+    # one for the authenticated user, one for the list
+    assert len(user_selects) == 2
+
+
 def test_list_users_as_vetter_forbidden(client, vetter_token):
     """Vetters cannot list users."""
     resp = client.get("/api/users", headers=auth_header(vetter_token))
@@ -43,6 +55,22 @@ def test_create_user(client, admin_token):
     assert data["is_active"] is True
 
 
+def test_create_user_does_not_reload_row(client, admin_token, db):
+    """The new user is returned from the INSERT; nothing re-reads it."""
+    with record_statements(db) as statements:
+        resp = client.post("/api/users", headers=auth_header(admin_token), json={
+            "username": "newvetter",
+            "password": "password123",
+            "role": "VETTER",
+            "full_name": "New Vetter",
+        })
+    assert resp.status_code == 201
+    assert resp.json()["id"] is not None
+    user_statements = [s.split()[0] for s in statements if "users" in s]
+    # auth lookup, username check, INSERT
+    assert user_statements == ["SELECT", "SELECT", "INSERT"]
+
+
 def test_create_duplicate_username(client, admin_token, admin_user):
     """Duplicate username returns 409."""
     resp = client.post("/api/users", headers=auth_header(admin_token), json={
@@ -74,6 +102,16 @@ def test_get_user(client, admin_token, admin_user):
     assert resp.json()["username"] == "admin"
 
 
+def test_get_self_uses_identity_map(client, admin_token, admin_user, db):
+    """Fetching the authenticated user reuses the row already loaded for
+    auth instead of selecting it again."""
+    with record_statements(db) as statements:
+        resp = client.get(f"/api/users/{admin_user.id}", headers=auth_header(admin_token))
+    assert resp.status_code == 200
+    assert resp.json()["username"] == "admin"
+    assert len([s for s in statements if "FROM users" in s]) == 1
+
+
 def test_get_user_not_found(client, admin_token):
     """Nonexistent user ID returns 404."""
     resp = client.get("/api/users/9999", headers=auth_header(admin_token))
@@ -93,6 +131,23 @@ def test_update_user_role(client, admin_token, vetter_user):
     assert resp.json()["role"] == "SUPER_ADMIN"
 
 
+def test_update_user_single_statement(client, admin_token, vetter_user, db):
+    """A PATCH is one UPDATE ... RETURNING; the target row is not SELECTed."""
+    with record_statements(db) as statements:
+        resp = client.patch(
+            f"/api/users/{vetter_user.id}",
+            headers=auth_header(admin_token),
+            json={"full_name": "Renamed Vetter"},
+        )
+    assert resp.status_code == 200
+    assert resp.json()["full_name"] == "Renamed Vetter"
+    assert resp.json()["updated_at"] > resp.json()["created_at"]
+    user_statements = [s for s in statements if "users" in s]
+    assert len(user_statements) == 2  # auth SELECT + UPDATE ... RETURNING
+    assert user_statements[1].lstrip().startswith("UPDATE")
+    assert "RETURNING" in user_statements[1]
+
+
 def test_update_user_deactivate(client, admin_token, vetter_user):
     """Admin can deactivate a user."""
     resp = client.patch(
@@ -2,8 +2,9 @@
 """
 Vault management tool for Signup Manager.
 
-Encrypts secrets with a master password using PBKDF2 key derivation + Fernet
-encryption, so secrets never exist in plaintext on disk.
+Encrypts secrets with a master password using Argon2id key derivation + Fernet
+encryption, so secrets never exist in plaintext on disk. Vaults created
+before Argon2id (PBKDF2-SHA256) can still be shown and unlocked.
 
 Usage:
     python vault.py create                     # Generate keys, encrypt with master password
@@ -14,6 +15,8 @@ Usage:
 import argparse
 import base64
 import getpass
+import hashlib
+import hmac
 import json
 import os
 import secrets
@@ -21,20 +24,41 @@ import sys
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.argon2 import Argon2id
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
-VAULT_ITERATIONS = 600_000  # OWASP recommended minimum for PBKDF2-SHA256
+# Argon2id parameters (~0.25s per unlock); recorded in each vault file
+VAULT_KDF = {"kdf": "argon2id", "iterations": 3, "memory_cost": 64 * 1024, "lanes": 1}
+PBKDF2_ITERATIONS = 600_000  # vaults without a "kdf" field
+VERIFIER_CONTEXT = b"vault-v1"  # must match backend/app/vault.py
+
+
+def derive_key(password: str, salt: bytes, params: dict) -> bytes:
+    """Derive a Fernet key from a master password with the vault's KDF
+    (Argon2id, or PBKDF2-HMAC-SHA256 for older vaults)."""
+    if params.get("kdf") == "argon2id":
+        kdf = Argon2id(
+            salt=salt,
+            length=32,
+            iterations=params["iterations"],
+            lanes=params["lanes"],
+            memory_cost=params["memory_cost"],
+        )
+    else:
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=params.get("iterations", PBKDF2_ITERATIONS),
+        )
+    return base64.urlsafe_b64encode(kdf.derive(password.encode()))
 
 
-def derive_key(password: str, salt: bytes) -> bytes:
-    """Derive a Fernet key from a master password using PBKDF2-HMAC-SHA256."""
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=VAULT_ITERATIONS,
-    )
-    return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+def vault_verifier(key: bytes) -> str:
+    """Password verifier stored beside the data: HMAC of a fixed message
+    under the raw derived key, checked on unlock before decrypting."""
+    raw_key = base64.urlsafe_b64decode(key)
+    return hmac.new(raw_key, VERIFIER_CONTEXT, hashlib.sha256).hexdigest()
 
 
 def create_vault(vault_path: str):
@@ -85,14 +109,15 @@ def create_vault(vault_path: str):
 
     # Encrypt with master password
     salt = os.urandom(32)
-    key = derive_key(password, salt)
+    key = derive_key(password, salt, VAULT_KDF)
     fernet = Fernet(key)
     encrypted = fernet.encrypt(json.dumps(vault_secrets).encode())
 
     vault_data = {
         "version": 1,
         "salt": base64.b64encode(salt).decode(),
-        "iterations": VAULT_ITERATIONS,
+        **VAULT_KDF,
+        "verifier": vault_verifier(key),
         "data": encrypted.decode(),
     }
 
@@ -124,7 +149,7 @@ def show_vault(vault_path: str):
         vault_data = json.load(f)
 
     salt = base64.b64decode(vault_data["salt"])
-    key = derive_key(password, salt)
+    key = derive_key(password, salt, vault_data)
 
     try:
         fernet = Fernet(key)